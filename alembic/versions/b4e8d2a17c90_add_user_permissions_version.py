@@ -0,0 +1,34 @@
+"""add user permissions version
+
+Revision ID: b4e8d2a17c90
+Revises: 66f97410915e
+Create Date: 2025-04-22 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b4e8d2a17c90"
+down_revision: Union[str, None] = "66f97410915e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing users start at version 0, like new ones
+    op.add_column(
+        "user",
+        sa.Column(
+            "permissions_version", sa.Integer(), server_default="0", nullable=False
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("user", "permissions_version")
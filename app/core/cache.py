@@ -0,0 +1,144 @@
+"""
+Cache Module
+
+This module provides a small in-process TTL + LRU cache used for hot,
+per-worker lookups such as authenticated principals.
+"""
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Bounded mapping whose entries expire after a time-to-live.
+
+    The least recently used entry is evicted once ``maxsize`` is reached.
+    Expired entries are dropped lazily on access.
+
+    Attributes:
+        maxsize: Maximum number of entries
+        ttl: Default time-to-live in seconds
+        hits: Number of successful lookups
+        misses: Number of lookups that found nothing
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries
+            ttl: Default time-to-live in seconds
+            timer: Monotonic clock used for expiration
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._timer = timer
+        self._data: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """Number of entries currently stored (including not yet purged ones)."""
+        return len(self._data)
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Get a value if present and not expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[V]: Cached value or None
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self._timer():
+            del self._data[key]
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Optional time-to-live overriding the default
+        """
+        if self.maxsize <= 0:
+            return
+
+        expires_at = self._timer() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K) -> Optional[V]:
+        """
+        Remove an entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[V]: Removed value or None
+        """
+        entry = self._data.pop(key, None)
+        return entry[1] if entry else None
+
+    def invalidate_where(self, predicate: Callable[[K, V], bool]) -> int:
+        """
+        Remove every entry matching a predicate.
+
+        Args:
+            predicate: Function receiving key and value
+
+        Returns:
+            int: Number of removed entries
+        """
+        keys = [key for key, (_, value) in self._data.items() if predicate(key, value)]
+        for key in keys:
+            del self._data[key]
+        return len(keys)
+
+    def keys(self) -> List[K]:
+        """
+        Get the keys of the entries that have not expired.
+
+        Returns:
+            List[K]: Keys, least recently used first
+        """
+        now = self._timer()
+        return [key for key, (expires_at, _) in self._data.items() if expires_at > now]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
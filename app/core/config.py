@@ -22,11 +22,46 @@ class Settings(BaseSettings):
     POSTGRES_DB: str = "app"
     POSTGRES_PORT: str = "5432"
     SQLALCHEMY_DATABASE_URI: Optional[str] = None
+    SQLALCHEMY_REPLICA_URI: Optional[str] = None
+    DB_REPLICA_RETRY_SECONDS: int = 30
+
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_USE_LIFO: bool = True
+    DB_POOL_PRE_PING: bool = False
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_APPLICATION_NAME: Optional[str] = None
+    DB_STATEMENT_TIMEOUT_MS: Optional[int] = None
+    DB_READ_ONLY_SAFE_METHODS: bool = True
+    DB_QUERY_BUDGET: Optional[int] = None
+    DB_QUERY_BUDGET_STRICT: bool = False
+    DB_N_PLUS_ONE_THRESHOLD: int = 5
 
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
+    JWT_BACKEND: str = "native"
+    JWT_PRIVATE_KEY_FILE: Optional[str] = None
+    JWT_KEY_ID: Optional[str] = None
+    JWT_PREVIOUS_PUBLIC_KEY_FILES: List[Union[str, Dict[str, str]]] = []
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    ACCESS_TOKEN_CACHE_MAX_SIZE: int = 10000
+    REFRESH_TOKEN_STORE_MAX_SIZE: int = 100000
+    TOKEN_DENYLIST_CAPACITY: int = 100000
+    TOKEN_DENYLIST_ERROR_RATE: float = 0.001
+
+    PASSWORD_HASH_EXECUTOR: str = "thread"
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 32
+    PASSWORD_HASH_RETRY_AFTER: int = 1
+
+    USER_IMPORT_MAX_ROWS: int = 50000
+
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10000
+    AUTHORIZATION_MODE: str = "database"
 
     CORS_ORIGINS: List[AnyHttpUrl] = []
     INITIALIZE_DB: bool = False
@@ -35,10 +70,21 @@ class Settings(BaseSettings):
 
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    LOG_ACCESS_SAMPLE_RATE: float = 1.0
+
+    METRICS_ENABLED: bool = True
+
+    # Server worker processes (gunicorn.conf.py and scripts/start.sh export it)
+    WEB_CONCURRENCY: int = 1
 
     REDIS_HOST: Optional[str] = None
     REDIS_PORT: Optional[int] = 6379
+    REDIS_TIMEOUT_SECONDS: float = 0.5
+
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_ALGORITHM: str = "sliding_window"
     RATE_LIMIT_PER_MINUTE: int = 60
+    RATE_LIMIT_LOGIN_PER_MINUTE: int = 10
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -65,6 +111,40 @@ class Settings(BaseSettings):
 
         return f"postgresql+asyncpg://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
 
+    @field_validator("ALGORITHM")
+    def validate_algorithm(cls, v: str) -> str:
+        allowed = (
+            "HS256", "HS384", "HS512", "RS256", "RS384", "RS512",
+            "ES256", "ES384", "ES512", "EdDSA",
+        )
+        if v not in allowed:
+            raise ValueError(f"ALGORITHM deve ser um de: {', '.join(allowed)}")
+        return v
+
+    @field_validator("JWT_BACKEND")
+    def validate_jwt_backend(cls, v: str) -> str:
+        if v not in ("native", "jose"):
+            raise ValueError("JWT_BACKEND deve ser 'native' ou 'jose'")
+        return v
+
+    @field_validator("PASSWORD_HASH_EXECUTOR")
+    def validate_password_hash_executor(cls, v: str) -> str:
+        if v not in ("thread", "process"):
+            raise ValueError("PASSWORD_HASH_EXECUTOR deve ser 'thread' ou 'process'")
+        return v
+
+    @field_validator("AUTHORIZATION_MODE")
+    def validate_authorization_mode(cls, v: str) -> str:
+        if v not in ("database", "token"):
+            raise ValueError("AUTHORIZATION_MODE deve ser 'database' ou 'token'")
+        return v
+
+    @field_validator("RATE_LIMIT_ALGORITHM")
+    def validate_rate_limit_algorithm(cls, v: str) -> str:
+        if v not in ("sliding_window", "token_bucket"):
+            raise ValueError("RATE_LIMIT_ALGORITHM deve ser 'sliding_window' ou 'token_bucket'")
+        return v
+
     @field_validator("CORS_ORIGINS", mode="before")
     def assemble_cors_origins(cls, v: Union[str, List[str]]) -> Union[List[str], str]:
         if isinstance(v, str) and not v.startswith("["):
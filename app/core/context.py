@@ -0,0 +1,62 @@
+"""
+Request Context Module
+
+This module keeps per-request data (request ID, authenticated user, database
+statistics) in a context variable, so that code without access to the
+request object can contribute to it and middleware can report it.
+"""
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+
+@dataclass
+class RequestContext:
+    """
+    Mutable data collected while a request is handled.
+
+    Attributes:
+        request_id: Request identifier (from X-Request-ID or generated)
+        user_id: ID of the authenticated user, once known
+        db_queries: Number of SQL statements executed
+        db_time_ns: Time spent executing SQL statements
+        db_statements: Execution count per SQL statement text
+        query_budget: Maximum number of statements allowed, if any
+    """
+
+    request_id: str
+    user_id: Optional[str] = None
+    db_queries: int = 0
+    db_time_ns: int = 0
+    db_statements: Dict[str, int] = field(default_factory=dict)
+    query_budget: Optional[int] = None
+
+    @property
+    def db_duplicates(self) -> Dict[str, int]:
+        """Statements executed more than once, with their execution count."""
+        return {sql: n for sql, n in self.db_statements.items() if n > 1}
+
+
+_request_context: ContextVar[Optional[RequestContext]] = ContextVar(
+    "request_context", default=None
+)
+
+
+def get_request_context() -> Optional[RequestContext]:
+    """
+    Get the context of the request being handled.
+
+    Returns:
+        Optional[RequestContext]: Current request context or None outside requests
+    """
+    return _request_context.get()
+
+
+def set_request_context(context: Optional[RequestContext]) -> None:
+    """
+    Set the context of the request being handled.
+
+    Args:
+        context: Request context, or None to clear it
+    """
+    _request_context.set(context)
@@ -4,7 +4,7 @@ Dependency Injection Module
 This module defines FastAPI dependencies for authentication, authorization,
 and other common requirements across the application.
 """
-from typing import List, Optional, Set
+from typing import List, Optional
 
 from fastapi import Depends, Query, Request
 from fastapi.security import OAuth2PasswordBearer
@@ -12,12 +12,19 @@ from jose import JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.core.exceptions import ForbiddenError, UnauthorizedError
+from app.core.context import get_request_context
+from app.core.exceptions import ForbiddenError, RateLimitError, UnauthorizedError
+from app.core.permissions import permission_registry
+from app.core.middleware.rate_limiting_middleware import get_client_ip
 from app.core.security import validate_access_token
 from app.crud.user import user_crud
 from app.db.session import get_db
 from app.models.user import User
+from app.schemas.principal import Principal
 from app.schemas.token import TokenData
+from app.services.principal import principal_cache
+from app.services.rate_limiter import rate_limiter
+from app.services.token_denylist import token_denylist
 
 # OAuth2 scheme for token handling
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_PREFIX}/v1/auth/login")
@@ -34,7 +41,7 @@ async def get_token_data(token: str = Depends(oauth2_scheme)) -> TokenData:
         TokenData: Validated token data
 
     Raises:
-        UnauthorizedError: If token is invalid
+        UnauthorizedError: If token is invalid or revoked
     """
     try:
         payload = validate_access_token(token)
@@ -42,8 +49,21 @@ async def get_token_data(token: str = Depends(oauth2_scheme)) -> TokenData:
         if user_id is None:
             raise UnauthorizedError("Could not validate credentials")
 
+        if await token_denylist.is_revoked(payload.get("jti")):
+            raise UnauthorizedError("Token has been revoked")
+
+        context = get_request_context()
+        if context is not None:
+            context.user_id = user_id
+
         token_scopes = payload.get("scopes", [])
-        return TokenData(user_id=user_id, scopes=token_scopes)
+        return TokenData(
+            user_id=user_id,
+            scopes=token_scopes,
+            roles=payload.get("roles", []),
+            permissions_version=payload.get("pv"),
+            is_superuser=payload.get("su", False),
+        )
 
     except JWTError:
         raise UnauthorizedError("Could not validate credentials")
@@ -66,7 +86,7 @@ async def get_current_user(
     Raises:
         UnauthorizedError: If user not found or inactive
     """
-    user = await user_crud.get(db, id=token_data.user_id)
+    user = await user_crud.get(db, id=token_data.user_id, profile="detail")
     if not user:
         raise UnauthorizedError("User not found")
 
@@ -76,6 +96,86 @@ async def get_current_user(
     return user
 
 
+async def get_token_principal(
+    db: AsyncSession, token_data: TokenData
+) -> Optional[Principal]:
+    """
+    Build the principal from the token scopes, rejecting stale tokens.
+
+    The token is trusted only if its permissions version matches the user's
+    current one, taken from the principal cache or, on a miss or mismatch,
+    from a two-column lookup that loads no roles or permissions.
+
+    Args:
+        db: Database session
+        token_data: Validated token data
+
+    Returns:
+        Optional[Principal]: Principal described by the token or None if user
+        not found
+
+    Raises:
+        UnauthorizedError: If the token was issued for an older permissions version
+    """
+    cached = principal_cache.get(token_data.user_id)
+    if (
+        cached is not None
+        and cached.permissions_version == token_data.permissions_version
+    ):
+        return cached
+
+    state = await user_crud.get_auth_state(db, user_id=token_data.user_id)
+    if state is None:
+        return None
+
+    is_active, permissions_version = state
+    if permissions_version != token_data.permissions_version:
+        raise UnauthorizedError("Token permissions are outdated")
+
+    principal = Principal.from_token_data(token_data, is_active=is_active)
+    principal_cache.set(token_data.user_id, principal)
+    return principal
+
+
+async def get_current_principal(
+    db: AsyncSession = Depends(get_db),
+    token_data: TokenData = Depends(get_token_data),
+) -> Principal:
+    """
+    Get the principal of the current authenticated user.
+
+    Unlike get_current_user, this does not load the ORM user and is served
+    from the in-process principal cache on steady-state requests. With
+    AUTHORIZATION_MODE=token, grants come from the token scopes instead of
+    the database.
+
+    Args:
+        db: Database session
+        token_data: Validated token data
+
+    Returns:
+        Principal: Current authenticated principal
+
+    Raises:
+        UnauthorizedError: If user not found, inactive or token outdated
+    """
+    if (
+        settings.AUTHORIZATION_MODE == "token"
+        and token_data.permissions_version is not None
+    ):
+        principal = await get_token_principal(db, token_data)
+    else:
+        principal = await user_crud.get_principal(db, user_id=token_data.user_id)
+
+    if not principal:
+        raise UnauthorizedError("User not found")
+
+    if not principal.is_active:
+        raise UnauthorizedError("Inactive user")
+
+    return principal
+
+
 async def get_current_active_user(
     current_user: User = Depends(get_current_user),
 ) -> User:
@@ -98,16 +198,16 @@ async def get_current_active_user(
 
 
 async def get_current_superuser(
-    current_user: User = Depends(get_current_active_user),
-) -> User:
+    current_user: Principal = Depends(get_current_principal),
+) -> Principal:
     """
     Ensure the current user is a superuser.
 
     Args:
-        current_user: Current authenticated active user
+        current_user: Current authenticated principal
 
     Returns:
-        User: Current superuser
+        Principal: Current superuser
 
     Raises:
         ForbiddenError: If user is not a superuser
@@ -128,18 +228,19 @@ def require_permissions(required_permissions: List[str]):
     Returns:
         Dependency function that validates user permissions
     """
+    required_mask = permission_registry.mask(required_permissions)
 
     async def _check_permissions(
-        current_user: User = Depends(get_current_active_user),
-    ) -> User:
+        current_user: Principal = Depends(get_current_principal),
+    ) -> Principal:
         """
         Check if the current user has all required permissions.
 
         Args:
-            current_user: Current authenticated active user
+            current_user: Current authenticated principal
 
         Returns:
-            User: Current user with verified permissions
+            Principal: Current user with verified permissions
 
         Raises:
             ForbiddenError: If user lacks required permissions
@@ -147,18 +248,11 @@ def require_permissions(required_permissions: List[str]):
         if current_user.is_superuser:
             return current_user
 
-        # Get all permission codes from user roles
-        user_permissions: Set[str] = set()
-        for role in current_user.roles:
-            for permission in role.permissions:
-                user_permissions.add(permission.code)
-
         # Check if user has all required permissions
-        missing_permissions = [
-            p for p in required_permissions if p not in user_permissions
-        ]
+        missing_mask = required_mask & ~current_user.permission_mask
 
-        if missing_permissions:
+        if missing_mask:
+            missing_permissions = permission_registry.codes(missing_mask)
             raise ForbiddenError(
                 f"Missing required permissions: {', '.join(missing_permissions)}"
             )
@@ -178,18 +272,19 @@ def require_any_permission(required_permissions: List[str]):
     Returns:
         Dependency function that validates user permissions
     """
+    required_mask = permission_registry.mask(required_permissions)
 
     async def _check_any_permission(
-        current_user: User = Depends(get_current_active_user),
-    ) -> User:
+        current_user: Principal = Depends(get_current_principal),
+    ) -> Principal:
         """
         Check if the current user has any of the required permissions.
 
         Args:
-            current_user: Current authenticated active user
+            current_user: Current authenticated principal
 
         Returns:
-            User: Current user with verified permissions
+            Principal: Current user with verified permissions
 
         Raises:
             ForbiddenError: If user lacks all required permissions
@@ -197,14 +292,8 @@ def require_any_permission(required_permissions: List[str]):
         if current_user.is_superuser:
             return current_user
 
-        # Get all permission codes from user roles
-        user_permissions: Set[str] = set()
-        for role in current_user.roles:
-            for permission in role.permissions:
-                user_permissions.add(permission.code)
-
         # Check if user has any of the required permissions
-        has_any = any(p in user_permissions for p in required_permissions)
+        has_any = current_user.permission_mask & required_mask
 
         if not has_any:
             raise ForbiddenError(
@@ -228,16 +317,16 @@ def require_role(role_code: str):
     """
 
     async def _check_role(
-        current_user: User = Depends(get_current_active_user),
-    ) -> User:
+        current_user: Principal = Depends(get_current_principal),
+    ) -> Principal:
         """
         Check if the current user has the specified role.
 
         Args:
-            current_user: Current authenticated active user
+            current_user: Current authenticated principal
 
         Returns:
-            User: Current user with verified role
+            Principal: Current user with verified role
 
         Raises:
             ForbiddenError: If user doesn't have the role
@@ -246,7 +335,7 @@ def require_role(role_code: str):
             return current_user
 
         # Check if user has the role
-        has_role = any(role.code == role_code for role in current_user.roles)
+        has_role = role_code in current_user.roles
 
         if not has_role:
             raise ForbiddenError(f"Required role: {role_code}")
@@ -286,8 +375,8 @@ async def check_rate_limit(
     """
     Check if request rate limit is exceeded.
 
-    This is a placeholder for a rate limiting implementation.
-    You would typically use Redis to track request counts.
+    Counts the request in a bucket of its own per route and user (or client
+    IP), on top of the global limit applied by RateLimitMiddleware.
 
     Args:
         request: The incoming request
@@ -297,5 +386,11 @@ async def check_rate_limit(
     Raises:
         RateLimitError: If rate limit is exceeded
     """
-    # Implement rate limiting logic here
-    # Example with Redis would track requests per minute by IP or user ID
+    identity = f"user:{user.id}" if user else f"ip:{get_client_ip(request.scope)}"
+    result = await rate_limiter.hit(
+        f"{request.method} {request.url.path}|{identity}",
+        limit or settings.RATE_LIMIT_PER_MINUTE,
+        60,
+    )
+    if not result.allowed:
+        raise RateLimitError(retry_after=result.retry_after)
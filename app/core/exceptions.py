@@ -126,15 +126,22 @@ class ConflictError(AppException):
     Args:
         detail: Error detail message
         error_code: Application-specific error code
+        field: Field whose value conflicts with an existing record
     """
 
-    def __init__(self, detail: str, error_code: Optional[str] = None):
+    def __init__(
+        self,
+        detail: str,
+        error_code: Optional[str] = None,
+        field: Optional[str] = None,
+    ):
         """Initialize as 409 Conflict with detail message."""
         super().__init__(
             status_code=status.HTTP_409_CONFLICT,
             detail=detail,
             error_code=error_code,
         )
+        self.field = field
 
 
 class RateLimitError(AppException):
@@ -162,6 +169,31 @@ class RateLimitError(AppException):
         )
 
 
+class ServiceUnavailableError(AppException):
+    """
+    Exception for temporarily unavailable services (HTTP 503).
+
+    Args:
+        detail: Error detail message
+        retry_after: Seconds client should wait before retrying
+        error_code: Application-specific error code
+    """
+
+    def __init__(
+        self,
+        detail: str = "Service temporarily unavailable",
+        retry_after: int = 1,
+        error_code: Optional[str] = None,
+    ):
+        """Initialize as 503 Service Unavailable with detail message and Retry-After header."""
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail,
+            error_code=error_code,
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
 class ServerError(AppException):
     """
     Exception for internal server errors (HTTP 500).
@@ -200,6 +232,9 @@ def handle_app_exception(exc: AppException) -> JSONResponse:
     if exc.error_code:
         content["error_code"] = exc.error_code
 
+    if getattr(exc, "field", None):
+        content["field"] = exc.field
+
     return JSONResponse(
         status_code=exc.status_code,
         content=content,
@@ -0,0 +1,487 @@
+"""
+JWT Backend Module
+
+This module signs and verifies JWTs through a pluggable backend and manages
+the signing keys: a shared secret for HS* algorithms, or an RSA, EC or
+Ed25519 key pair whose public part is published as a JWKS so other services
+can verify tokens locally.
+
+The native backend, built directly on hmac and cryptography, verifies tokens
+several times faster than python-jose, which remains available as 'jose'.
+Errors are python-jose's JWTError (and subclasses) with either backend.
+
+Asymmetric keys are identified by a 'kid' header. Public keys of previous
+signing keys can be kept for verification while their tokens expire.
+"""
+import base64
+import binascii
+import calendar
+import hashlib
+import hmac
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, padding, rsa
+from cryptography.hazmat.primitives.asymmetric.utils import (
+    decode_dss_signature,
+    encode_dss_signature,
+)
+from jose import JWTError
+from jose import jwt as jose_jwt
+from jose.exceptions import ExpiredSignatureError, JWTClaimsError
+
+from app.core.config import Settings
+
+BACKENDS = ("native", "jose")
+
+HMAC_ALGORITHMS = ("HS256", "HS384", "HS512")
+
+ASYMMETRIC_ALGORITHMS = ("RS256", "RS384", "RS512", "ES256", "ES384", "ES512", "EdDSA")
+
+# JWS algorithm and JWK curve name of each supported EC curve
+EC_ALGORITHMS = {"secp256r1": "ES256", "secp384r1": "ES384", "secp521r1": "ES512"}
+EC_CURVES = {"secp256r1": "P-256", "secp384r1": "P-384", "secp521r1": "P-521"}
+
+# Hash of each algorithm, by its bit size suffix
+HASHLIB_DIGESTS = {"256": hashlib.sha256, "384": hashlib.sha384, "512": hashlib.sha512}
+HASH_ALGORITHMS = {"256": hashes.SHA256, "384": hashes.SHA384, "512": hashes.SHA512}
+
+
+def _b64url_decode(data: str) -> bytes:
+    """Base64url decode, rejecting characters outside the alphabet."""
+    padded = data + "=" * (-len(data) % 4)
+    return base64.b64decode(padded, altchars=b"-_", validate=True)
+
+
+def _json_b64url(value: Dict[str, Any]) -> str:
+    """Serialize a JSON object compactly and base64url encode it."""
+    return _b64url(json.dumps(value, separators=(",", ":")).encode())
+
+
+def _numeric_date(value: Any) -> Any:
+    """Convert a datetime claim to seconds since the epoch (naive is UTC)."""
+    if isinstance(value, datetime):
+        return calendar.timegm(value.utctimetuple())
+    return value
+
+
+class NativeBackend:
+    """
+    JWT backend built directly on hmac and cryptography.
+
+    Only compact JWS signed with the key's own algorithm is accepted, and the
+    exp, nbf and iat claims are checked like python-jose does.
+    """
+
+    name = "native"
+
+    def encode(
+        self, claims: Dict[str, Any], key: Any, algorithm: str, headers: Dict[str, Any]
+    ) -> str:
+        """Sign claims into a compact JWT."""
+        header = {"alg": algorithm, "typ": "JWT", **headers}
+        payload = {name: _numeric_date(value) for name, value in claims.items()}
+        signing_input = f"{_json_b64url(header)}.{_json_b64url(payload)}"
+        signature = self._sign(signing_input.encode("ascii"), key, algorithm)
+        return f"{signing_input}.{_b64url(signature)}"
+
+    def decode(self, token: str, key: Any, algorithm: str) -> Dict[str, Any]:
+        """Verify a JWT and return its claims."""
+        header, claims_segment, signing_input, signature = self._split(token)
+        if header.get("alg") != algorithm:
+            raise JWTError("The specified alg value is not allowed")
+        if not self._verify(signing_input, signature, key, algorithm):
+            raise JWTError("Signature verification failed.")
+
+        try:
+            claims = json.loads(_b64url_decode(claims_segment))
+        except (binascii.Error, ValueError) as e:
+            raise JWTError("Invalid payload string") from e
+        if not isinstance(claims, dict):
+            raise JWTError("Invalid payload string: must be a json object")
+
+        now = time.time()
+        for name in ("exp", "nbf", "iat"):
+            value = claims.get(name, 0)
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise JWTClaimsError(f"Invalid {name} claim: must be a number")
+        if "exp" in claims and claims["exp"] < now:
+            raise ExpiredSignatureError("Signature has expired.")
+        if "nbf" in claims and claims["nbf"] > now:
+            raise JWTClaimsError("The token is not yet valid (nbf)")
+        return claims
+
+    def get_unverified_header(self, token: str) -> Dict[str, Any]:
+        """Read the header of a JWT without verifying it."""
+        return self._split(token)[0]
+
+    @staticmethod
+    def _split(token: str) -> Tuple[Dict[str, Any], str, bytes, bytes]:
+        """Split a compact JWS into header, claims, signing input and signature."""
+        try:
+            header_segment, claims_segment, signature_segment = token.split(".")
+            header = json.loads(_b64url_decode(header_segment))
+            signature = _b64url_decode(signature_segment)
+            signing_input = f"{header_segment}.{claims_segment}".encode("ascii")
+        except (binascii.Error, ValueError) as e:
+            raise JWTError("Error decoding token headers.") from e
+        if not isinstance(header, dict):
+            raise JWTError("Invalid header string: must be a json object")
+        return header, claims_segment, signing_input, signature
+
+    @staticmethod
+    def _sign(data: bytes, key: Any, algorithm: str) -> bytes:
+        """Compute the JWS signature of the signing input."""
+        family, bits = algorithm[:2], algorithm[2:]
+        if family == "HS":
+            secret = key.encode() if isinstance(key, str) else key
+            return hmac.new(secret, data, HASHLIB_DIGESTS[bits]).digest()
+        if family == "RS":
+            return key.sign(data, padding.PKCS1v15(), HASH_ALGORITHMS[bits]())
+        if family == "ES":
+            der = key.sign(data, ec.ECDSA(HASH_ALGORITHMS[bits]()))
+            r, s = decode_dss_signature(der)
+            size = (key.curve.key_size + 7) // 8
+            return r.to_bytes(size, "big") + s.to_bytes(size, "big")
+        return key.sign(data)
+
+    @staticmethod
+    def _verify(data: bytes, signature: bytes, key: Any, algorithm: str) -> bool:
+        """Check the JWS signature of the signing input."""
+        family, bits = algorithm[:2], algorithm[2:]
+        if family == "HS":
+            secret = key.encode() if isinstance(key, str) else key
+            expected = hmac.new(secret, data, HASHLIB_DIGESTS[bits]).digest()
+            return hmac.compare_digest(expected, signature)
+
+        try:
+            if family == "RS":
+                key.verify(signature, data, padding.PKCS1v15(), HASH_ALGORITHMS[bits]())
+            elif family == "ES":
+                size = (key.curve.key_size + 7) // 8
+                if len(signature) != 2 * size:
+                    return False
+                der = encode_dss_signature(
+                    int.from_bytes(signature[:size], "big"),
+                    int.from_bytes(signature[size:], "big"),
+                )
+                key.verify(der, data, ec.ECDSA(HASH_ALGORITHMS[bits]()))
+            else:
+                key.verify(signature, data)
+        except InvalidSignature:
+            return False
+        return True
+
+
+class JoseBackend:
+    """JWT backend using python-jose (no EdDSA support)."""
+
+    name = "jose"
+
+    def encode(
+        self, claims: Dict[str, Any], key: Any, algorithm: str, headers: Dict[str, Any]
+    ) -> str:
+        """Sign claims into a compact JWT."""
+        return jose_jwt.encode(claims, key, algorithm=algorithm, headers=headers)
+
+    def decode(self, token: str, key: Any, algorithm: str) -> Dict[str, Any]:
+        """Verify a JWT and return its claims."""
+        return jose_jwt.decode(token, key, algorithms=[algorithm])
+
+    def get_unverified_header(self, token: str) -> Dict[str, Any]:
+        """Read the header of a JWT without verifying it."""
+        return jose_jwt.get_unverified_header(token)
+
+
+def get_backend(name: str) -> Any:
+    """
+    Get a JWT backend by name.
+
+    Args:
+        name: 'native' or 'jose'
+
+    Returns:
+        NativeBackend or JoseBackend
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    if name == "native":
+        return NativeBackend()
+    if name == "jose":
+        return JoseBackend()
+    raise ValueError(f"Unknown JWT backend: {name}")
+
+
+def _b64url(data: bytes) -> str:
+    """Base64url encode without padding."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _int_to_b64url(value: int, size: Optional[int] = None) -> str:
+    """Base64url encode a big-endian unsigned integer."""
+    return _b64url(value.to_bytes(size or (value.bit_length() + 7) // 8, "big"))
+
+
+def public_jwk(public_key: Any) -> Dict[str, str]:
+    """
+    Build the required JWK members (RFC 7517) of a public key.
+
+    Args:
+        public_key: RSA, EC or Ed25519 public key
+
+    Returns:
+        Dict[str, str]: kty and key parameters
+
+    Raises:
+        ValueError: If the key type is not supported
+    """
+    if isinstance(public_key, rsa.RSAPublicKey):
+        numbers = public_key.public_numbers()
+        return {
+            "kty": "RSA",
+            "n": _int_to_b64url(numbers.n),
+            "e": _int_to_b64url(numbers.e),
+        }
+
+    if isinstance(public_key, ec.EllipticCurvePublicKey):
+        numbers = public_key.public_numbers()
+        size = (public_key.curve.key_size + 7) // 8
+        return {
+            "kty": "EC",
+            "crv": EC_CURVES[public_key.curve.name],
+            "x": _int_to_b64url(numbers.x, size),
+            "y": _int_to_b64url(numbers.y, size),
+        }
+
+    if isinstance(public_key, ed25519.Ed25519PublicKey):
+        raw = public_key.public_bytes(
+            serialization.Encoding.Raw, serialization.PublicFormat.Raw
+        )
+        return {"kty": "OKP", "crv": "Ed25519", "x": _b64url(raw)}
+
+    raise ValueError(f"Unsupported key type: {type(public_key).__name__}")
+
+
+def jwk_thumbprint(jwk: Dict[str, str]) -> str:
+    """
+    Compute the RFC 7638 SHA-256 thumbprint of a JWK, used as default kid.
+
+    Args:
+        jwk: Required JWK members
+
+    Returns:
+        str: Base64url thumbprint
+    """
+    canonical = json.dumps(jwk, sort_keys=True, separators=(",", ":"))
+    return _b64url(hashlib.sha256(canonical.encode()).digest())
+
+
+def infer_algorithm(public_key: Any) -> str:
+    """
+    Get the default signing algorithm of a public key.
+
+    RSA keys may also sign with RS384 or RS512: configure the algorithm
+    explicitly for those.
+
+    Args:
+        public_key: RSA, EC or Ed25519 public key
+
+    Returns:
+        str: JWS algorithm name
+    """
+    if isinstance(public_key, rsa.RSAPublicKey):
+        return "RS256"
+    if isinstance(public_key, ec.EllipticCurvePublicKey):
+        return EC_ALGORITHMS[public_key.curve.name]
+    if isinstance(public_key, ed25519.Ed25519PublicKey):
+        return "EdDSA"
+    raise ValueError(f"Unsupported key type: {type(public_key).__name__}")
+
+
+class JWTKey(NamedTuple):
+    """
+    Key used to sign or verify tokens.
+
+    Attributes:
+        kid: Key ID, None for the shared secret
+        algorithm: JWS algorithm
+        verifying_key: Secret or public key
+        signing_key: Secret or private key, None for verification-only keys
+    """
+
+    kid: Optional[str]
+    algorithm: str
+    verifying_key: Any
+    signing_key: Any = None
+
+
+class JWTKeySet:
+    """
+    Signing key and verification keys of the application's tokens.
+
+    Attributes:
+        backend: JWT backend
+        active: Key signing new tokens
+        keys: Verification keys by kid (including the active key)
+    """
+
+    def __init__(self, backend: Any, active: JWTKey, previous: List[JWTKey] = ()):
+        """
+        Initialize the key set.
+
+        Args:
+            backend: JWT backend
+            active: Key signing new tokens
+            previous: Verification-only keys of earlier signing keys
+
+        Raises:
+            ValueError: If the backend does not support a key's algorithm
+        """
+        for key in (active, *previous):
+            if key.algorithm == "EdDSA" and backend.name == "jose":
+                raise ValueError("EdDSA requires the 'native' JWT backend")
+
+        self.backend = backend
+        self.active = active
+        self.keys = {key.kid: key for key in (*previous, active)}
+
+    def encode(self, claims: Dict[str, Any]) -> str:
+        """
+        Sign claims with the active key.
+
+        Args:
+            claims: Token claims
+
+        Returns:
+            str: Encoded JWT
+        """
+        headers = {"kid": self.active.kid} if self.active.kid else {}
+        return self.backend.encode(
+            claims, self.active.signing_key, self.active.algorithm, headers
+        )
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        """
+        Verify a token with the key named by its kid header.
+
+        Args:
+            token: Encoded JWT
+
+        Returns:
+            Dict[str, Any]: Token claims
+
+        Raises:
+            JWTError: If the token is invalid, expired or signed by an unknown key
+        """
+        kid = self.backend.get_unverified_header(token).get("kid")
+        if kid is not None and not isinstance(kid, str):
+            raise JWTError("Invalid key ID")
+        key = self.keys.get(kid) if kid else self.active
+        if key is None:
+            raise JWTError("Unknown signing key")
+        return self.backend.decode(token, key.verifying_key, key.algorithm)
+
+    def jwks(self) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Get the public verification keys as a JWK Set.
+
+        Returns:
+            Dict: {'keys': [...]}, empty for a shared secret
+        """
+        return {
+            "keys": [
+                {
+                    **public_jwk(key.verifying_key),
+                    "kid": key.kid,
+                    "alg": key.algorithm,
+                    "use": "sig",
+                }
+                for key in self.keys.values()
+                if key.algorithm in ASYMMETRIC_ALGORITHMS
+            ]
+        }
+
+
+def _load_public_key(path: str) -> Any:
+    """Load a PEM public key, or the public part of a PEM private key."""
+    data = Path(path).read_bytes()
+    if b"PRIVATE KEY" in data:
+        return serialization.load_pem_private_key(data, password=None).public_key()
+    return serialization.load_pem_public_key(data)
+
+
+def _load_previous_key(entry: Union[str, Dict[str, str]]) -> JWTKey:
+    """
+    Load a verification-only key of an earlier signing key.
+
+    Args:
+        entry: Path of the PEM key, or {"file": path, "kid": ..., "alg": ...}
+            with the kid and algorithm the key signed with
+
+    Returns:
+        JWTKey: Key with the configured kid and algorithm, defaulting to the
+        key's JWK thumbprint and infer_algorithm
+
+    Raises:
+        ValueError: If the entry has no file or an unsupported algorithm
+    """
+    if isinstance(entry, str):
+        entry = {"file": entry}
+    if not entry.get("file"):
+        raise ValueError("Previous JWT keys require a 'file'")
+
+    public_key = _load_public_key(entry["file"])
+    algorithm = entry.get("alg") or infer_algorithm(public_key)
+    if algorithm not in ASYMMETRIC_ALGORITHMS:
+        raise ValueError(f"Unsupported previous JWT key algorithm: {algorithm}")
+
+    return JWTKey(
+        kid=entry.get("kid") or jwk_thumbprint(public_jwk(public_key)),
+        algorithm=algorithm,
+        verifying_key=public_key,
+    )
+
+
+def load_key_set(config: Settings) -> JWTKeySet:
+    """
+    Build the key set from the settings.
+
+    Args:
+        config: Application settings
+
+    Returns:
+        JWTKeySet: Key set of the configured algorithm and keys
+
+    Raises:
+        ValueError: If an asymmetric algorithm has no private key, or a
+            previous key is misconfigured
+    """
+    backend = get_backend(config.JWT_BACKEND)
+    previous = [
+        _load_previous_key(entry) for entry in config.JWT_PREVIOUS_PUBLIC_KEY_FILES
+    ]
+
+    if config.ALGORITHM in HMAC_ALGORITHMS:
+        active = JWTKey(None, config.ALGORITHM, config.SECRET_KEY, config.SECRET_KEY)
+        return JWTKeySet(backend, active, previous)
+
+    if not config.JWT_PRIVATE_KEY_FILE:
+        raise ValueError(f"{config.ALGORITHM} requires JWT_PRIVATE_KEY_FILE")
+
+    private_key = serialization.load_pem_private_key(
+        Path(config.JWT_PRIVATE_KEY_FILE).read_bytes(), password=None
+    )
+    public_key = private_key.public_key()
+    active = JWTKey(
+        kid=config.JWT_KEY_ID or jwk_thumbprint(public_jwk(public_key)),
+        algorithm=config.ALGORITHM,
+        verifying_key=public_key,
+        signing_key=private_key,
+    )
+    return JWTKeySet(backend, active, previous)
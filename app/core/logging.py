@@ -0,0 +1,93 @@
+"""
+Logging Module
+
+This module configures application logging. Records are put on a queue by
+the logging calls and written by a background thread, so log I/O never
+blocks the event loop.
+"""
+import json
+import logging
+import queue
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+
+ACCESS_LOGGER = "app.access"
+
+_listener: Optional[QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formatter rendering records as one JSON object per line.
+
+    Fields passed as ``extra={"fields": {...}}`` are merged into the object.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format a record as JSON.
+
+        Args:
+            record: Log record
+
+        Returns:
+            str: JSON line
+        """
+        data: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        data.update(getattr(record, "fields", {}))
+        if record.exc_info:
+            data["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(data, default=str)
+
+
+def setup_logging() -> QueueListener:
+    """
+    Route all logging through a queue drained by a background listener.
+
+    Application records use LOG_FORMAT; access records (ACCESS_LOGGER) are
+    written as JSON. Calling it again returns the running listener.
+
+    Returns:
+        QueueListener: Running listener, stopped by stop_logging
+    """
+    global _listener
+
+    if _listener is not None:
+        return _listener
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+
+    app_handler = logging.StreamHandler(sys.stderr)
+    app_handler.setFormatter(logging.Formatter(settings.LOG_FORMAT))
+    app_handler.addFilter(lambda record: record.name != ACCESS_LOGGER)
+
+    access_handler = logging.StreamHandler(sys.stdout)
+    access_handler.setFormatter(JsonFormatter())
+    access_handler.addFilter(lambda record: record.name == ACCESS_LOGGER)
+
+    root = logging.getLogger()
+    root.handlers = [QueueHandler(log_queue)]
+    root.setLevel(settings.LOG_LEVEL)
+    logging.getLogger(ACCESS_LOGGER).setLevel(logging.INFO)
+
+    _listener = QueueListener(log_queue, app_handler, access_handler)
+    _listener.start()
+    return _listener
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the background listener."""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,154 @@
+"""
+Metrics Module
+
+This module defines the Prometheus metrics of the application. prometheus_client
+is optional: when it is not installed, METRICS_AVAILABLE is False and the
+recording helpers do nothing.
+
+Under gunicorn, set PROMETHEUS_MULTIPROC_DIR to a directory shared by the
+workers (emptied on startup, see gunicorn.conf.py) so that /metrics
+aggregates the values of every worker.
+"""
+import os
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    from prometheus_client import (
+        CONTENT_TYPE_LATEST,
+        REGISTRY,
+        CollectorRegistry,
+        Gauge,
+        Histogram,
+        generate_latest,
+        multiprocess,
+    )
+except ImportError:  # pragma: no cover - prometheus_client is an optional dependency
+    CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+    METRICS_AVAILABLE = False
+else:
+    METRICS_AVAILABLE = True
+
+# Route label of requests that matched no route, keeping label cardinality bounded
+UNMATCHED_ROUTE = "unmatched"
+
+# Caches whose hit ratio is exported, keyed by name (see register_cache)
+_caches: Dict[str, Any] = {}
+
+if METRICS_AVAILABLE:
+    REQUEST_LATENCY = Histogram(
+        "http_request_duration_seconds",
+        "HTTP request latency by route template and status",
+        ["method", "route", "status"],
+        buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+    )
+    REQUESTS_IN_FLIGHT = Gauge(
+        "http_requests_in_flight",
+        "HTTP requests currently being handled",
+        multiprocess_mode="livesum",
+    )
+    DB_POOL_CHECKOUT_WAIT = Histogram(
+        "db_pool_checkout_wait_seconds",
+        "Time spent waiting for a database connection from the pool",
+        buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+    )
+    PASSWORD_HASH_PENDING = Gauge(
+        "password_hash_pending",
+        "Password hashing jobs queued or running",
+        multiprocess_mode="livesum",
+    )
+    CACHE_HITS = Gauge(
+        "cache_hits",
+        "Cache lookups served from the cache",
+        ["cache"],
+        multiprocess_mode="livesum",
+    )
+    CACHE_MISSES = Gauge(
+        "cache_misses",
+        "Cache lookups that missed",
+        ["cache"],
+        multiprocess_mode="livesum",
+    )
+    CACHE_HIT_RATIO = Gauge(
+        "cache_hit_ratio",
+        "Fraction of cache lookups served from the cache, per worker",
+        ["cache"],
+        multiprocess_mode="liveall",
+    )
+
+
+def register_cache(name: str, cache: Any) -> None:
+    """
+    Export the hit and miss counters of a cache.
+
+    Args:
+        name: Value of the 'cache' label
+        cache: Object with hits, misses and hit_ratio attributes (e.g. TTLCache)
+    """
+    _caches[name] = cache
+
+
+def observe_request(
+    method: str, route: Optional[str], status: int, seconds: float
+) -> None:
+    """
+    Record the latency of a finished request.
+
+    Args:
+        method: HTTP method
+        route: Route template, None if no route matched
+        status: Response status code
+        seconds: Request duration
+    """
+    if METRICS_AVAILABLE:
+        REQUEST_LATENCY.labels(method, route or UNMATCHED_ROUTE, str(status)).observe(
+            seconds
+        )
+
+
+def observe_pool_checkout(seconds: float) -> None:
+    """
+    Record the time spent waiting for a pooled database connection.
+
+    Args:
+        seconds: Checkout wait
+    """
+    if METRICS_AVAILABLE:
+        DB_POOL_CHECKOUT_WAIT.observe(seconds)
+
+
+def update_gauges() -> None:
+    """
+    Copy the worker's hashing queue depth and cache counters into their gauges.
+
+    Called after every request so that, in multiprocess mode, each worker's
+    values stay current whichever worker serves the scrape.
+    """
+    if not METRICS_AVAILABLE:
+        return
+
+    # Imported here: the services import the settings and caches at import time
+    from app.services.password import password_hasher
+
+    PASSWORD_HASH_PENDING.set(password_hasher.pending)
+    for name, cache in _caches.items():
+        CACHE_HITS.labels(name).set(cache.hits)
+        CACHE_MISSES.labels(name).set(cache.misses)
+        CACHE_HIT_RATIO.labels(name).set(cache.hit_ratio)
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """
+    Render the metrics in the Prometheus text format.
+
+    Returns:
+        Tuple[bytes, str]: Response body and content type
+    """
+    update_gauges()
+
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -1 +1,72 @@
 # app/core/middleware/exception_middleware.py
+"""
+Exception Middleware Module
+
+This module defines a pure ASGI middleware turning unhandled exceptions into
+the application's JSON error format.
+"""
+import logging
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.exceptions import ServerError, handle_app_exception
+from app.db.instrumentation import QueryBudgetExceededError
+
+logger = logging.getLogger(__name__)
+
+
+class ExceptionMiddleware:
+    """
+    ASGI middleware answering unhandled exceptions with a JSON 500.
+
+    Exceptions with registered handlers (AppException, HTTPException,
+    validation errors) never reach it. If the response has already started,
+    the exception is re-raised to let the server close the connection.
+    QueryBudgetExceededError is re-raised after the 500 is sent, so test
+    clients fail loudly on endpoints over their query budget.
+
+    Attributes:
+        app: Wrapped ASGI application
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Run the application, mapping unhandled exceptions to a 500 response.
+
+        Args:
+            scope: ASGI scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_tracking(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_tracking)
+        except Exception as exc:
+            logger.exception(
+                "Unhandled exception on %s %s", scope["method"], scope["path"]
+            )
+            if response_started:
+                raise
+            await handle_app_exception(ServerError())(scope, receive, send)
+            if isinstance(exc, QueryBudgetExceededError):
+                raise
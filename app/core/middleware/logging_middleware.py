@@ -1 +1,138 @@
 # app/core/middleware/logging_middleware.py
+"""
+Logging Middleware Module
+
+This module defines a pure ASGI middleware writing one structured access
+log record per request and exposing a request context to the application.
+Database statistics of the request are also sent in a Server-Timing header.
+"""
+import logging
+import random
+import time
+import uuid
+from typing import Callable
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.context import RequestContext, set_request_context
+from app.core.logging import ACCESS_LOGGER
+from app.db.instrumentation import report_duplicates, server_timing
+
+logger = logging.getLogger(ACCESS_LOGGER)
+
+
+class AccessLogMiddleware:
+    """
+    ASGI middleware logging method, route template, status, latency, user ID
+    and database statistics (statements, time, duplicates) of every request.
+
+    Responses with status >= 400, and requests that fail with an exception,
+    are always logged; other responses are sampled.
+
+    Attributes:
+        app: Wrapped ASGI application
+        sample_rate: Fraction of successful requests that are logged
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: float = 1.0,
+        random_func: Callable[[], float] = random.random,
+    ):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            sample_rate: Fraction of successful requests that are logged
+            random_func: Source of numbers in [0, 1) used for sampling
+        """
+        self.app = app
+        self.sample_rate = sample_rate
+        self._random = random_func
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle the request inside a fresh request context and log it.
+
+        Args:
+            scope: ASGI scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope.get("headers", ()):
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")[:64]
+                break
+
+        context = RequestContext(
+            request_id=request_id or uuid.uuid4().hex,
+            query_budget=settings.DB_QUERY_BUDGET,
+        )
+        set_request_context(context)
+        start = time.perf_counter_ns()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"x-request-id", context.request_id.encode("latin-1")),
+                    (b"server-timing", server_timing(context)),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            set_request_context(None)
+            report_duplicates(
+                context, getattr(scope.get("route"), "path", scope["path"])
+            )
+            if status_code >= 400 or self._random() < self.sample_rate:
+                self.log(scope, context, status_code, time.perf_counter_ns() - start)
+
+    def log(
+        self, scope: Scope, context: RequestContext, status_code: int, elapsed_ns: int
+    ) -> None:
+        """
+        Write the access log record of a request.
+
+        Args:
+            scope: ASGI scope
+            context: Request context
+            status_code: Response status code
+            elapsed_ns: Request duration in nanoseconds
+        """
+        route = scope.get("route")
+        level = logging.ERROR if status_code >= 500 else logging.INFO
+        logger.log(
+            level,
+            "%s %s %s",
+            scope["method"],
+            scope["path"],
+            status_code,
+            extra={
+                "fields": {
+                    "request_id": context.request_id,
+                    "method": scope["method"],
+                    "route": getattr(route, "path", None),
+                    "path": scope["path"],
+                    "status": status_code,
+                    "latency_ms": round(elapsed_ns / 1e6, 3),
+                    "user_id": context.user_id,
+                    "db_queries": context.db_queries,
+                    "db_time_ms": round(context.db_time_ns / 1e6, 3),
+                    "db_duplicates": sum(n - 1 for n in context.db_duplicates.values()),
+                    "client": (scope.get("client") or (None,))[0],
+                }
+            },
+        )
@@ -0,0 +1,68 @@
+# app/core/middleware/metrics_middleware.py
+"""
+Metrics Middleware Module
+
+This module defines a pure ASGI middleware recording request latency by
+route template and the number of requests in flight.
+"""
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core import metrics
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware feeding the request metrics of app.core.metrics.
+
+    The route label is the matched route template (e.g. /api/v1/users/{user_id}),
+    never the raw path, so label cardinality stays bounded.
+
+    Attributes:
+        app: Wrapped ASGI application
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Time the request and record it once it finishes.
+
+        Args:
+            scope: ASGI scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter_ns()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        metrics.REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            metrics.REQUESTS_IN_FLIGHT.dec()
+            metrics.observe_request(
+                scope["method"],
+                getattr(scope.get("route"), "path", None),
+                status_code,
+                (time.perf_counter_ns() - start) / 1e9,
+            )
+            metrics.update_gauges()
@@ -0,0 +1,53 @@
+# app/core/middleware/process_time_middleware.py
+"""
+Process Time Middleware Module
+
+This module defines a pure ASGI middleware reporting how long the
+application took to produce the response headers.
+"""
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class ProcessTimeMiddleware:
+    """
+    ASGI middleware adding an X-Process-Time header (seconds).
+
+    Attributes:
+        app: Wrapped ASGI application
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Time the request and add the header to the response start message.
+
+        Args:
+            scope: ASGI scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter_ns()
+
+        async def send_with_time(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                elapsed = (time.perf_counter_ns() - start) / 1e9
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"x-process-time", f"{elapsed:.6f}".encode())
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_time)
@@ -1 +1,144 @@
 # app/core/middleware/rate_limiting_middleware.py
+"""
+Rate Limiting Middleware Module
+
+This module defines a pure ASGI middleware limiting requests per user (for
+requests carrying a valid access token) or per client IP.
+"""
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from jose import JWTError
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.exceptions import RateLimitError, handle_app_exception
+from app.core.security import validate_access_token
+
+
+def get_client_ip(scope: Scope) -> str:
+    """
+    Get the client IP of a request.
+
+    Run the server with proxy headers enabled (uvicorn --proxy-headers) so
+    this is the real client behind a reverse proxy.
+
+    Args:
+        scope: ASGI scope
+
+    Returns:
+        str: Client IP or 'unknown'
+    """
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+def get_rate_limit_identity(scope: Scope) -> str:
+    """
+    Get the identity a request is counted against.
+
+    Args:
+        scope: ASGI scope
+
+    Returns:
+        str: 'user:<id>' for a valid bearer token, otherwise 'ip:<address>'
+    """
+    for name, value in scope.get("headers", ()):
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer" and token:
+                try:
+                    return f"user:{validate_access_token(token)['sub']}"
+                except (JWTError, KeyError):
+                    pass
+            break
+
+    return f"ip:{get_client_ip(scope)}"
+
+
+class RateLimitMiddleware:
+    """
+    ASGI middleware rejecting requests over their rate limit with a 429.
+
+    Every response carries X-RateLimit-Limit and X-RateLimit-Remaining.
+
+    Attributes:
+        app: Wrapped ASGI application
+        limiter: Limiter counting the requests (see app.services.rate_limiter)
+        limit: Default number of requests per window
+        window: Window length in seconds
+        route_limits: Overrides keyed by '<METHOD> <path>', as (limit, window).
+            Requests to an overridden route are counted per client IP in a
+            bucket of their own.
+        exempt_paths: Path prefixes that are never limited
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: Any,
+        limit: int,
+        window: int = 60,
+        route_limits: Optional[Dict[str, Tuple[int, int]]] = None,
+        exempt_paths: Iterable[str] = (),
+    ):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            limiter: Limiter counting the requests
+            limit: Default number of requests per window
+            window: Window length in seconds
+            route_limits: Overrides keyed by '<METHOD> <path>'
+            exempt_paths: Path prefixes that are never limited
+        """
+        self.app = app
+        self.limiter = limiter
+        self.limit = limit
+        self.window = window
+        self.route_limits = route_limits or {}
+        self.exempt_paths = tuple(exempt_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Count the request and either reject it or pass it on.
+
+        Args:
+            scope: ASGI scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope["type"] != "http" or scope["path"].startswith(self.exempt_paths):
+            await self.app(scope, receive, send)
+            return
+
+        route = f"{scope['method']} {scope['path']}"
+        override = self.route_limits.get(route)
+
+        if override is not None:
+            limit, window = override
+            key = f"{route}|ip:{get_client_ip(scope)}"
+        else:
+            limit, window = self.limit, self.window
+            key = get_rate_limit_identity(scope)
+
+        result = await self.limiter.hit(key, limit, window)
+        headers = [
+            (b"x-ratelimit-limit", str(result.limit).encode()),
+            (b"x-ratelimit-remaining", str(result.remaining).encode()),
+        ]
+
+        if not result.allowed:
+            response = handle_app_exception(
+                RateLimitError(retry_after=result.retry_after)
+            )
+            response.raw_headers.extend(headers)
+            await response(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
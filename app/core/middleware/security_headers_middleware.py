@@ -1 +1,75 @@
 # app/core/middleware/security_headers_middleware.py
+"""
+Security Headers Middleware Module
+
+This module defines a pure ASGI middleware adding standard security headers
+to every HTTP response.
+"""
+from typing import List, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class SecurityHeadersMiddleware:
+    """
+    ASGI middleware adding security headers to responses.
+
+    Headers already set by the application are left untouched.
+    Strict-Transport-Security is only sent over HTTPS.
+
+    Attributes:
+        app: Wrapped ASGI application
+        headers: Headers added to every response
+        hsts_header: Strict-Transport-Security header for HTTPS responses
+    """
+
+    def __init__(self, app: ASGIApp, hsts_max_age: int = 31536000):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            hsts_max_age: HSTS max-age in seconds (0 disables HSTS)
+        """
+        self.app = app
+        self.headers: List[Tuple[bytes, bytes]] = [
+            (b"x-content-type-options", b"nosniff"),
+            (b"x-frame-options", b"DENY"),
+            (b"referrer-policy", b"strict-origin-when-cross-origin"),
+            (b"cross-origin-opener-policy", b"same-origin"),
+        ]
+        self.hsts_header = (
+            (
+                b"strict-transport-security",
+                f"max-age={hsts_max_age}; includeSubDomains".encode(),
+            )
+            if hsts_max_age > 0
+            else None
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Add the headers to the response start message.
+
+        Args:
+            scope: ASGI scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        extra = list(self.headers)
+        if self.hsts_header is not None and scope.get("scheme") == "https":
+            extra.append(self.hsts_header)
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                present = {name.lower() for name, _ in headers}
+                headers.extend(h for h in extra if h[0] not in present)
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
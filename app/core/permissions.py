@@ -0,0 +1,72 @@
+"""
+Permission Registry Module
+
+This module interns permission codes into bit positions so that a set of
+permissions is an integer mask and an authorization check is one AND.
+"""
+from typing import Dict, Iterable, List
+
+
+class PermissionRegistry:
+    """
+    Append-only mapping of permission codes to bit positions.
+
+    Positions are assigned on first use and never change for the life of
+    the process. Masks are process-local and must not be persisted.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._positions: Dict[str, int] = {}
+        self._codes: List[str] = []
+
+    def __len__(self) -> int:
+        """Number of registered codes."""
+        return len(self._codes)
+
+    def bit(self, code: str) -> int:
+        """
+        Get the bit of a permission code, registering it if new.
+
+        Args:
+            code: Permission code
+
+        Returns:
+            int: Single-bit mask
+        """
+        position = self._positions.get(code)
+        if position is None:
+            position = self._positions[code] = len(self._codes)
+            self._codes.append(code)
+        return 1 << position
+
+    def mask(self, codes: Iterable[str]) -> int:
+        """
+        Compile permission codes into a mask.
+
+        Args:
+            codes: Permission codes
+
+        Returns:
+            int: Mask with the bit of every code set
+        """
+        mask = 0
+        for code in codes:
+            mask |= self.bit(code)
+        return mask
+
+    def codes(self, mask: int) -> List[str]:
+        """
+        Get the permission codes of a mask, in registration order.
+
+        Args:
+            mask: Permission mask
+
+        Returns:
+            List[str]: Codes whose bit is set
+        """
+        return [code for i, code in enumerate(self._codes) if mask >> i & 1]
+
+
+# Create singleton instance
+permission_registry = PermissionRegistry()
@@ -0,0 +1,66 @@
+"""
+Redis Client Module
+
+This module provides the shared async Redis client. Redis is optional: when
+REDIS_HOST is not set or the redis package is not installed, get_redis
+returns None and callers fall back to in-process implementations. State
+that must be shared between workers (refresh tokens, revoked tokens) has no
+such fallback when several workers run.
+"""
+from typing import Any, Optional
+
+from app.core.config import settings
+
+try:
+    from redis import asyncio as aioredis
+except ImportError:  # pragma: no cover - redis is an optional dependency
+    aioredis = None
+
+_client: Optional[Any] = None
+
+
+def get_redis() -> Optional[Any]:
+    """
+    Get the shared Redis client, creating it on first use.
+
+    Returns:
+        Optional[redis.asyncio.Redis]: Redis client or None if Redis is not configured
+    """
+    global _client
+
+    if _client is None and settings.REDIS_HOST and aioredis is not None:
+        _client = aioredis.Redis(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            socket_connect_timeout=settings.REDIS_TIMEOUT_SECONDS,
+            socket_timeout=settings.REDIS_TIMEOUT_SECONDS,
+        )
+    return _client
+
+
+def require_shared_redis(feature: str) -> None:
+    """
+    Refuse to run per-worker state when several workers serve the application.
+
+    Args:
+        feature: Name of the feature keeping the state, for the error message
+
+    Raises:
+        RuntimeError: If WEB_CONCURRENCY is above 1 and Redis is not configured
+    """
+    if settings.WEB_CONCURRENCY > 1 and get_redis() is None:
+        raise RuntimeError(
+            f"{feature} requires Redis (REDIS_HOST) with "
+            f"WEB_CONCURRENCY={settings.WEB_CONCURRENCY} workers: its in-process "
+            "fallback is not shared between workers. Configure Redis or run a "
+            "single worker (WEB_CONCURRENCY=1)."
+        )
+
+
+async def close_redis() -> None:
+    """Close the shared Redis client if it was created."""
+    global _client
+
+    if _client is not None:
+        await _client.aclose()
+        _client = None
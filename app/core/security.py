@@ -4,22 +4,41 @@ Security Module
 This module handles password hashing, JWT token creation and verification,
 and other security-related functionality.
 """
+import hashlib
+import time
+import uuid
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from jose import jwt
 from passlib.context import CryptContext
 
+from app.core.cache import TTLCache
 from app.core.config import settings
+from app.core.jwt_backend import load_key_set
+from app.core.metrics import register_cache
 
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Keys signing and verifying the application's tokens
+jwt_keys = load_key_set(settings)
+
+# Verified access token payloads keyed by the SHA-256 digest of the token,
+# each kept until the token expires
+access_token_cache: TTLCache[bytes, Dict[str, Any]] = TTLCache(
+    maxsize=settings.ACCESS_TOKEN_CACHE_MAX_SIZE, ttl=0
+)
+register_cache("access_token", access_token_cache)
+
 
 def create_access_token(
     subject: Union[str, Any],
     scopes: list = None,
     expires_delta: Optional[timedelta] = None,
+    roles: Optional[list] = None,
+    permissions_version: Optional[int] = None,
+    is_superuser: bool = False,
 ) -> str:
     """
     Create a JWT access token.
@@ -28,6 +47,9 @@ def create_access_token(
         subject: The subject of the token (typically user ID)
         scopes: Permission scopes to encode in the token
         expires_delta: Optional custom expiration time
+        roles: Role codes of the subject
+        permissions_version: User permissions version the scopes were built from
+        is_superuser: Whether the subject is a superuser
 
     Returns:
         str: Encoded JWT token
@@ -44,23 +66,37 @@ def create_access_token(
         "sub": str(subject),
         "type": "access",
         "iat": datetime.utcnow(),
+        "jti": uuid.uuid4().hex,
     }
 
     if scopes:
         to_encode["scopes"] = scopes
 
-    encoded_jwt = jwt.encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
-    )
+    if roles:
+        to_encode["roles"] = roles
+
+    if permissions_version is not None:
+        to_encode["pv"] = permissions_version
+
+    if is_superuser:
+        to_encode["su"] = True
+
+    encoded_jwt = jwt_keys.encode(to_encode)
     return encoded_jwt
 
 
-def create_refresh_token(subject: Union[str, Any]) -> str:
+def create_refresh_token(
+    subject: Union[str, Any],
+    jti: Optional[str] = None,
+    family: Optional[str] = None,
+) -> str:
     """
     Create a JWT refresh token with longer expiration.
 
     Args:
         subject: The subject of the token (typically user ID)
+        jti: Token ID registered in the refresh token store
+        family: ID shared by the tokens rotated from the same login
 
     Returns:
         str: Encoded JWT refresh token
@@ -72,9 +108,13 @@ def create_refresh_token(subject: Union[str, Any]) -> str:
         "type": "refresh",
         "iat": datetime.utcnow(),
     }
-    encoded_jwt = jwt.encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
-    )
+
+    if jti:
+        to_encode["jti"] = jti
+
+    if family:
+        to_encode["fam"] = family
+    encoded_jwt = jwt_keys.encode(to_encode)
     return encoded_jwt
 
 
@@ -105,6 +145,19 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def get_password_hashes(passwords: List[str]) -> List[str]:
+    """
+    Generate the hashes of a batch of passwords.
+
+    Args:
+        passwords: Plain-text passwords
+
+    Returns:
+        List[str]: Hashed passwords, in the same order
+    """
+    return [pwd_context.hash(password) for password in passwords]
+
+
 def decode_token(token: str) -> Dict[str, Any]:
     """
     Decode and validate a JWT token.
@@ -118,13 +171,16 @@ def decode_token(token: str) -> Dict[str, Any]:
     Raises:
         jwt.JWTError: If token is invalid or expired
     """
-    return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    return jwt_keys.decode(token)
 
 
 def validate_access_token(token: str) -> Dict[str, Any]:
     """
     Validate an access token and ensure it's not a refresh token.
 
+    Each distinct token is verified once; the payload is then served from
+    access_token_cache until the token expires.
+
     Args:
         token: JWT token to validate
 
@@ -134,10 +190,19 @@ def validate_access_token(token: str) -> Dict[str, Any]:
     Raises:
         jwt.JWTError: If token is invalid, expired, or wrong type
     """
+    key = hashlib.sha256(token.encode()).digest()
+    payload = access_token_cache.get(key)
+    if payload is not None:
+        return dict(payload)
+
     payload = decode_token(token)
     if payload.get("type") != "access":
         raise jwt.JWTError("Not an access token")
-    return payload
+
+    ttl = payload.get("exp", 0) - time.time()
+    if ttl > 0:
+        access_token_cache.set(key, payload, ttl=ttl)
+    return dict(payload)
 
 
 def validate_refresh_token(token: str) -> Dict[str, Any]:
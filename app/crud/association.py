@@ -0,0 +1,182 @@
+"""
+Association Sync Module
+
+This module keeps many-to-many association tables (user_role,
+role_permission) in step with sets of IDs. The difference is computed by
+the database: a sync is at most one batched DELETE and one
+INSERT ... SELECT that skips rows already present, however many owners and
+targets are involved, and no ORM collection is loaded.
+"""
+from typing import Any, List, NamedTuple, Sequence
+
+from sqlalchemy import Column, Table, and_, delete, exists, insert, select, true
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.expression import Insert, Select
+
+# Sync modes
+REPLACE = "replace"
+ADD = "add"
+REMOVE = "remove"
+SYNC_MODES = (REPLACE, ADD, REMOVE)
+
+# Dialects supporting INSERT ... ON CONFLICT DO NOTHING
+ON_CONFLICT_DIALECTS = ("postgresql", "sqlite")
+
+
+def insert_ignoring_conflicts(
+    dialect_name: str, table: Table, columns: List[str], query: Select
+) -> Insert:
+    """
+    Build an INSERT ... SELECT that skips rows violating a unique constraint.
+
+    Dialects outside ON_CONFLICT_DIALECTS get a plain INSERT ... SELECT; the
+    query must then exclude existing rows itself.
+
+    Args:
+        dialect_name: Name of the database dialect
+        table: Table to insert into
+        columns: Names of the columns filled by the query
+        query: SELECT producing the rows
+
+    Returns:
+        Insert: Insert statement
+    """
+    if dialect_name == "postgresql":
+        statement = postgresql_insert(table)
+    elif dialect_name == "sqlite":
+        statement = sqlite_insert(table)
+    else:
+        return insert(table).from_select(columns, query)
+    return statement.from_select(columns, query).on_conflict_do_nothing()
+
+
+class SyncResult(NamedTuple):
+    """Number of association rows added and removed by a sync."""
+
+    added: int
+    removed: int
+
+    @property
+    def changed(self) -> bool:
+        """Whether any row was added or removed."""
+        return bool(self.added or self.removed)
+
+
+class AssociationSync:
+    """
+    Set-based updates of an association table.
+
+    Attributes:
+        table: Association table
+        owner_column: Column referencing the owner (e.g. user_role.user_id)
+        target_column: Column referencing the target (e.g. user_role.role_id)
+    """
+
+    def __init__(self, table: Table, owner_column: Column, target_column: Column):
+        """
+        Initialize for an association table.
+
+        Args:
+            table: Association table
+            owner_column: Column referencing the owner
+            target_column: Column referencing the target
+        """
+        self.table = table
+        self.owner_column = owner_column
+        self.target_column = target_column
+        # Columns referenced by the foreign keys, used to ignore unknown IDs
+        self._owner_key = next(iter(owner_column.foreign_keys)).column
+        self._target_key = next(iter(target_column.foreign_keys)).column
+
+    def _insert_missing(
+        self, dialect_name: str, owner_ids: Any, target_ids: Sequence[str]
+    ) -> Insert:
+        """
+        Build an INSERT ... SELECT of the existing owner/target pairs.
+
+        Pairs already associated are skipped with ON CONFLICT DO NOTHING where
+        the dialect supports it, otherwise with a NOT EXISTS guard.
+
+        Args:
+            dialect_name: Name of the database dialect
+            owner_ids: List of owner IDs or a subquery selecting them
+            target_ids: Target IDs
+
+        Returns:
+            Insert: Insert statement
+        """
+        # Every owner paired with every target: a deliberate cross join
+        pairs = (
+            select(self._owner_key, self._target_key)
+            .select_from(self._owner_key.table.join(self._target_key.table, true()))
+            .where(self._owner_key.in_(owner_ids), self._target_key.in_(target_ids))
+        )
+        columns = [self.owner_column.name, self.target_column.name]
+
+        if dialect_name not in ON_CONFLICT_DIALECTS:
+            pairs = pairs.where(
+                ~exists().where(
+                    and_(
+                        self.owner_column == self._owner_key,
+                        self.target_column == self._target_key,
+                    )
+                )
+            )
+        return insert_ignoring_conflicts(dialect_name, self.table, columns, pairs)
+
+    async def sync(
+        self,
+        db: AsyncSession,
+        *,
+        owner_ids: Any,
+        target_ids: Sequence[str],
+        mode: str = REPLACE,
+    ) -> SyncResult:
+        """
+        Update the targets associated with a set of owners.
+
+        Modes:
+            replace: the owners end up associated with exactly target_ids
+            add: target_ids are associated with the owners, others are kept
+            remove: target_ids are dissociated from the owners, others are kept
+
+        IDs that match no row are ignored.
+
+        Args:
+            db: Database session
+            owner_ids: List of owner IDs or a subquery selecting them
+            target_ids: Target IDs
+            mode: REPLACE, ADD or REMOVE
+
+        Returns:
+            SyncResult: Number of association rows added and removed
+
+        Raises:
+            ValueError: If the mode is unknown
+        """
+        if mode not in SYNC_MODES:
+            raise ValueError(f"Unknown association sync mode: {mode}")
+
+        target_ids = list(dict.fromkeys(target_ids))
+        removed = added = 0
+
+        if mode != ADD:
+            query = delete(self.table).where(self.owner_column.in_(owner_ids))
+            if mode == REMOVE:
+                query = query.where(self.target_column.in_(target_ids))
+            elif target_ids:
+                query = query.where(self.target_column.not_in(target_ids))
+            if mode == REPLACE or target_ids:
+                result = await db.execute(query)
+                removed = result.rowcount
+
+        if mode != REMOVE and target_ids:
+            dialect_name = db.get_bind().dialect.name
+            result = await db.execute(
+                self._insert_missing(dialect_name, owner_ids, target_ids)
+            )
+            added = result.rowcount
+
+        return SyncResult(added=added, removed=removed)
@@ -3,21 +3,35 @@ Base CRUD Module
 
 This module defines a generic base CRUD class with common database operations.
 """
+import re
 from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from uuid import UUID
 
-from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, delete, func, insert, select, text, tuple_, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.expression import Select
 
+from app.core.exceptions import ConflictError
+from app.crud.search import ContainsSearch, SearchBackend
 from app.db.base import Base
+from app.models.loading import get_loader_options
+from app.utils.pagination import Page, decode_cursor, encode_cursor
 
 # Define generic types for models and schemas
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
+# SQLSTATE of a unique constraint violation
+UNIQUE_VIOLATION = "23505"
+
+# Column named by a unique violation message:
+# PostgreSQL "Key (email)=(...) already exists."
+# SQLite "UNIQUE constraint failed: user.email"
+_UNIQUE_COLUMN = re.compile(r"Key \((\w+)\)=|UNIQUE constraint failed: \w+\.(\w+)")
+
 
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """
@@ -25,8 +39,16 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
     Attributes:
         model: SQLAlchemy model class
+        cursor_columns: Unique, indexed sort key used for ordering and
+            keyset pagination
+        search_fields: Columns matched by free-text search
+        search_backend: Strategy turning a search term into a predicate,
+            chosen to match the indexes declared on the model
     """
 
+    search_fields: List[Any] = []
+    search_backend: SearchBackend = ContainsSearch()
+
     def __init__(self, model: Type[ModelType]):
         """
         Initialize with SQLAlchemy model class.
@@ -35,19 +57,35 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             model: SQLAlchemy model class
         """
         self.model = model
+        self.cursor_columns = [model.created_at, model.id]
 
-    async def get(self, db: AsyncSession, id: Any) -> Optional[ModelType]:
+    def get_query(self, profile: Optional[str] = None) -> Select:
+        """
+        Build a SELECT for the model with a loading profile applied.
+
+        Args:
+            profile: Loading profile name (see app.models.loading)
+
+        Returns:
+            Select: Base query for the model
+        """
+        return select(self.model).options(*get_loader_options(self.model, profile))
+
+    async def get(
+        self, db: AsyncSession, id: Any, *, profile: Optional[str] = None
+    ) -> Optional[ModelType]:
         """
         Get a single record by ID.
 
         Args:
             db: Database session
             id: Record ID
+            profile: Loading profile deciding which relationships are loaded
 
         Returns:
             Optional[ModelType]: Found record or None
         """
-        query = select(self.model).where(self.model.id == id)
+        query = self.get_query(profile).where(self.model.id == id)
         result = await db.execute(query)
         return result.scalars().first()
 
@@ -58,28 +96,168 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         skip: int = 0,
         limit: int = 100,
         filters: Optional[List[Any]] = None,
+        profile: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> List[ModelType]:
         """
         Get multiple records with pagination and optional filters.
 
+        Records are ordered by cursor_columns. When a cursor is given, the
+        page starts right after the row it points to (keyset pagination) and
+        skip is ignored.
+
         Args:
             db: Database session
             skip: Number of records to skip
             limit: Maximum number of records to return
             filters: Optional list of filter conditions
+            profile: Loading profile deciding which relationships are loaded
+            cursor: Optional cursor returned by get_next_cursor
 
         Returns:
             List[ModelType]: List of records
         """
-        query = select(self.model)
+        query = self.get_list_query(
+            skip=skip, limit=limit, filters=filters, profile=profile, cursor=cursor
+        )
+        result = await db.execute(query)
+        return result.scalars().all()
+
+    def get_list_query(
+        self,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[List[Any]] = None,
+        profile: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> Select:
+        """
+        Build the ordered, paginated query shared by get_multi and get_page.
+
+        Args:
+            skip: Number of records to skip (ignored with a cursor)
+            limit: Maximum number of records to return
+            filters: Optional list of filter conditions
+            profile: Loading profile deciding which relationships are loaded
+            cursor: Optional cursor returned by get_next_cursor
+
+        Returns:
+            Select: Paginated query
+        """
+        query = self.get_query(profile)
 
         if filters:
             query = query.where(and_(*filters))
 
-        query = query.offset(skip).limit(limit)
+        if cursor:
+            # IDs are UUID strings, see app.db.base.Base
+            types = [
+                UUID if c is self.model.id else c.type.python_type
+                for c in self.cursor_columns
+            ]
+            values = decode_cursor(cursor, types)
+            query = query.where(
+                tuple_(*self.cursor_columns)
+                > tuple_(*values, types=[c.type for c in self.cursor_columns])
+            )
+        else:
+            query = query.offset(skip)
 
-        result = await db.execute(query)
-        return result.scalars().all()
+        return query.order_by(*self.cursor_columns).limit(limit)
+
+    async def get_page(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[List[Any]] = None,
+        profile: Optional[str] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+        approximate_total: bool = False,
+    ) -> Page:
+        """
+        Get a page of records together with its total in a single round trip.
+
+        One extra row is fetched to tell whether a next page exists. The
+        exact total is read from a COUNT(*) OVER () window on the page query;
+        a separate COUNT only runs for cursor pages and for empty pages past
+        the end. With approximate_total, unfiltered lists use the planner
+        estimate from get_estimated_count instead.
+
+        Args:
+            db: Database session
+            skip: Number of records to skip (ignored with a cursor)
+            limit: Maximum number of records to return
+            filters: Optional list of filter conditions
+            profile: Loading profile deciding which relationships are loaded
+            cursor: Optional cursor returned by get_next_cursor
+            include_total: Whether to compute the total number of records
+            approximate_total: Whether an estimate is acceptable for the total
+
+        Returns:
+            Page: Records of the page, total and next page information
+        """
+        query = self.get_list_query(
+            skip=skip, limit=limit + 1, filters=filters, profile=profile, cursor=cursor
+        )
+
+        total: Optional[int] = None
+        total_estimated = False
+        estimate = include_total and approximate_total and not filters
+
+        # A window count after a cursor would only count the remaining rows
+        if include_total and not estimate and not cursor:
+            query = query.add_columns(func.count().over().label("total_count"))
+            rows = (await db.execute(query)).all()
+            items = [row[0] for row in rows]
+            if rows:
+                total = rows[0].total_count
+            elif skip == 0:
+                total = 0
+        else:
+            items = list((await db.execute(query)).scalars().all())
+
+        has_next = len(items) > limit
+        items = items[:limit]
+
+        if estimate:
+            total = await self.get_estimated_count(db)
+            if total is not None:
+                total_estimated = True
+                if not cursor:
+                    # Never report fewer records than the pages already walked
+                    total = max(total, skip + len(items) + int(has_next))
+
+        if include_total and total is None:
+            total = await self.get_count(db, filters=filters)
+
+        return Page(
+            items=items,
+            total=total,
+            has_next=has_next,
+            next_cursor=self.get_next_cursor(items, limit) if has_next else None,
+            total_estimated=total_estimated,
+        )
+
+    def get_next_cursor(self, items: List[ModelType], limit: int) -> Optional[str]:
+        """
+        Get the cursor of the page following a full page of records.
+
+        Args:
+            items: Records of the current page, as returned by get_multi
+            limit: Page size used to fetch the records
+
+        Returns:
+            Optional[str]: Cursor for the next page, or None on a partial page
+        """
+        if not items or len(items) < limit:
+            return None
+
+        last = items[-1]
+        return encode_cursor([getattr(last, c.key) for c in self.cursor_columns])
 
     async def get_count(
         self,
@@ -104,6 +282,127 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         result = await db.execute(query)
         return result.scalar() or 0
 
+    async def get_estimated_count(self, db: AsyncSession) -> Optional[int]:
+        """
+        Get the planner's row estimate for the whole table.
+
+        Only available on PostgreSQL, once the table has been analyzed.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Optional[int]: Estimated number of records or None if unavailable
+        """
+        dialect = db.get_bind().dialect
+        if dialect.name != "postgresql":
+            return None
+
+        table_name = dialect.identifier_preparer.format_table(self.model.__table__)
+        result = await db.execute(
+            text(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)"
+            ),
+            {"name": table_name},
+        )
+        estimate = result.scalar()
+        return estimate if estimate is not None and estimate >= 0 else None
+
+    def column_values(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Keep the entries of a dict that name a column of the model's table.
+
+        Args:
+            data: Field values, possibly including non-column fields
+
+        Returns:
+            Dict[str, Any]: Column values
+        """
+        columns = self.model.__table__.columns
+        return {key: value for key, value in data.items() if key in columns}
+
+    def conflicting_field(self, error: IntegrityError) -> Optional[str]:
+        """
+        Find the column whose unique constraint an integrity error violated.
+
+        Args:
+            error: Error raised by an INSERT or UPDATE
+
+        Returns:
+            Optional[str]: Column name, None if the error is not a unique
+            violation on a column of the model
+        """
+        orig = error.orig
+        sqlstate = getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)
+        if sqlstate is not None and sqlstate != UNIQUE_VIOLATION:
+            return None
+
+        # asyncpg raises the error the DBAPI adapter wraps
+        cause = orig.__cause__ or orig
+        columns = self.model.__table__.columns
+        match = _UNIQUE_COLUMN.search(str(getattr(cause, "detail", None) or orig))
+        if match:
+            field = match.group(1) or match.group(2)
+            return field if field in columns else None
+
+        constraint = getattr(cause, "constraint_name", None)
+        for column in columns:
+            if column.unique and constraint and column.name in constraint:
+                return column.name
+        return None
+
+    async def execute_write(self, db: AsyncSession, query: Any) -> Any:
+        """
+        Execute a write, reporting unique violations as conflicts.
+
+        The database enforces uniqueness, so no SELECT is needed beforehand
+        and concurrent writes of the same value cannot both succeed. The
+        failed statement aborts the transaction, which the request then
+        rolls back.
+
+        Args:
+            db: Database session
+            query: INSERT or UPDATE statement
+
+        Returns:
+            Result of the statement
+
+        Raises:
+            ConflictError: If a unique column of the model already holds the value
+        """
+        try:
+            return await db.execute(query)
+        except IntegrityError as e:
+            field = self.conflicting_field(e)
+            if field is None:
+                raise
+            raise ConflictError(
+                f"{self.model.__name__} with this {field} already exists",
+                field=field,
+            ) from e
+
+    async def insert(self, db: AsyncSession, *, values: Dict[str, Any]) -> ModelType:
+        """
+        Insert a record in a single INSERT ... RETURNING statement.
+
+        Args:
+            db: Database session
+            values: Column values; server defaults fill the missing ones
+
+        Returns:
+            ModelType: Inserted record, with no relationships loaded
+
+        Raises:
+            ConflictError: If a unique column already holds one of the values
+        """
+        query = (
+            insert(self.model)
+            .values(**self.column_values(values))
+            .returning(self.model)
+        )
+        result = await self.execute_write(db, query)
+        return result.scalars().one()
+
     async def create(self, db: AsyncSession, *, obj_in: CreateSchemaType) -> ModelType:
         """
         Create a new record.
@@ -114,13 +413,55 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         Returns:
             ModelType: Created record
+
+        Raises:
+            ConflictError: If a unique column already holds one of the values
+        """
+        return await self.insert(db, values=obj_in.model_dump())
+
+    async def update_by_id(
+        self,
+        db: AsyncSession,
+        *,
+        id: Any,
+        obj_in: Union[UpdateSchemaType, Dict[str, Any]],
+    ) -> Optional[ModelType]:
         """
-        obj_in_data = jsonable_encoder(obj_in)
-        db_obj = self.model(**obj_in_data)
-        db.add(db_obj)
-        await db.flush()
-        await db.refresh(db_obj)
-        return db_obj
+        Update a record by ID in a single UPDATE ... RETURNING statement.
+
+        Only the fields set on the schema (or present in the dict) are
+        written; values may be SQL expressions such as ``Model.counter + 1``.
+        A copy of the record already in the session is refreshed in place.
+
+        Args:
+            db: Database session
+            id: Record ID
+            obj_in: Update schema or dict with fields to update
+
+        Returns:
+            Optional[ModelType]: Updated record or None if not found
+
+        Raises:
+            ConflictError: If a unique column already holds one of the values
+        """
+        if isinstance(obj_in, dict):
+            update_data = obj_in
+        else:
+            update_data = obj_in.model_dump(exclude_unset=True)
+
+        values = self.column_values(update_data)
+        if not values:
+            return await self.get(db, id)
+
+        query = (
+            update(self.model)
+            .where(self.model.id == id)
+            .values(**values)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.execute_write(db, query)
+        return result.scalars().first()
 
     async def update(
         self,
@@ -139,45 +480,160 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         Returns:
             ModelType: Updated record
+
+        Raises:
+            ConflictError: If a unique column already holds one of the values
+        """
+        updated = await self.update_by_id(db, id=db_obj.id, obj_in=obj_in)
+        return updated if updated is not None else db_obj
+
+    async def remove(self, db: AsyncSession, *, id: Any) -> Optional[ModelType]:
+        """
+        Delete a record by ID in a single DELETE ... RETURNING statement.
+
+        Args:
+            db: Database session
+            id: Record ID
+
+        Returns:
+            Optional[ModelType]: Deleted record or None
+        """
+        query = delete(self.model).where(self.model.id == id).returning(self.model)
+        result = await db.execute(query)
+        return result.scalars().first()
+
+    def get_bulk_filters(
+        self,
+        *,
+        ids: Optional[List[Any]] = None,
+        search: Optional[str] = None,
+        **columns: Any,
+    ) -> List[Any]:
+        """
+        Build the conditions selecting the records of a bulk operation.
+
+        Args:
+            ids: Record IDs
+            search: Search term, matched like in listings
+            **columns: Column values to match, None values are ignored
+
+        Returns:
+            List[Any]: Filter conditions, all of which must match
+        """
+        filters = []
+        if ids is not None:
+            filters.append(self.model.id.in_(ids))
+        search_filter = self.get_search_filter(search)
+        if search_filter is not None:
+            filters.append(search_filter)
+        for name, value in columns.items():
+            if value is not None:
+                filters.append(getattr(self.model, name) == value)
+        return filters
+
+    async def update_many(
+        self,
+        db: AsyncSession,
+        *,
+        filters: List[Any],
+        obj_in: Union[UpdateSchemaType, Dict[str, Any]],
+        dry_run: bool = False,
+        returning: Optional[Any] = None,
+    ) -> List[Any]:
         """
-        obj_data = jsonable_encoder(db_obj)
+        Update every matching record in a single UPDATE ... RETURNING statement.
+
+        Copies of the records already in the session are not refreshed.
+
+        Args:
+            db: Database session
+            filters: Conditions selecting the records
+            obj_in: Update schema or dict with fields to update
+            dry_run: Only select the records that would be updated
+            returning: Column returned per record, the ID by default
+
+        Returns:
+            List[Any]: Returned column of each updated record
+
+        Raises:
+            ConflictError: If a unique column already holds one of the values
+        """
+        returning = self.model.id if returning is None else returning
 
         if isinstance(obj_in, dict):
             update_data = obj_in
         else:
             update_data = obj_in.model_dump(exclude_unset=True)
 
-        for field in obj_data:
-            if field in update_data:
-                setattr(db_obj, field, update_data[field])
+        values = self.column_values(update_data)
+        if dry_run or not values:
+            result = await db.execute(select(returning).where(*filters))
+            return list(result.scalars())
+
+        query = (
+            update(self.model)
+            .where(*filters)
+            .values(**values)
+            .returning(returning)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.execute_write(db, query)
+        return list(result.scalars())
+
+    async def remove_many(
+        self,
+        db: AsyncSession,
+        *,
+        filters: List[Any],
+        dry_run: bool = False,
+        returning: Optional[Any] = None,
+    ) -> List[Any]:
+        """
+        Delete every matching record in a single DELETE ... RETURNING statement.
 
-        db.add(db_obj)
-        await db.flush()
-        await db.refresh(db_obj)
-        return db_obj
+        Args:
+            db: Database session
+            filters: Conditions selecting the records
+            dry_run: Only select the records that would be deleted
+            returning: Column returned per record, the ID by default
 
-    async def remove(self, db: AsyncSession, *, id: Any) -> Optional[ModelType]:
+        Returns:
+            List[Any]: Returned column of each deleted record
         """
-        Delete a record by ID.
+        returning = self.model.id if returning is None else returning
+
+        if dry_run:
+            result = await db.execute(select(returning).where(*filters))
+            return list(result.scalars())
+
+        query = (
+            delete(self.model)
+            .where(*filters)
+            .returning(returning)
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.execute(query)
+        return list(result.scalars())
+
+    def get_search_filter(self, search_term: Optional[str]) -> Optional[Any]:
+        """
+        Build the search condition for a term using the configured backend.
 
         Args:
-            db: Database session
-            id: Record ID
+            search_term: Search term
 
         Returns:
-            Optional[ModelType]: Deleted record or None
+            Optional[Any]: Filter condition or None if there is nothing to search
         """
-        obj = await self.get(db, id)
-        if obj:
-            await db.delete(obj)
-            await db.flush()
-        return obj
+        if not search_term:
+            return None
+        return self.search_backend.build(self.search_fields, search_term)
 
     def get_search_query(
         self,
         query: Select,
         search_term: Optional[str],
-        search_fields: List[Any],
+        search_fields: Optional[List[Any]] = None,
     ) -> Select:
         """
         Add search conditions to query.
@@ -185,17 +641,14 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Args:
             query: Existing query
             search_term: Search term
-            search_fields: Fields to search in
+            search_fields: Fields to search in (defaults to search_fields)
 
         Returns:
             Select: Query with search conditions added
         """
-        if not search_term or not search_fields:
-            return query
-
-        # Create OR conditions for each search field
-        search_conditions = []
-        for field in search_fields:
-            search_conditions.append(field.ilike(f"%{search_term}%"))
+        if search_fields is None:
+            condition = self.get_search_filter(search_term)
+        else:
+            condition = self.search_backend.build(search_fields, search_term or "")
 
-        return query.where(or_(*search_conditions))
+        return query if condition is None else query.where(condition)
@@ -3,15 +3,17 @@ Permission CRUD Module
 
 This module defines CRUD operations specific to the Permission model.
 """
-from typing import Optional
+from typing import Any, Dict, List, Optional, Union
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.crud.base import CRUDBase
+from app.crud.user import user_crud
 from app.models.permission import Permission
+from app.models.role import role_permission
 from app.schemas.permission import PermissionCreate, PermissionUpdate
+from app.services.principal import principal_cache
 
 
 class CRUDPermission(CRUDBase[Permission, PermissionCreate, PermissionUpdate]):
@@ -21,6 +23,8 @@ class CRUDPermission(CRUDBase[Permission, PermissionCreate, PermissionUpdate]):
     Extends the base CRUD class with permission-specific operations.
     """
 
+    search_fields = [Permission.name, Permission.code]
+
     async def get_by_code(self, db: AsyncSession, *, code: str) -> Optional[Permission]:
         """
         Get a permission by code.
@@ -49,13 +53,171 @@ class CRUDPermission(CRUDBase[Permission, PermissionCreate, PermissionUpdate]):
         Returns:
             Optional[Permission]: Permission with roles or None
         """
-        query = (
-            select(Permission)
-            .options(selectinload(Permission.roles))
-            .where(Permission.id == permission_id)
+        return await self.get(db, permission_id, profile="roles")
+
+    async def update_by_id(
+        self,
+        db: AsyncSession,
+        *,
+        id: Any,
+        obj_in: Union[PermissionUpdate, Dict[str, Any]],
+    ) -> Optional[Permission]:
+        """
+        Update a permission by ID, dropping cached principals when its code changes.
+
+        Args:
+            db: Database session
+            id: Permission ID
+            obj_in: Permission update schema or dict
+
+        Returns:
+            Optional[Permission]: Updated permission or None if not found
+
+        Raises:
+            ConflictError: If the code is already used by another permission
+        """
+        renamed = await self.get_renamed_codes(db, [Permission.id == id], obj_in)
+        permission = await super().update_by_id(db, id=id, obj_in=obj_in)
+        await self.invalidate_renamed(db, renamed)
+        return permission
+
+    async def update_many(
+        self,
+        db: AsyncSession,
+        *,
+        filters: List[Any],
+        obj_in: Union[PermissionUpdate, Dict[str, Any]],
+        dry_run: bool = False,
+    ) -> List[Any]:
+        """
+        Update every matching permission, dropping cached principals on new codes.
+
+        Args:
+            db: Database session
+            filters: Conditions selecting the permissions
+            obj_in: Permission update schema or dict
+            dry_run: Only select the permissions that would be updated
+
+        Returns:
+            List[Any]: IDs of the updated permissions
+
+        Raises:
+            ConflictError: If the code is already used by another permission
+        """
+        renamed = {}
+        if not dry_run:
+            renamed = await self.get_renamed_codes(db, filters, obj_in)
+        permission_ids = await super().update_many(
+            db, filters=filters, obj_in=obj_in, dry_run=dry_run
         )
-        result = await db.execute(query)
-        return result.scalars().first()
+        await self.invalidate_renamed(db, renamed)
+        return permission_ids
+
+    async def get_renamed_codes(
+        self,
+        db: AsyncSession,
+        filters: List[Any],
+        obj_in: Union[PermissionUpdate, Dict[str, Any]],
+    ) -> Dict[Any, str]:
+        """
+        Get the current codes of the permissions an update gives a new code.
+
+        Args:
+            db: Database session
+            filters: Conditions selecting the updated permissions
+            obj_in: Permission update schema or dict
+
+        Returns:
+            Dict[Any, str]: Current code by permission ID, empty if the code is not set
+        """
+        if isinstance(obj_in, dict):
+            code = obj_in.get("code")
+        else:
+            code = obj_in.model_dump(exclude_unset=True).get("code")
+        if code is None:
+            return {}
+
+        query = select(Permission.id, Permission.code).where(
+            *filters, Permission.code != code
+        )
+        return dict((await db.execute(query)).all())
+
+    async def invalidate_renamed(
+        self, db: AsyncSession, renamed: Dict[Any, str]
+    ) -> None:
+        """
+        Bump holders of renamed permissions and drop principals granted the old codes.
+
+        Args:
+            db: Database session
+            renamed: Previous code by permission ID
+        """
+        if renamed:
+            await user_crud.bump_permissions_version(
+                db,
+                role_ids=select(role_permission.c.role_id).where(
+                    role_permission.c.permission_id.in_(list(renamed))
+                ),
+            )
+            principal_cache.invalidate_permissions_on_commit(db, renamed.values())
+
+    async def remove(self, db: AsyncSession, *, id: Any) -> Optional[Permission]:
+        """
+        Delete a permission by ID and drop cached principals granted it.
+
+        Args:
+            db: Database session
+            id: Permission ID
+
+        Returns:
+            Optional[Permission]: Deleted permission or None
+        """
+        # Bump holders before the association rows are cascaded away
+        await user_crud.bump_permissions_version(
+            db,
+            role_ids=select(role_permission.c.role_id).where(
+                role_permission.c.permission_id == id
+            ),
+        )
+        obj = await super().remove(db, id=id)
+        if obj:
+            principal_cache.invalidate_permissions_on_commit(db, [obj.code])
+        return obj
+
+    async def remove_many(
+        self,
+        db: AsyncSession,
+        *,
+        filters: List[Any],
+        dry_run: bool = False,
+    ) -> List[Any]:
+        """
+        Delete every matching permission and drop cached principals granted them.
+
+        Args:
+            db: Database session
+            filters: Conditions selecting the permissions
+            dry_run: Only select the permissions that would be deleted
+
+        Returns:
+            List[Any]: Codes of the deleted permissions
+        """
+        if not dry_run:
+            # Bump holders before the association rows are cascaded away
+            await user_crud.bump_permissions_version(
+                db,
+                role_ids=select(role_permission.c.role_id).where(
+                    role_permission.c.permission_id.in_(
+                        select(Permission.id).where(*filters)
+                    )
+                ),
+            )
+        codes = await super().remove_many(
+            db, filters=filters, dry_run=dry_run, returning=Permission.code
+        )
+        if not dry_run:
+            principal_cache.invalidate_permissions_on_commit(db, codes)
+        return codes
 
 
 # Create singleton instance
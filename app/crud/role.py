@@ -3,16 +3,19 @@ Role CRUD Module
 
 This module defines CRUD operations specific to the Role model.
 """
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
+from app.crud.association import REPLACE, AssociationSync, SyncResult
 from app.crud.base import CRUDBase
+from app.crud.user import user_crud
 from app.models.permission import Permission
-from app.models.role import Role
+from app.models.role import Role, role_permission
 from app.schemas.role import RoleCreate, RoleUpdate
+from app.services.principal import principal_cache
 
 
 class CRUDRole(CRUDBase[Role, RoleCreate, RoleUpdate]):
@@ -22,6 +25,8 @@ class CRUDRole(CRUDBase[Role, RoleCreate, RoleUpdate]):
     Extends the base CRUD class with role-specific operations.
     """
 
+    search_fields = [Role.name, Role.code]
+
     async def get_by_code(self, db: AsyncSession, *, code: str) -> Optional[Role]:
         """
         Get a role by code.
@@ -50,13 +55,7 @@ class CRUDRole(CRUDBase[Role, RoleCreate, RoleUpdate]):
         Returns:
             Optional[Role]: Role with permissions or None
         """
-        query = (
-            select(Role)
-            .options(selectinload(Role.permissions))
-            .where(Role.id == role_id)
-        )
-        result = await db.execute(query)
-        return result.scalars().first()
+        return await self.get(db, role_id, profile="detail")
 
     async def create_with_permissions(
         self, db: AsyncSession, *, obj_in: RoleCreate, permission_ids: List[str]
@@ -75,6 +74,9 @@ class CRUDRole(CRUDBase[Role, RoleCreate, RoleUpdate]):
         # Create role
         role = await self.create(db, obj_in=obj_in)
 
+        # A new role has no permissions yet, no need to load the collection
+        set_committed_value(role, "permissions", [])
+
         # Assign permissions if provided
         if permission_ids:
             query = select(Permission).where(Permission.id.in_(permission_ids))
@@ -83,15 +85,46 @@ class CRUDRole(CRUDBase[Role, RoleCreate, RoleUpdate]):
             role.permissions = permissions
             db.add(role)
             await db.flush()
-            await db.refresh(role)
 
         return role
 
+    async def sync_permissions(
+        self,
+        db: AsyncSession,
+        *,
+        role_ids: List[str],
+        permission_ids: List[str],
+        mode: str = REPLACE,
+    ) -> SyncResult:
+        """
+        Grant, revoke or replace permissions of many roles at once.
+
+        Holders of the roles whose permissions change get their permissions
+        version bumped and their cached principals dropped.
+
+        Args:
+            db: Database session
+            role_ids: IDs of the roles to update
+            permission_ids: Permission IDs to assign, add or remove
+            mode: REPLACE, ADD or REMOVE (see app.crud.association)
+
+        Returns:
+            SyncResult: Number of permission grants added and removed
+        """
+        result = await role_permission_sync.sync(
+            db, owner_ids=role_ids, target_ids=permission_ids, mode=mode
+        )
+        if result.changed:
+            await user_crud.bump_permissions_version(db, role_ids=role_ids)
+            codes = await db.scalars(select(Role.code).where(Role.id.in_(role_ids)))
+            principal_cache.invalidate_roles_on_commit(db, codes)
+        return result
+
     async def update_role_permissions(
         self, db: AsyncSession, *, role_id: str, permission_ids: List[str]
     ) -> Optional[Role]:
         """
-        Update role's permissions.
+        Replace role's permissions.
 
         Args:
             db: Database session
@@ -101,23 +134,166 @@ class CRUDRole(CRUDBase[Role, RoleCreate, RoleUpdate]):
         Returns:
             Optional[Role]: Updated role with permissions or None
         """
-        role = await self.get_with_permissions(db, role_id=role_id)
-        if not role:
-            return None
+        await self.sync_permissions(
+            db, role_ids=[role_id], permission_ids=permission_ids
+        )
 
-        # Get permissions by IDs
-        query = select(Permission).where(Permission.id.in_(permission_ids))
+        # Reload over any copy in the session, its permissions may be stale
+        query = (
+            self.get_query("detail")
+            .where(Role.id == role_id)
+            .execution_options(populate_existing=True)
+        )
         result = await db.execute(query)
-        permissions = result.scalars().all()
+        return result.scalars().first()
+
+    async def update_by_id(
+        self,
+        db: AsyncSession,
+        *,
+        id: Any,
+        obj_in: Union[RoleUpdate, Dict[str, Any]],
+    ) -> Optional[Role]:
+        """
+        Update a role by ID, dropping cached principals when its code changes.
+
+        Args:
+            db: Database session
+            id: Role ID
+            obj_in: Role update schema or dict
 
-        # Update role's permissions
-        role.permissions = permissions
-        db.add(role)
-        await db.flush()
-        await db.refresh(role)
+        Returns:
+            Optional[Role]: Updated role or None if not found
 
+        Raises:
+            ConflictError: If the code is already used by another role
+        """
+        renamed = await self.get_renamed_codes(db, [Role.id == id], obj_in)
+        role = await super().update_by_id(db, id=id, obj_in=obj_in)
+        await self.invalidate_renamed(db, renamed)
         return role
 
+    async def update_many(
+        self,
+        db: AsyncSession,
+        *,
+        filters: List[Any],
+        obj_in: Union[RoleUpdate, Dict[str, Any]],
+        dry_run: bool = False,
+    ) -> List[Any]:
+        """
+        Update every matching role, dropping cached principals when codes change.
+
+        Args:
+            db: Database session
+            filters: Conditions selecting the roles
+            obj_in: Role update schema or dict
+            dry_run: Only select the roles that would be updated
+
+        Returns:
+            List[Any]: IDs of the updated roles
+
+        Raises:
+            ConflictError: If the code is already used by another role
+        """
+        renamed = {}
+        if not dry_run:
+            renamed = await self.get_renamed_codes(db, filters, obj_in)
+        role_ids = await super().update_many(
+            db, filters=filters, obj_in=obj_in, dry_run=dry_run
+        )
+        await self.invalidate_renamed(db, renamed)
+        return role_ids
+
+    async def get_renamed_codes(
+        self,
+        db: AsyncSession,
+        filters: List[Any],
+        obj_in: Union[RoleUpdate, Dict[str, Any]],
+    ) -> Dict[Any, str]:
+        """
+        Get the current codes of the roles an update gives a new code.
+
+        Args:
+            db: Database session
+            filters: Conditions selecting the updated roles
+            obj_in: Role update schema or dict
+
+        Returns:
+            Dict[Any, str]: Current code by role ID, empty if the code is not set
+        """
+        if isinstance(obj_in, dict):
+            code = obj_in.get("code")
+        else:
+            code = obj_in.model_dump(exclude_unset=True).get("code")
+        if code is None:
+            return {}
+
+        query = select(Role.id, Role.code).where(*filters, Role.code != code)
+        return dict((await db.execute(query)).all())
+
+    async def invalidate_renamed(
+        self, db: AsyncSession, renamed: Dict[Any, str]
+    ) -> None:
+        """
+        Bump holders of renamed roles and drop principals holding the old codes.
+
+        Args:
+            db: Database session
+            renamed: Previous code by role ID
+        """
+        if renamed:
+            await user_crud.bump_permissions_version(db, role_ids=list(renamed))
+            principal_cache.invalidate_roles_on_commit(db, renamed.values())
+
+    async def remove(self, db: AsyncSession, *, id: Any) -> Optional[Role]:
+        """
+        Delete a role by ID and drop cached principals holding it.
+
+        Args:
+            db: Database session
+            id: Role ID
+
+        Returns:
+            Optional[Role]: Deleted role or None
+        """
+        # Bump holders before the association rows are cascaded away
+        await user_crud.bump_permissions_version(db, role_ids=[id])
+        obj = await super().remove(db, id=id)
+        if obj:
+            principal_cache.invalidate_roles_on_commit(db, [obj.code])
+        return obj
+
+    async def remove_many(
+        self,
+        db: AsyncSession,
+        *,
+        filters: List[Any],
+        dry_run: bool = False,
+    ) -> List[Any]:
+        """
+        Delete every matching role and drop cached principals holding them.
+
+        Args:
+            db: Database session
+            filters: Conditions selecting the roles
+            dry_run: Only select the roles that would be deleted
+
+        Returns:
+            List[Any]: Codes of the deleted roles
+        """
+        if not dry_run:
+            # Bump holders before the association rows are cascaded away
+            await user_crud.bump_permissions_version(
+                db, role_ids=select(Role.id).where(*filters)
+            )
+        codes = await super().remove_many(
+            db, filters=filters, dry_run=dry_run, returning=Role.code
+        )
+        if not dry_run:
+            principal_cache.invalidate_roles_on_commit(db, codes)
+        return codes
+
     async def get_role_with_users(
         self, db: AsyncSession, *, role_id: str
     ) -> Optional[Role]:
@@ -131,10 +307,11 @@ class CRUDRole(CRUDBase[Role, RoleCreate, RoleUpdate]):
         Returns:
             Optional[Role]: Role with users or None
         """
-        query = select(Role).options(selectinload(Role.users)).where(Role.id == role_id)
-        result = await db.execute(query)
-        return result.scalars().first()
+        return await self.get(db, role_id, profile="users")
 
 
-# Create singleton instance
+# Create singleton instances
+role_permission_sync = AssociationSync(
+    role_permission, role_permission.c.role_id, role_permission.c.permission_id
+)
 role_crud = CRUDRole(Role)
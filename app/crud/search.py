@@ -0,0 +1,102 @@
+"""
+Search Backends Module
+
+This module defines the strategies used to turn a free-text search term into
+a SQL predicate. Each CRUD class picks the backend matching the indexes
+declared on its model.
+"""
+from typing import Any, List, Optional
+
+from sqlalchemy import func, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def escape_like(term: str, escape: str = "\\") -> str:
+    """
+    Escape LIKE wildcards in a user-supplied term.
+
+    Args:
+        term: Raw search term
+        escape: Escape character used in the LIKE clause
+
+    Returns:
+        str: Term matching itself literally in a LIKE pattern
+    """
+    return (
+        term.replace(escape, escape * 2)
+        .replace("%", f"{escape}%")
+        .replace("_", f"{escape}_")
+    )
+
+
+class SearchBackend:
+    """
+    Base class of search strategies.
+
+    Subclasses implement build, returning a predicate matching rows where
+    any of the given fields matches the term.
+    """
+
+    def build(self, fields: List[Any], term: str) -> Optional[ColumnElement]:
+        """
+        Build the search predicate.
+
+        Args:
+            fields: Model columns to search in
+            term: Search term
+
+        Returns:
+            Optional[ColumnElement]: Predicate or None if there is nothing to match
+        """
+        raise NotImplementedError
+
+
+class ContainsSearch(SearchBackend):
+    """
+    Case-insensitive substring search (ILIKE '%term%').
+
+    On PostgreSQL this is served by GIN indexes using gin_trgm_ops (pg_trgm)
+    for terms of at least three characters.
+    """
+
+    def build(self, fields: List[Any], term: str) -> Optional[ColumnElement]:
+        """
+        Build an ILIKE '%term%' predicate over the fields.
+
+        Args:
+            fields: Model columns to search in
+            term: Search term
+
+        Returns:
+            Optional[ColumnElement]: Predicate or None if there is nothing to match
+        """
+        if not term or not fields:
+            return None
+
+        pattern = f"%{escape_like(term)}%"
+        return or_(*(field.ilike(pattern, escape="\\") for field in fields))
+
+
+class PrefixSearch(SearchBackend):
+    """
+    Case-insensitive prefix search (lower(field) LIKE 'term%').
+
+    Served by B-tree indexes on lower(field) with text_pattern_ops.
+    """
+
+    def build(self, fields: List[Any], term: str) -> Optional[ColumnElement]:
+        """
+        Build a lower(field) LIKE 'term%' predicate over the fields.
+
+        Args:
+            fields: Model columns to search in
+            term: Search term
+
+        Returns:
+            Optional[ColumnElement]: Predicate or None if there is nothing to match
+        """
+        if not term or not fields:
+            return None
+
+        pattern = f"{escape_like(term.lower())}%"
+        return or_(*(func.lower(field).like(pattern, escape="\\") for field in fields))
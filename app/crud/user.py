@@ -3,17 +3,21 @@ User CRUD Module
 
 This module defines CRUD operations specific to the User model.
 """
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from sqlalchemy import select
+from sqlalchemy import case, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
-from app.core.security import get_password_hash, verify_password
+from app.crud.association import REPLACE, AssociationSync, SyncResult
 from app.crud.base import CRUDBase
+from app.crud.search import PrefixSearch, SearchBackend
 from app.models.role import Role
-from app.models.user import User
+from app.models.user import User, user_role
+from app.schemas.principal import Principal
 from app.schemas.user import UserCreate, UserUpdate
+from app.services.password import password_hasher
+from app.services.principal import principal_cache
 
 
 class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
@@ -23,18 +27,43 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
     Extends the base CRUD class with user-specific operations.
     """
 
-    async def get_by_email(self, db: AsyncSession, *, email: str) -> Optional[User]:
+    search_fields = [User.email, User.full_name]
+    email_search_backend: SearchBackend = PrefixSearch()
+
+    def get_search_filter(self, search_term: Optional[str]) -> Optional[Any]:
+        """
+        Build the search condition for a term.
+
+        Terms containing '@' after some text look like the start of an email
+        address and are matched as a prefix of the email only, which an index
+        can serve. Terms starting with '@' (e.g. '@example.com') keep the
+        substring search, so a whole domain can be found.
+
+        Args:
+            search_term: Search term
+
+        Returns:
+            Optional[Any]: Filter condition or None if there is nothing to search
+        """
+        if search_term and "@" in search_term and not search_term.startswith("@"):
+            return self.email_search_backend.build([User.email], search_term)
+        return super().get_search_filter(search_term)
+
+    async def get_by_email(
+        self, db: AsyncSession, *, email: str, profile: Optional[str] = None
+    ) -> Optional[User]:
         """
         Get a user by email.
 
         Args:
             db: Database session
             email: User email
+            profile: Loading profile deciding which relationships are loaded
 
         Returns:
             Optional[User]: Found user or None
         """
-        query = select(User).where(User.email == email)
+        query = self.get_query(profile).where(User.email == email)
         result = await db.execute(query)
         return result.scalars().first()
 
@@ -48,18 +77,20 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
 
         Returns:
             User: Created user
+
+        Raises:
+            ConflictError: If the email is already registered
         """
-        db_obj = User(
-            email=obj_in.email,
-            hashed_password=get_password_hash(obj_in.password),
-            full_name=obj_in.full_name,
-            is_active=obj_in.is_active,
-            is_superuser=obj_in.is_superuser,
+        return await self.insert(
+            db,
+            values={
+                "email": obj_in.email,
+                "hashed_password": await password_hasher.hash(obj_in.password),
+                "full_name": obj_in.full_name,
+                "is_active": obj_in.is_active,
+                "is_superuser": obj_in.is_superuser,
+            },
         )
-        db.add(db_obj)
-        await db.flush()
-        await db.refresh(db_obj)
-        return db_obj
 
     async def create_with_roles(
         self, db: AsyncSession, *, obj_in: UserCreate, role_ids: List[str]
@@ -78,6 +109,9 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         # Create user
         user = await self.create(db, obj_in=obj_in)
 
+        # A new user has no roles yet, no need to load the collection
+        set_committed_value(user, "roles", [])
+
         # Assign roles if provided
         if role_ids:
             query = select(Role).where(Role.id.in_(role_ids))
@@ -86,40 +120,155 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
             user.roles = roles
             db.add(user)
             await db.flush()
-            await db.refresh(user)
 
         return user
 
-    async def update(
+    async def update_by_id(
         self,
         db: AsyncSession,
         *,
-        db_obj: User,
+        id: Any,
         obj_in: Union[UserUpdate, Dict[str, Any]],
-    ) -> User:
+    ) -> Optional[User]:
         """
-        Update a user, handling password hashing if needed.
+        Update a user by ID, handling password hashing if needed.
+
+        Changing the activation or superuser status bumps the permissions
+        version in the same statement, comparing with the stored values.
 
         Args:
             db: Database session
-            db_obj: Existing user object
+            id: User ID
             obj_in: User update schema or dict
 
         Returns:
-            User: Updated user
+            Optional[User]: Updated user or None if not found
+
+        Raises:
+            ConflictError: If the email is already registered
         """
         if isinstance(obj_in, dict):
-            update_data = obj_in
+            update_data = dict(obj_in)
         else:
             update_data = obj_in.model_dump(exclude_unset=True)
 
         # Hash password if provided
         if update_data.get("password"):
-            hashed_password = get_password_hash(update_data["password"])
+            hashed_password = await password_hasher.hash(update_data["password"])
             del update_data["password"]
             update_data["hashed_password"] = hashed_password
 
-        return await super().update(db, db_obj=db_obj, obj_in=update_data)
+        user = await super().update_by_id(
+            db, id=id, obj_in=self.bump_version_on_status_change(update_data)
+        )
+        principal_cache.invalidate_users_on_commit(db, [id])
+        return user
+
+    def bump_version_on_status_change(
+        self, update_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Bump the permissions version of updated rows whose status changes.
+
+        Changing the activation or superuser status invalidates issued scopes.
+        The new values are compared with the stored ones in the UPDATE itself.
+
+        Args:
+            update_data: Fields to update
+
+        Returns:
+            Dict[str, Any]: Fields to update, with the permissions version if needed
+        """
+        changes = [
+            getattr(User, field) != update_data[field]
+            for field in ("is_active", "is_superuser")
+            if field in update_data
+        ]
+        if changes:
+            update_data["permissions_version"] = case(
+                (or_(*changes), User.permissions_version + 1),
+                else_=User.permissions_version,
+            )
+        return update_data
+
+    async def update_many(
+        self,
+        db: AsyncSession,
+        *,
+        filters: List[Any],
+        obj_in: Union[UserUpdate, Dict[str, Any]],
+        dry_run: bool = False,
+    ) -> List[Any]:
+        """
+        Update every matching user and drop their cached principals.
+
+        Passwords are not hashed here: bulk updates cannot set them.
+
+        Args:
+            db: Database session
+            filters: Conditions selecting the users
+            obj_in: User update schema or dict
+            dry_run: Only select the users that would be updated
+
+        Returns:
+            List[Any]: IDs of the updated users
+
+        Raises:
+            ConflictError: If the email is already registered
+        """
+        if isinstance(obj_in, dict):
+            update_data = dict(obj_in)
+        else:
+            update_data = obj_in.model_dump(exclude_unset=True)
+        update_data.pop("password", None)
+
+        user_ids = await super().update_many(
+            db,
+            filters=filters,
+            obj_in=self.bump_version_on_status_change(update_data),
+            dry_run=dry_run,
+        )
+        if not dry_run:
+            principal_cache.invalidate_users_on_commit(db, user_ids)
+        return user_ids
+
+    async def remove(self, db: AsyncSession, *, id: Any) -> Optional[User]:
+        """
+        Delete a user by ID and drop its cached principal.
+
+        Args:
+            db: Database session
+            id: User ID
+
+        Returns:
+            Optional[User]: Deleted user or None
+        """
+        obj = await super().remove(db, id=id)
+        principal_cache.invalidate_users_on_commit(db, [id])
+        return obj
+
+    async def remove_many(
+        self,
+        db: AsyncSession,
+        *,
+        filters: List[Any],
+        dry_run: bool = False,
+    ) -> List[Any]:
+        """
+        Delete every matching user and drop their cached principals.
+
+        Args:
+            db: Database session
+            filters: Conditions selecting the users
+            dry_run: Only select the users that would be deleted
+
+        Returns:
+            List[Any]: IDs of the deleted users
+        """
+        user_ids = await super().remove_many(db, filters=filters, dry_run=dry_run)
+        if not dry_run:
+            principal_cache.invalidate_users_on_commit(db, user_ids)
+        return user_ids
 
     async def authenticate(
         self, db: AsyncSession, *, email: str, password: str
@@ -135,10 +284,10 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         Returns:
             Optional[User]: Authenticated user or None
         """
-        user = await self.get_by_email(db, email=email)
+        user = await self.get_by_email(db, email=email, profile="auth")
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        if not await password_hasher.verify(password, user.hashed_password):
             return None
         return user
 
@@ -179,15 +328,50 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         Returns:
             Optional[User]: User with roles or None
         """
-        query = select(User).options(selectinload(User.roles)).where(User.id == user_id)
-        result = await db.execute(query)
-        return result.scalars().first()
+        return await self.get(db, user_id, profile="detail")
+
+    async def sync_roles(
+        self,
+        db: AsyncSession,
+        *,
+        user_ids: List[str],
+        role_ids: List[str],
+        mode: str = REPLACE,
+    ) -> SyncResult:
+        """
+        Grant, revoke or replace roles of many users at once.
+
+        Users whose roles change get their permissions version bumped and
+        their cached principal dropped.
+
+        Args:
+            db: Database session
+            user_ids: IDs of the users to update
+            role_ids: Role IDs to assign, add or remove
+            mode: REPLACE, ADD or REMOVE (see app.crud.association)
+
+        Returns:
+            SyncResult: Number of role assignments added and removed
+        """
+        result = await user_role_sync.sync(
+            db, owner_ids=user_ids, target_ids=role_ids, mode=mode
+        )
+        if result.changed:
+            query = (
+                update(User)
+                .where(User.id.in_(user_ids))
+                .values(permissions_version=User.permissions_version + 1)
+                .execution_options(synchronize_session=False)
+            )
+            await db.execute(query)
+            principal_cache.invalidate_users_on_commit(db, user_ids)
+        return result
 
     async def update_user_roles(
         self, db: AsyncSession, *, user_id: str, role_ids: List[str]
     ) -> Optional[User]:
         """
-        Update user's roles.
+        Replace user's roles.
 
         Args:
             db: Database session
@@ -197,23 +381,90 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         Returns:
             Optional[User]: Updated user with roles or None
         """
-        user = await self.get_user_with_roles(db, user_id=user_id)
+        await self.sync_roles(db, user_ids=[user_id], role_ids=role_ids)
+
+        # Reload over any copy in the session, its roles may be stale
+        query = (
+            self.get_query("detail")
+            .where(User.id == user_id)
+            .execution_options(populate_existing=True)
+        )
+        result = await db.execute(query)
+        return result.scalars().first()
+
+    async def get_principal(
+        self, db: AsyncSession, *, user_id: str
+    ) -> Optional[Principal]:
+        """
+        Get the compact principal of a user, served from cache when possible.
+
+        Args:
+            db: Database session
+            user_id: User ID
+
+        Returns:
+            Optional[Principal]: Principal or None if user not found
+        """
+        principal = principal_cache.get(user_id)
+        if principal is not None:
+            return principal
+
+        user = await self.get(db, user_id, profile="auth")
         if not user:
             return None
 
-        # Get roles by IDs
-        query = select(Role).where(Role.id.in_(role_ids))
+        principal = Principal.from_user(user)
+        principal_cache.set(user_id, principal)
+        return principal
+
+    async def get_auth_state(
+        self, db: AsyncSession, *, user_id: str
+    ) -> Optional[Tuple[bool, int]]:
+        """
+        Get the active flag and permissions version of a user.
+
+        This reads two columns only and never loads relationships.
+
+        Args:
+            db: Database session
+            user_id: User ID
+
+        Returns:
+            Optional[Tuple[bool, int]]: (is_active, permissions_version) or None
+        """
+        query = select(User.is_active, User.permissions_version).where(
+            User.id == user_id
+        )
         result = await db.execute(query)
-        roles = result.scalars().all()
+        row = result.first()
+        return (row.is_active, row.permissions_version) if row else None
 
-        # Update user's roles
-        user.roles = roles
-        db.add(user)
-        await db.flush()
-        await db.refresh(user)
+    async def bump_permissions_version(
+        self, db: AsyncSession, *, role_ids: Any
+    ) -> None:
+        """
+        Increment the permissions version of every user holding the given roles.
 
-        return user
+        Access tokens issued before the bump are rejected in token
+        authorization mode.
+
+        Args:
+            db: Database session
+            role_ids: List of role IDs or a subquery selecting role IDs
+        """
+        query = (
+            update(User)
+            .where(
+                User.id.in_(
+                    select(user_role.c.user_id).where(user_role.c.role_id.in_(role_ids))
+                )
+            )
+            .values(permissions_version=User.permissions_version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        await db.execute(query)
 
 
-# Create singleton instance
+# Create singleton instances
+user_role_sync = AssociationSync(user_role, user_role.c.user_id, user_role.c.role_id)
 user_crud = CRUDUser(User)
@@ -17,7 +17,6 @@ from typing import List
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.core.security import get_password_hash
 from app.crud.permission import permission_crud
 from app.crud.role import role_crud
 from app.crud.user import user_crud
@@ -28,6 +27,7 @@ from app.models.user import User
 from app.schemas.permission import PermissionCreate
 from app.schemas.role import RoleCreate
 from app.schemas.user import UserCreate
+from app.services.password import password_hasher
 
 logger = logging.getLogger(__name__)
 
@@ -117,7 +117,9 @@ async def init_superuser(db: AsyncSession, roles: List[Role]) -> None:
 
         new_user = User(
             email=settings.FIRST_SUPERUSER_EMAIL,
-            hashed_password=get_password_hash(settings.FIRST_SUPERUSER_PASSWORD),
+            hashed_password=await password_hasher.hash(
+                settings.FIRST_SUPERUSER_PASSWORD
+            ),
             full_name="System Administrator",
             is_active=True,
             is_superuser=True,
@@ -0,0 +1,116 @@
+"""
+Database Instrumentation Module
+
+This module records the SQL statements executed while handling a request:
+how many, how long they took and which ones were repeated (a sign of N+1
+loading). Statistics are accumulated in the request context. It also
+provides the connection pool class timing checkout waits for the metrics.
+"""
+import logging
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.config import settings
+from app.core.metrics import observe_pool_checkout
+from app.core.context import RequestContext, get_request_context
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceededError(RuntimeError):
+    """Raised in strict mode when a request executes more statements than its budget."""
+
+
+def _before_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, many: bool
+) -> None:
+    """Count the statement and enforce the query budget."""
+    request = get_request_context()
+    if request is None:
+        return
+
+    request.db_queries += 1
+    request.db_statements[statement] = request.db_statements.get(statement, 0) + 1
+
+    budget = request.query_budget
+    if budget is not None and request.db_queries == budget + 1:
+        message = f"Query budget of {budget} statements exceeded"
+        if settings.DB_QUERY_BUDGET_STRICT:
+            raise QueryBudgetExceededError(message)
+        logger.warning("%s: %s", message, statement)
+
+    # Kept on the execution context, which is discarded even when the statement fails
+    context.query_start_ns = time.perf_counter_ns()
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, many: bool
+) -> None:
+    """Add the statement duration to the request's database time."""
+    request = get_request_context()
+    start = getattr(context, "query_start_ns", None)
+    if request is None or start is None:
+        return
+
+    request.db_time_ns += time.perf_counter_ns() - start
+
+
+class TimedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool recording how long each checkout waits for a connection."""
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter_ns()
+        try:
+            return super()._do_get()
+        finally:
+            observe_pool_checkout((time.perf_counter_ns() - start) / 1e9)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Record the statements executed through an engine in the request context.
+
+    Args:
+        engine: Sync engine (AsyncEngine.sync_engine)
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def report_duplicates(context: RequestContext, route: str) -> None:
+    """
+    Log the statements a request repeated at least DB_N_PLUS_ONE_THRESHOLD times.
+
+    Args:
+        context: Finished request context
+        route: Route template or path of the request
+    """
+    threshold = settings.DB_N_PLUS_ONE_THRESHOLD
+    for statement, count in context.db_duplicates.items():
+        if count >= threshold:
+            logger.warning(
+                "Possible N+1 on %s: statement executed %d times: %s",
+                route,
+                count,
+                " ".join(statement.split())[:300],
+            )
+
+
+def server_timing(context: RequestContext) -> bytes:
+    """
+    Build a Server-Timing header value with the request's database statistics.
+
+    Args:
+        context: Request context
+
+    Returns:
+        bytes: Header value
+    """
+    return (
+        f'db;dur={context.db_time_ns / 1e6:.3f};desc="{context.db_queries} queries", '
+        f'dbdup;desc="{len(context.db_duplicates)} duplicated"'
+    ).encode()
@@ -0,0 +1,126 @@
+"""
+Database Routing Module
+
+This module defines the session class that routes reads to a replica engine
+and everything else to the primary engine.
+"""
+import time
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, ExceptionContext
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+# Session.info keys
+USE_REPLICA = "use_replica"
+PINNED_TO_PRIMARY = "pinned_to_primary"
+
+
+class ReplicaBreaker:
+    """
+    Circuit breaker taking the replica out of rotation after a connection failure.
+
+    Attributes:
+        cooldown: Seconds to route everything to the primary after a failure
+    """
+
+    def __init__(self, cooldown: float):
+        """
+        Initialize a closed breaker.
+
+        Args:
+            cooldown: Seconds to route everything to the primary after a failure
+        """
+        self.cooldown = cooldown
+        self._open_until = 0.0
+
+    @property
+    def available(self) -> bool:
+        """Whether the replica may currently receive reads."""
+        return time.monotonic() >= self._open_until
+
+    def trip(self) -> None:
+        """Take the replica out of rotation for the cooldown period."""
+        self._open_until = time.monotonic() + self.cooldown
+
+    def watch(self, engine: Engine) -> None:
+        """
+        Trip the breaker whenever the engine fails to connect or is disconnected.
+
+        Args:
+            engine: Sync engine of the replica
+        """
+
+        @event.listens_for(engine, "handle_error")
+        def _on_error(context: ExceptionContext) -> None:
+            if context.is_disconnect or context.connection is None:
+                self.trip()
+
+
+class RoutingSession(Session):
+    """
+    Session sending plain SELECTs to a replica when enabled for the session.
+
+    Reads are routed to the replica only while session.info[USE_REPLICA] is
+    set. The session pins itself to the primary on its first flush or
+    non-SELECT statement, so a request reads its own writes. Locking reads
+    (SELECT ... FOR UPDATE) always go to the primary.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        replica_bind: Optional[Engine] = None,
+        replica_breaker: Optional[ReplicaBreaker] = None,
+        **kwargs: Any,
+    ):
+        """
+        Initialize the session.
+
+        Args:
+            *args: Positional arguments for Session
+            replica_bind: Sync engine of the replica, if any
+            replica_breaker: Breaker tracking replica availability
+            **kwargs: Keyword arguments for Session
+        """
+        super().__init__(*args, **kwargs)
+        self.replica_bind = replica_bind
+        self.replica_breaker = replica_breaker
+
+    def get_bind(
+        self,
+        mapper: Optional[Any] = None,
+        clause: Optional[Any] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Pick the engine for a statement.
+
+        Args:
+            mapper: Mapped class or mapper the statement targets
+            clause: Statement being executed
+            **kwargs: Extra arguments for Session.get_bind
+
+        Returns:
+            Engine or Connection to execute the statement with
+        """
+        if clause is not None and not isinstance(clause, Select):
+            self.info[PINNED_TO_PRIMARY] = True
+        elif (
+            self.replica_bind is not None
+            and isinstance(clause, Select)
+            and clause._for_update_arg is None
+            and self.info.get(USE_REPLICA)
+            and not self.info.get(PINNED_TO_PRIMARY)
+            and (self.replica_breaker is None or self.replica_breaker.available)
+        ):
+            return self.replica_bind
+
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+@event.listens_for(RoutingSession, "before_flush")
+def _pin_on_flush(session: Session, flush_context: Any, instances: Any) -> None:
+    """Pin the session to the primary once it starts writing."""
+    session.info[PINNED_TO_PRIMARY] = True
@@ -4,35 +4,195 @@ Database Session Module
 This module sets up SQLAlchemy async engine and session factory.
 """
 
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from fastapi import Request
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 
-from app.core.config import settings
+from app.core.config import Settings, settings
+from app.db.instrumentation import TimedAsyncQueuePool, instrument_engine
+from app.db.routing import USE_REPLICA, ReplicaBreaker, RoutingSession
 
-# Create async engine with the configured database URI
+# HTTP methods whose requests may read from the replica
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def get_engine_options(config: Settings, url: str) -> Dict[str, Any]:
+    """
+    Build the engine keyword arguments from the pool and driver settings.
+
+    Args:
+        config: Application settings
+        url: Database URL the engine connects to
+
+    Returns:
+        Dict[str, Any]: Keyword arguments for create_async_engine
+    """
+    options: Dict[str, Any] = {
+        "echo": config.DEBUG,
+        "future": True,
+        "pool_size": config.DB_POOL_SIZE,
+        "max_overflow": config.DB_MAX_OVERFLOW,
+        "pool_timeout": config.DB_POOL_TIMEOUT,
+        "pool_recycle": config.DB_POOL_RECYCLE,
+        "pool_use_lifo": config.DB_POOL_USE_LIFO,
+        "pool_pre_ping": config.DB_POOL_PRE_PING,
+        "poolclass": TimedAsyncQueuePool,
+    }
+
+    if make_url(url).get_driver_name() == "asyncpg":
+        server_settings = {
+            "application_name": config.DB_APPLICATION_NAME or config.PROJECT_NAME,
+        }
+        if config.DB_STATEMENT_TIMEOUT_MS is not None:
+            server_settings["statement_timeout"] = str(config.DB_STATEMENT_TIMEOUT_MS)
+
+        options["connect_args"] = {
+            "statement_cache_size": config.DB_STATEMENT_CACHE_SIZE,
+            "server_settings": server_settings,
+        }
+
+    return options
+
+
+def get_pool_stats(db_engine: AsyncEngine) -> Dict[str, Any]:
+    """
+    Get a snapshot of an engine's connection pool usage.
+
+    Args:
+        db_engine: Async engine
+
+    Returns:
+        Dict[str, Any]: Pool class, configured size and current usage
+    """
+    pool = db_engine.pool
+    stats: Dict[str, Any] = {"pool_class": type(pool).__name__}
+
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            max_overflow=pool._max_overflow,
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            timeout=pool.timeout(),
+        )
+
+    return stats
+
+
+def with_read_only(db_engine: AsyncEngine) -> AsyncEngine:
+    """
+    Get a view of an engine whose transactions are READ ONLY DEFERRABLE.
+
+    The view shares the engine's pool; the characteristics are reset when a
+    connection is returned to it. Other dialects get the engine unchanged.
+
+    Args:
+        db_engine: Async engine
+
+    Returns:
+        AsyncEngine: Engine beginning read-only transactions
+    """
+    if db_engine.dialect.name != "postgresql":
+        return db_engine
+    return db_engine.execution_options(
+        postgresql_readonly=True, postgresql_deferrable=True
+    )
+
+
+class ReadOnlyAsyncSession(AsyncSession):
+    """
+    Session for safe-method requests that gives its connection back early.
+
+    Like any session it checks out a connection only on its first statement.
+    It then ends the transaction after every statement instead of holding the
+    connection until the response has been sent. Results are fully buffered,
+    and objects are not expired on commit, so they stay usable afterwards.
+    """
+
+    async def execute(self, *args: Any, **kwargs: Any) -> Any:
+        """Execute a statement, then release the connection."""
+        result = await super().execute(*args, **kwargs)
+        await self.commit()
+        return result
+
+    async def scalar(self, *args: Any, **kwargs: Any) -> Any:
+        """Execute a statement returning a scalar, then release the connection."""
+        result = await super().scalar(*args, **kwargs)
+        await self.commit()
+        return result
+
+    async def get(self, *args: Any, **kwargs: Any) -> Any:
+        """Get an object by primary key, then release the connection."""
+        result = await super().get(*args, **kwargs)
+        await self.commit()
+        return result
+
+
+# Create async engine with the configured database URI and pool settings
 engine = create_async_engine(
     settings.SQLALCHEMY_DATABASE_URI,
-    echo=settings.DEBUG,
-    future=True,
-    pool_pre_ping=True,
+    **get_engine_options(settings, settings.SQLALCHEMY_DATABASE_URI),
 )
+instrument_engine(engine.sync_engine)
+
+# Optional read replica, taken out of rotation for a while when it fails
+replica_engine = None
+replica_breaker = ReplicaBreaker(cooldown=settings.DB_REPLICA_RETRY_SECONDS)
+
+if settings.SQLALCHEMY_REPLICA_URI:
+    replica_engine = create_async_engine(
+        settings.SQLALCHEMY_REPLICA_URI,
+        **get_engine_options(settings, settings.SQLALCHEMY_REPLICA_URI),
+    )
+    replica_breaker.watch(replica_engine.sync_engine)
+    instrument_engine(replica_engine.sync_engine)
 
 # Create async session factory
 AsyncSessionLocal = sessionmaker(
     bind=engine,
     class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    replica_bind=replica_engine.sync_engine if replica_engine else None,
+    replica_breaker=replica_breaker,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
+# Session factory for safe-method requests: read-only transactions, ended
+# after every statement
+ReadOnlySessionLocal = sessionmaker(
+    bind=with_read_only(engine),
+    class_=ReadOnlyAsyncSession,
+    sync_session_class=RoutingSession,
+    replica_bind=with_read_only(replica_engine).sync_engine if replica_engine else None,
+    replica_breaker=replica_breaker,
     expire_on_commit=False,
     autoflush=False,
 )
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency function to provide a database session.
+
+    Sessions of GET/HEAD/OPTIONS requests read from the replica when one is
+    configured, until they write (see RoutingSession). With
+    DB_READ_ONLY_SAFE_METHODS they also run read-only transactions and
+    release their connection after each statement (see ReadOnlyAsyncSession).
     """
-    async with AsyncSessionLocal() as session:
+    safe = request.method in SAFE_METHODS
+    if safe and settings.DB_READ_ONLY_SAFE_METHODS:
+        session_factory = ReadOnlySessionLocal
+    else:
+        session_factory = AsyncSessionLocal
+
+    async with session_factory() as session:
+        session.info[USE_REPLICA] = safe
         try:
             yield session
         except Exception as e:
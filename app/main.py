@@ -6,23 +6,33 @@ FastAPI Application Entry Point
 This module initializes and configures the FastAPI application with all middleware,
 exception handlers, and API routers.
 """
-import time
 from contextlib import asynccontextmanager
-from typing import Callable
 
 import uvicorn
 from fastapi import FastAPI, Request, status
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
-# from app.core.middleware.security_headers_middleware import SecurityHeadersMiddleware
-
 from app.api.v1.router import api_router as api_router_v1
 from app.core.config import settings
 from app.core.exceptions import AppException, handle_app_exception
+from app.core.logging import setup_logging, stop_logging
+from app.core.metrics import METRICS_AVAILABLE, render_metrics
+from app.core.middleware.exception_middleware import ExceptionMiddleware
+from app.core.middleware.logging_middleware import AccessLogMiddleware
+from app.core.middleware.metrics_middleware import MetricsMiddleware
+from app.core.middleware.process_time_middleware import ProcessTimeMiddleware
+from app.core.middleware.rate_limiting_middleware import RateLimitMiddleware
+from app.core.middleware.security_headers_middleware import SecurityHeadersMiddleware
+from app.core.redis import close_redis
+from app.core.security import jwt_keys
 from app.db.init_db import init_db
+from app.services.password import password_hasher
+from app.services.rate_limiter import rate_limiter
+from app.services.token_denylist import token_denylist
 
 
 @asynccontextmanager
@@ -39,11 +49,16 @@ async def lifespan(app: FastAPI):
     # Startup operations
     if settings.INITIALIZE_DB:
         await init_db()
+    await token_denylist.start()
 
     yield
 
     # Shutdown operations
     # Close any connections, etc.
+    password_hasher.shutdown()
+    await token_denylist.stop()
+    await close_redis()
+    stop_logging()
 
 
 def create_application() -> FastAPI:
@@ -53,6 +68,8 @@ def create_application() -> FastAPI:
     Returns:
         FastAPI: Configured FastAPI application
     """
+    setup_logging()
+
     app = FastAPI(
         title=settings.PROJECT_NAME,
         description=settings.PROJECT_DESCRIPTION,
@@ -63,6 +80,37 @@ def create_application() -> FastAPI:
         lifespan=lifespan,
     )
 
+    # Middleware, the last added being the outermost: CORS -> security
+    # headers -> metrics -> process time -> access log -> exception mapping
+    # -> rate limiting -> routes
+    metrics_enabled = settings.METRICS_ENABLED and METRICS_AVAILABLE
+    if settings.RATE_LIMIT_ENABLED:
+        app.add_middleware(
+            RateLimitMiddleware,
+            limiter=rate_limiter,
+            limit=settings.RATE_LIMIT_PER_MINUTE,
+            window=60,
+            route_limits={
+                f"POST {settings.API_PREFIX}/v1/auth/login": (
+                    settings.RATE_LIMIT_LOGIN_PER_MINUTE,
+                    60,
+                ),
+            },
+            exempt_paths=(
+                f"{settings.API_PREFIX}/v1/health",
+                "/metrics",
+                "/.well-known/jwks.json",
+            ),
+        )
+    app.add_middleware(ExceptionMiddleware)
+    app.add_middleware(
+        AccessLogMiddleware, sample_rate=settings.LOG_ACCESS_SAMPLE_RATE
+    )
+    app.add_middleware(ProcessTimeMiddleware)
+    if metrics_enabled:
+        app.add_middleware(MetricsMiddleware)
+    app.add_middleware(SecurityHeadersMiddleware)
+
     # Set up CORS middleware
     app.add_middleware(
         CORSMiddleware,
@@ -72,28 +120,6 @@ def create_application() -> FastAPI:
         allow_headers=["*"],  # permite headers como Authorization, Content-Type, etc.
     )
 
-    # Adicionar middlewares
-#   app.add_middleware(SecurityHeadersMiddleware)  # Deve ser o primeiro para garantir que os cabeçalhos sejam aplicados
-
-    # Add API request performance monitoring middleware
-    @app.middleware("http")
-    async def add_process_time_header(request: Request, call_next: Callable):
-        """
-        Middleware to track request processing time.
-
-        Args:
-            request: Incoming request
-            call_next: Next middleware or route handler
-
-        Returns:
-            Response with processing time header
-        """
-        start_time = time.time()
-        response = await call_next(request)
-        process_time = time.time() - start_time
-        response.headers["X-Process-Time"] = str(process_time)
-        return response
-
     # Set up exception handlers
     @app.exception_handler(AppException)
     async def app_exception_handler(request: Request, exc: AppException):
@@ -143,7 +169,7 @@ def create_application() -> FastAPI:
         return JSONResponse(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             content={
-                "detail": exc.errors(),
+                "detail": jsonable_encoder(exc.errors()),
                 "status_code": status.HTTP_422_UNPROCESSABLE_ENTITY,
                 "message": "Validation error",
             },
@@ -152,6 +178,31 @@ def create_application() -> FastAPI:
     # Include API routers
     app.include_router(api_router_v1, prefix=f"{settings.API_PREFIX}/v1")
 
+    @app.get("/.well-known/jwks.json", include_in_schema=False)
+    async def jwks() -> JSONResponse:
+        """
+        Publish the public keys verifying the application's tokens.
+
+        Returns:
+            JSONResponse: JWK Set, empty when tokens are signed with a shared secret
+        """
+        return JSONResponse(
+            content=jwt_keys.jwks(), headers={"Cache-Control": "public, max-age=300"}
+        )
+
+    if metrics_enabled:
+
+        @app.get("/metrics", include_in_schema=False)
+        async def metrics() -> Response:
+            """
+            Expose the application metrics to Prometheus.
+
+            Returns:
+                Response: Metrics in the Prometheus text format
+            """
+            body, content_type = render_metrics()
+            return Response(content=body, headers={"Content-Type": content_type})
+
     return app
 
 
@@ -165,4 +216,5 @@ if __name__ == "__main__":
         port=8000,
         reload=settings.DEBUG,
         log_level="debug" if settings.DEBUG else "info",
+        access_log=False,  # replaced by AccessLogMiddleware
     )
@@ -0,0 +1,65 @@
+"""
+Loading Profiles Module
+
+This module declares which relationships each query loads. Relationships
+are never loaded implicitly (``lazy="raise_on_sql"``); CRUD methods and
+endpoints pick a named profile describing exactly the graph they need.
+"""
+from typing import Dict, Optional, Tuple, Type
+
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.interfaces import ORMOption
+
+from app.db.base import Base
+from app.models.permission import Permission
+from app.models.role import Role
+from app.models.user import User
+
+# Loader options per model and profile name:
+#   list   - columns only, for paginated listings
+#   detail - the relationships rendered by the *DetailResponse schemas
+#   auth   - everything needed to build a principal or token scopes
+LOADING_PROFILES: Dict[Type[Base], Dict[str, Tuple[ORMOption, ...]]] = {
+    User: {
+        "list": (),
+        "detail": (selectinload(User.roles),),
+        "auth": (selectinload(User.roles).selectinload(Role.permissions),),
+    },
+    Role: {
+        "list": (),
+        "detail": (selectinload(Role.permissions),),
+        "users": (selectinload(Role.users),),
+    },
+    Permission: {
+        "list": (),
+        "detail": (),
+        "roles": (selectinload(Permission.roles),),
+    },
+}
+
+
+def get_loader_options(
+    model: Type[Base], profile: Optional[str]
+) -> Tuple[ORMOption, ...]:
+    """
+    Get the loader options of a model's loading profile.
+
+    Args:
+        model: SQLAlchemy model class
+        profile: Profile name, or None to load columns only
+
+    Returns:
+        Tuple[ORMOption, ...]: Loader options to apply to the query
+
+    Raises:
+        ValueError: If the profile is not declared for the model
+    """
+    if profile is None:
+        return ()
+
+    try:
+        return LOADING_PROFILES[model][profile]
+    except KeyError:
+        raise ValueError(
+            f"Unknown loading profile '{profile}' for {model.__name__}"
+        ) from None
@@ -5,7 +5,7 @@ This module defines the Permission model for granular access control.
 """
 from typing import List, Optional
 
-from sqlalchemy import String
+from sqlalchemy import Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -22,6 +22,24 @@ class Permission(Base):
         roles: Many-to-many relationship with roles
     """
 
+    __table_args__ = (
+        # Sort key of listings and keyset pagination
+        Index("ix_permission_created_at_id", "created_at", "id"),
+        # Substring search (ILIKE '%term%'), requires the pg_trgm extension
+        Index(
+            "ix_permission_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_permission_code_trgm",
+            "code",
+            postgresql_using="gin",
+            postgresql_ops={"code": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     code: Mapped[str] = mapped_column(
         String(100), unique=True, index=True, nullable=False
@@ -33,7 +51,8 @@ class Permission(Base):
         "Role",
         secondary="role_permission",
         back_populates="permissions",
-        lazy="selectin",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
@@ -6,7 +6,7 @@ This module defines the Role model and related SQLAlchemy models.
 """
 from typing import List, Optional
 
-from sqlalchemy import Column, ForeignKey, String, Table
+from sqlalchemy import Column, ForeignKey, Index, String, Table
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -42,6 +42,24 @@ class Role(Base):
         users: Many-to-many relationship with users
     """
 
+    __table_args__ = (
+        # Sort key of listings and keyset pagination
+        Index("ix_role_created_at_id", "created_at", "id"),
+        # Substring search (ILIKE '%term%'), requires the pg_trgm extension
+        Index(
+            "ix_role_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_role_code_trgm",
+            "code",
+            postgresql_using="gin",
+            postgresql_ops={"code": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     code: Mapped[str] = mapped_column(
         String(50), unique=True, index=True, nullable=False
@@ -53,14 +71,16 @@ class Role(Base):
         "Permission",
         secondary=role_permission,
         back_populates="roles",
-        lazy="selectin",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
     users: Mapped[List["User"]] = relationship(
         "User",
         secondary="user_role",
         back_populates="roles",
-        lazy="selectin",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
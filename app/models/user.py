@@ -6,7 +6,16 @@ This module defines the User model and related SQLAlchemy models.
 """
 from typing import List, Optional
 
-from sqlalchemy import Boolean, Column, ForeignKey, String, Table
+from sqlalchemy import (
+    Boolean,
+    Column,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Table,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -40,9 +49,29 @@ class User(Base):
         full_name: User's full name
         is_active: Whether user account is active
         is_superuser: Whether user has superuser privileges
+        permissions_version: Counter bumped whenever the user's grants change,
+            embedded in access tokens to detect stale scopes
         roles: Many-to-many relationship with roles
     """
 
+    __table_args__ = (
+        # Sort key of listings and keyset pagination
+        Index("ix_user_created_at_id", "created_at", "id"),
+        # Substring search (ILIKE '%term%'), requires the pg_trgm extension
+        Index(
+            "ix_user_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_user_full_name_trgm",
+            "full_name",
+            postgresql_using="gin",
+            postgresql_ops={"full_name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
     email: Mapped[str] = mapped_column(
         String(255), unique=True, index=True, nullable=False
     )
@@ -50,15 +79,27 @@ class User(Base):
     full_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     is_superuser: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    permissions_version: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
 
     # Many-to-many relationship with Role model
     roles: Mapped[List["Role"]] = relationship(
         "Role",
         secondary=user_role,
         back_populates="users",
-        lazy="selectin",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
         """String representation of User instance."""
         return f"<User {self.email}>"
+
+
+# Email prefix search (lower(email) LIKE 'term%')
+Index(
+    "ix_user_email_lower_pattern",
+    func.lower(User.email).label("email_lower"),
+    postgresql_ops={"email_lower": "text_pattern_ops"},
+)
@@ -4,9 +4,9 @@ Base Schema Module
 This module defines base Pydantic models for schema inheritance.
 """
 from datetime import datetime
-from typing import Any, Generic, Optional, TypeVar
+from typing import Any, ClassVar, Generic, List, Optional, Tuple, TypeVar
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from typing_extensions import Annotated
 
 # Type variable for generic model types
@@ -51,43 +51,65 @@ class PaginatedResponse(BaseSchema, Generic[ModelType]):
 
     Attributes:
         items: List of items for the current page
-        total: Total number of items
+        total: Total number of items, or None when not requested
         page: Current page number
         page_size: Number of items per page
-        pages: Total number of pages
+        pages: Total number of pages, or None when total is unknown
         has_next: Whether there is a next page
         has_prev: Whether there is a previous page
+        next_cursor: Cursor to request the next page with keyset pagination
+        total_estimated: Whether total is an estimate rather than an exact count
     """
 
     items: list[ModelType]
-    total: int
+    total: Optional[int]
     page: int
     page_size: int
-    pages: int
+    pages: Optional[int]
     has_next: bool
     has_prev: bool
+    next_cursor: Optional[str] = None
+    total_estimated: bool = False
 
     @classmethod
     def create(
         cls,
         items: list[Any],
-        total: int,
+        total: Optional[int],
         page: int,
         page_size: int,
+        next_cursor: Optional[str] = None,
+        cursor: Optional[str] = None,
+        has_next: Optional[bool] = None,
+        total_estimated: bool = False,
     ) -> "PaginatedResponse":
         """
         Create a paginated response.
 
         Args:
             items: List of items for the current page
-            total: Total number of items
+            total: Total number of items, or None if it was not counted
             page: Current page number
             page_size: Number of items per page
+            next_cursor: Cursor pointing after the last item of the page
+            cursor: Cursor the page was requested with, if any
+            has_next: Whether a next page exists, if already known
+            total_estimated: Whether total is an estimate
 
         Returns:
             PaginatedResponse: Paginated response object
         """
-        pages = (total + page_size - 1) // page_size if page_size > 0 else 0
+        if total is None:
+            pages = None
+        else:
+            pages = (total + page_size - 1) // page_size if page_size > 0 else 0
+
+        if has_next is None:
+            # Page numbers are meaningless when walking with a cursor
+            if cursor or pages is None:
+                has_next = next_cursor is not None
+            else:
+                has_next = page < pages
 
         return cls(
             items=items,
@@ -95,10 +117,125 @@ class PaginatedResponse(BaseSchema, Generic[ModelType]):
             page=page,
             page_size=page_size,
             pages=pages,
-            has_next=page < pages,
-            has_prev=page > 1,
+            has_next=has_next,
+            has_prev=True if cursor else page > 1,
+            next_cursor=next_cursor if has_next else None,
+            total_estimated=total_estimated,
         )
 
+    @classmethod
+    def from_page(
+        cls,
+        result: Any,
+        page: int,
+        page_size: int,
+        cursor: Optional[str] = None,
+    ) -> "PaginatedResponse":
+        """
+        Create a paginated response from a CRUDBase.get_page result.
+
+        Args:
+            result: Page returned by CRUDBase.get_page
+            page: Current page number
+            page_size: Number of items per page
+            cursor: Cursor the page was requested with, if any
+
+        Returns:
+            PaginatedResponse: Paginated response object
+        """
+        return cls.create(
+            items=result.items,
+            total=result.total,
+            page=page,
+            page_size=page_size,
+            next_cursor=result.next_cursor,
+            cursor=cursor,
+            has_next=result.has_next,
+            total_estimated=result.total_estimated,
+        )
+
+
+class BulkFilter(BaseSchema):
+    """
+    Schema for the filter selecting records of a bulk operation.
+
+    Subclasses add the columns a model can be filtered on.
+
+    Attributes:
+        search: Search term, matched like in listings
+    """
+
+    search: Optional[str] = Field(None, min_length=1)
+
+
+class BulkSelection(BaseSchema):
+    """
+    Schema for the records targeted by a bulk operation.
+
+    Attributes:
+        ids: IDs of the records
+        filter: Filter matching the records, with at least one criterion
+        dry_run: Only count the records that would be affected
+    """
+
+    ids: Optional[List[str]] = Field(None, min_length=1, max_length=10000)
+    filter: Optional[BulkFilter] = None
+    dry_run: bool = False
+
+    @model_validator(mode="after")
+    def one_selector(self) -> "BulkSelection":
+        """Validate that exactly one of ids and filter is given, and not empty."""
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Exactly one of ids and filter is required")
+        if self.filter is not None and all(
+            value is None for value in self.filter.model_dump().values()
+        ):
+            raise ValueError("filter must have at least one criterion")
+        return self
+
+    def filter_criteria(self) -> dict:
+        """Selection as keyword arguments of CRUDBase.get_bulk_filters."""
+        criteria = self.filter.model_dump() if self.filter is not None else {}
+        return {"ids": self.ids, **criteria}
+
+
+class BulkValues(BaseSchema):
+    """
+    Base schema for the values set by a bulk update.
+
+    Subclasses declare the fields that may be set and list the ones backed
+    by NOT NULL columns in required_fields.
+    """
+
+    required_fields: ClassVar[Tuple[str, ...]] = ()
+
+    @model_validator(mode="after")
+    def any_value(self) -> "BulkValues":
+        """Validate that at least one value is set, and no required one is null."""
+        if not self.model_fields_set:
+            raise ValueError("At least one value is required")
+        nulls = [
+            field
+            for field in self.required_fields
+            if field in self.model_fields_set and getattr(self, field) is None
+        ]
+        if nulls:
+            raise ValueError(f"Values cannot be null: {', '.join(nulls)}")
+        return self
+
+
+class BulkResult(BaseSchema):
+    """
+    Schema for the outcome of a bulk operation.
+
+    Attributes:
+        affected: Number of records affected, or that would be in a dry run
+        dry_run: Whether the operation was only simulated
+    """
+
+    affected: int
+    dry_run: bool
+
 
 # Common validators for request parameters
 PositiveInt = Annotated[int, Field(gt=0)]
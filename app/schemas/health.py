@@ -0,0 +1,44 @@
+"""
+Health Schema Module
+
+This module defines Pydantic schemas for health checks and runtime statistics.
+"""
+from typing import Optional
+
+from app.schemas.base import BaseSchema
+
+
+class HealthResponse(BaseSchema):
+    """
+    Schema for health check response.
+
+    Attributes:
+        status: Overall status ('ok')
+        database: Database connectivity status ('ok')
+    """
+
+    status: str
+    database: str
+
+
+class PoolStats(BaseSchema):
+    """
+    Schema for database connection pool statistics of the current worker.
+
+    Attributes:
+        pool_class: Pool implementation name
+        size: Number of persistent connections the pool keeps
+        max_overflow: Extra connections allowed above size
+        checked_in: Idle connections in the pool
+        checked_out: Connections currently in use
+        overflow: Overflow connections currently open
+        timeout: Seconds to wait for a connection before failing
+    """
+
+    pool_class: str
+    size: Optional[int] = None
+    max_overflow: Optional[int] = None
+    checked_in: Optional[int] = None
+    checked_out: Optional[int] = None
+    overflow: Optional[int] = None
+    timeout: Optional[float] = None
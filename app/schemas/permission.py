@@ -7,7 +7,7 @@ from typing import Optional
 
 from pydantic import Field
 
-from app.schemas.base import BaseProperties, BaseSchema
+from app.schemas.base import BaseProperties, BaseSchema, BulkSelection, BulkValues
 
 
 class PermissionBase(BaseSchema):
@@ -44,6 +44,29 @@ class PermissionUpdate(BaseSchema):
     description: Optional[str] = Field(None, max_length=255)
 
 
+class PermissionBulkValues(PermissionUpdate, BulkValues):
+    """
+    Schema for the values set by a bulk permission update.
+
+    Attributes:
+        name: Human-readable permission name, cannot be null
+        description: Permission description
+    """
+
+    required_fields = ("name",)
+
+
+class PermissionBulkUpdate(BulkSelection):
+    """
+    Schema for updating many permissions at once.
+
+    Attributes:
+        values: Values set on every selected permission
+    """
+
+    values: PermissionBulkValues
+
+
 class PermissionResponse(PermissionBase, BaseProperties):
     """
     Schema for permission responses.
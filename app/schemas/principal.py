@@ -0,0 +1,92 @@
+"""
+Principal Schema Module
+
+This module defines the compact identity used for authorization checks.
+"""
+from functools import cached_property
+from typing import FrozenSet
+
+from pydantic import ConfigDict
+
+from app.core.permissions import permission_registry
+from app.models.user import User
+from app.schemas.base import BaseSchema
+from app.schemas.token import TokenData
+
+
+class Principal(BaseSchema):
+    """
+    Immutable snapshot of an authenticated user's identity and grants.
+
+    Attributes:
+        id: User ID
+        is_active: Whether user is active
+        is_superuser: Whether user is a superuser
+        roles: Codes of the roles assigned to the user
+        permissions: Codes of all permissions granted through the roles
+        permissions_version: User permissions version the grants belong to
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    id: str
+    is_active: bool
+    is_superuser: bool
+    roles: FrozenSet[str] = frozenset()
+    permissions: FrozenSet[str] = frozenset()
+    permissions_version: int = 0
+
+    @cached_property
+    def permission_mask(self) -> int:
+        """Permissions as a mask of the permission registry, computed once."""
+        return permission_registry.mask(self.permissions)
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        """
+        Build a principal from a user loaded with roles and permissions.
+
+        Args:
+            user: User object
+
+        Returns:
+            Principal: Principal for the user
+        """
+        return cls(
+            id=user.id,
+            is_active=user.is_active,
+            is_superuser=user.is_superuser,
+            roles=frozenset(role.code for role in user.roles),
+            permissions=frozenset(
+                permission.code
+                for role in user.roles
+                for permission in role.permissions
+            ),
+            permissions_version=user.permissions_version,
+        )
+
+    @classmethod
+    def from_token_data(cls, token_data: TokenData, is_active: bool) -> "Principal":
+        """
+        Build a principal from the scopes embedded in an access token.
+
+        Args:
+            token_data: Validated token data
+            is_active: Current active status of the user
+
+        Returns:
+            Principal: Principal described by the token
+        """
+        # Role scopes are 'role:<code>' and may look like permission codes
+        role_scopes = {f"role:{code}" for code in token_data.roles}
+
+        return cls(
+            id=token_data.user_id,
+            is_active=is_active,
+            is_superuser=token_data.is_superuser,
+            roles=frozenset(token_data.roles),
+            permissions=frozenset(
+                scope for scope in token_data.scopes if scope not in role_scopes
+            ),
+            permissions_version=token_data.permissions_version or 0,
+        )
@@ -7,7 +7,7 @@ from typing import List, Optional
 
 from pydantic import Field
 
-from app.schemas.base import BaseProperties, BaseSchema
+from app.schemas.base import BaseProperties, BaseSchema, BulkSelection, BulkValues
 from app.schemas.permission import PermissionResponse
 
 
@@ -26,6 +26,14 @@ class RoleUpdate(BaseSchema):
     description: Optional[str] = Field(None, max_length=255)
 
 
+class RoleBulkValues(RoleUpdate, BulkValues):
+    required_fields = ("name",)
+
+
+class RoleBulkUpdate(BulkSelection):
+    values: RoleBulkValues
+
+
 class RoleResponse(RoleBase, BaseProperties):
     pass
 
@@ -32,12 +32,18 @@ class TokenPayload(BaseSchema):
         exp: Expiration timestamp
         type: Token type ('access' or 'refresh')
         scopes: Optional permission scopes
+        roles: Optional role codes
+        pv: Optional user permissions version
+        su: Whether the subject is a superuser
     """
 
     sub: Optional[str] = None
     exp: Optional[int] = None
     type: Optional[str] = None
     scopes: Optional[List[str]] = None
+    roles: Optional[List[str]] = None
+    pv: Optional[int] = None
+    su: bool = False
 
 
 class TokenData(BaseSchema):
@@ -47,10 +53,16 @@ class TokenData(BaseSchema):
     Attributes:
         user_id: User ID from token
         scopes: User permission scopes
+        roles: User role codes
+        permissions_version: User permissions version the scopes were built from
+        is_superuser: Whether the user is a superuser
     """
 
     user_id: str
     scopes: List[str] = []
+    roles: List[str] = []
+    permissions_version: Optional[int] = None
+    is_superuser: bool = False
 
 
 class RefreshToken(BaseSchema):
@@ -3,11 +3,17 @@ User Schema Module
 
 This module defines Pydantic schemas for user data validation and serialization.
 """
-from typing import List, Optional
+from typing import Any, List, Literal, Optional
 
-from pydantic import EmailStr, Field, field_validator
+from pydantic import EmailStr, Field, field_validator, model_validator
 
-from app.schemas.base import BaseProperties, BaseSchema
+from app.schemas.base import (
+    BaseProperties,
+    BaseSchema,
+    BulkFilter,
+    BulkSelection,
+    BulkValues,
+)
 from app.schemas.role import RoleResponse
 
 
@@ -98,3 +104,155 @@ class UserWithRoles(BaseSchema):
     """
 
     role_ids: List[str]
+
+
+class UserRolesBulkUpdate(BaseSchema):
+    """
+    Schema for granting or revoking roles of many users at once.
+
+    Attributes:
+        user_ids: IDs of the users to update
+        role_ids: Role IDs to assign, grant or revoke
+        mode: 'replace' sets exactly these roles, 'add' grants them and
+            'remove' revokes them, keeping the users' other roles
+    """
+
+    user_ids: List[str] = Field(..., min_length=1, max_length=10000)
+    role_ids: List[str]
+    mode: Literal["replace", "add", "remove"] = "add"
+
+
+class UserRolesBulkResult(BaseSchema):
+    """
+    Schema for the outcome of a bulk role update.
+
+    Attributes:
+        added: Number of role assignments created
+        removed: Number of role assignments deleted
+    """
+
+    added: int
+    removed: int
+
+
+class UserBulkFilter(BulkFilter):
+    """
+    Schema for the filter selecting users of a bulk operation.
+
+    Attributes:
+        search: Search term, matched like in listings
+        is_active: Whether users are active
+    """
+
+    is_active: Optional[bool] = None
+
+
+class UserBulkSelection(BulkSelection):
+    """
+    Schema for the users targeted by a bulk operation.
+
+    Attributes:
+        ids: IDs of the users
+        filter: Filter matching the users
+        dry_run: Only count the users that would be affected
+    """
+
+    filter: Optional[UserBulkFilter] = None
+
+
+class UserBulkValues(BulkValues):
+    """
+    Schema for the values set by a bulk user update.
+
+    Email and password are unique to each user and cannot be set in bulk.
+
+    Attributes:
+        full_name: User full name
+        is_active: Whether users are active
+        is_superuser: Whether users are superusers
+    """
+
+    required_fields = ("is_active", "is_superuser")
+
+    full_name: Optional[str] = None
+    is_active: Optional[bool] = None
+    is_superuser: Optional[bool] = None
+
+
+class UserBulkUpdate(UserBulkSelection):
+    """
+    Schema for updating many users at once.
+
+    Attributes:
+        values: Values set on every selected user
+    """
+
+    values: UserBulkValues
+
+
+class UserImportRow(BaseSchema):
+    """
+    Schema for one row of a bulk user import.
+
+    Attributes:
+        email: User email
+        full_name: User full name
+        password: Plain-text password, hashed during the import
+        hashed_password: Existing bcrypt hash, e.g. migrated from another system
+        is_active: Whether user is active
+        roles: Codes of the roles to assign (';'-separated in CSV)
+    """
+
+    email: EmailStr
+    full_name: Optional[str] = Field(None, max_length=255)
+    password: Optional[str] = Field(None, min_length=8, max_length=64)
+    hashed_password: Optional[str] = Field(
+        None, pattern=r"^\$2[aby]?\$\d{2}\$[./A-Za-z0-9]{53}$"
+    )
+    is_active: bool = True
+    roles: List[str] = []
+
+    @field_validator("roles", mode="before")
+    @classmethod
+    def split_roles(cls, v: Any) -> Any:
+        """Accept role codes as a ';'-separated string."""
+        if isinstance(v, str):
+            return [code.strip() for code in v.split(";") if code.strip()]
+        return v
+
+    @model_validator(mode="after")
+    def one_password(self) -> "UserImportRow":
+        """Validate that exactly one of password and hashed_password is given."""
+        if (self.password is None) == (self.hashed_password is None):
+            raise ValueError("Exactly one of password and hashed_password is required")
+        return self
+
+
+class UserImportError(BaseSchema):
+    """
+    Schema for a row rejected by a bulk user import.
+
+    Attributes:
+        row: Row number in the upload (1-based, header excluded)
+        email: Email of the row, if it could be read
+        detail: Reason the row was rejected
+    """
+
+    row: int
+    email: Optional[str] = None
+    detail: str
+
+
+class UserImportResult(BaseSchema):
+    """
+    Schema for the outcome of a bulk user import.
+
+    Attributes:
+        total: Number of rows read
+        created: Number of users created
+        errors: Rejected rows
+    """
+
+    total: int
+    created: int
+    errors: List[UserImportError] = []
@@ -3,6 +3,8 @@ Authentication Service Module
 
 This module handles authentication and token management services.
 """
+import logging
+import uuid
 from typing import List, Optional
 
 from jose import JWTError
@@ -12,12 +14,19 @@ from app.core.exceptions import ForbiddenError, UnauthorizedError
 from app.core.security import (
     create_access_token,
     create_refresh_token,
+    decode_token,
     validate_access_token,
     validate_refresh_token,
 )
 from app.crud.user import user_crud
 from app.models.user import User
+from app.schemas.principal import Principal
 from app.schemas.token import Token
+from app.services.principal import principal_cache
+from app.services.refresh_tokens import REUSED, ROTATED, refresh_token_store
+from app.services.token_denylist import token_denylist
+
+logger = logging.getLogger(__name__)
 
 
 class AuthService:
@@ -45,34 +54,49 @@ class AuthService:
     @staticmethod
     async def create_tokens(user: User) -> Token:
         """
-        Create access and refresh tokens for a user.
+        Create access and refresh tokens for a user, starting a new token family.
 
         Args:
-            user: User object
+            user: User object loaded with roles and permissions
 
         Returns:
             Token: Token response with access and refresh tokens
         """
-        # Extract user roles and permissions for token scopes
-        scopes = []
+        principal = Principal.from_user(user)
+        principal_cache.set(principal.id, principal)
 
-        # Add role codes
-        for role in user.roles:
-            scopes.append(f"role:{role.code}")
+        family = uuid.uuid4().hex
+        jti = uuid.uuid4().hex
+        await refresh_token_store.add(family, jti)
+        return AuthService.mint_tokens(principal, family, jti)
 
-            # Add permission codes
-            for permission in role.permissions:
-                scopes.append(permission.code)
+    @staticmethod
+    def mint_tokens(principal: Principal, family: str, jti: str) -> Token:
+        """
+        Encode the token pair of a principal.
 
-        # Remove duplicates while preserving order
-        unique_scopes = []
-        for scope in scopes:
-            if scope not in unique_scopes:
-                unique_scopes.append(scope)
+        Args:
+            principal: Principal the tokens are issued for
+            family: Refresh token family ID
+            jti: ID of the refresh token, registered in the store
 
-        # Create tokens
-        access_token = create_access_token(subject=user.id, scopes=unique_scopes)
-        refresh_token = create_refresh_token(subject=user.id)
+        Returns:
+            Token: Token response with access and refresh tokens
+        """
+        # Role scopes first, then the permissions granted through the roles
+        roles = sorted(principal.roles)
+        scopes = [f"role:{code}" for code in roles] + sorted(principal.permissions)
+
+        access_token = create_access_token(
+            subject=principal.id,
+            scopes=scopes,
+            roles=roles,
+            permissions_version=principal.permissions_version,
+            is_superuser=principal.is_superuser,
+        )
+        refresh_token = create_refresh_token(
+            subject=principal.id, jti=jti, family=family
+        )
 
         return Token(
             access_token=access_token,
@@ -82,7 +106,11 @@ class AuthService:
     @staticmethod
     async def refresh_token(db: AsyncSession, refresh_token: str) -> Token:
         """
-        Refresh access token using a valid refresh token.
+        Rotate a refresh token and issue a new token pair.
+
+        The presented token is marked used. Presenting it again revokes its
+        whole family, since either the client or an attacker holds a copy.
+        The new access token is minted from the cached principal.
 
         Args:
             db: Database session
@@ -92,29 +120,62 @@ class AuthService:
             Token: New token pair
 
         Raises:
-            UnauthorizedError: If refresh token is invalid
+            UnauthorizedError: If refresh token is invalid, used or revoked
         """
         try:
             # Validate refresh token
             payload = validate_refresh_token(refresh_token)
-            user_id = payload.get("sub")
+        except JWTError:
+            raise UnauthorizedError("Invalid refresh token")
 
-            if not user_id:
-                raise UnauthorizedError("Invalid refresh token")
+        user_id = payload.get("sub")
+        family = payload.get("fam")
+        jti = payload.get("jti")
+        if not user_id or not family or not jti:
+            raise UnauthorizedError("Invalid refresh token")
 
-            # Get user
-            user = await user_crud.get_user_with_roles(db, user_id=user_id)
-            if not user:
-                raise UnauthorizedError("User not found")
+        new_jti = uuid.uuid4().hex
+        result = await refresh_token_store.rotate(family, jti, new_jti)
+        if result == REUSED:
+            logger.warning(
+                "Refresh token reuse detected, revoked family %s of user %s",
+                family,
+                user_id,
+            )
+        if result != ROTATED:
+            raise UnauthorizedError("Invalid refresh token")
+
+        principal = await user_crud.get_principal(db, user_id=user_id)
+        if not principal:
+            raise UnauthorizedError("User not found")
+
+        if not principal.is_active:
+            await refresh_token_store.revoke_family(family)
+            raise UnauthorizedError("Inactive user")
 
-            if not user.is_active:
-                raise UnauthorizedError("Inactive user")
+        return AuthService.mint_tokens(principal, family, new_jti)
+
+    @staticmethod
+    async def revoke_token(token: str) -> None:
+        """
+        Revoke a token.
 
-            # Create new tokens
-            return await AuthService.create_tokens(user)
+        A refresh token revokes every token rotated from its login; an access
+        token is denylisted until it expires. Invalid or expired tokens are
+        ignored, as in RFC 7009.
 
+        Args:
+            token: JWT access or refresh token
+        """
+        try:
+            payload = decode_token(token)
         except JWTError:
-            raise UnauthorizedError("Invalid refresh token")
+            return
+
+        if payload.get("type") == "refresh" and payload.get("fam"):
+            await refresh_token_store.revoke_family(payload["fam"])
+        elif payload.get("type") == "access" and payload.get("jti"):
+            await token_denylist.revoke(payload["jti"], payload["exp"])
 
     @staticmethod
     async def validate_token_scopes(token: str, required_scopes: List[str]) -> bool:
@@ -134,6 +195,9 @@ class AuthService:
         """
         try:
             payload = validate_access_token(token)
+            if await token_denylist.is_revoked(payload.get("jti")):
+                raise UnauthorizedError("Token has been revoked")
+
             token_scopes = payload.get("scopes", [])
 
             # Check if token has all required scopes
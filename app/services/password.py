@@ -0,0 +1,183 @@
+"""
+Password Hashing Service Module
+
+This module runs bcrypt hashing and verification in a bounded worker pool,
+keeping the CPU-bound work off the event loop.
+"""
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence, TypeVar
+
+from app.core.config import settings
+from app.core.exceptions import ServiceUnavailableError
+from app.core.security import (
+    get_password_hash,
+    get_password_hashes,
+    verify_password,
+)
+
+T = TypeVar("T")
+
+
+class PasswordHasher:
+    """
+    Async password hashing service backed by a thread or process pool.
+
+    Jobs beyond ``max_pending`` (queued plus running) are rejected with a
+    503 instead of piling up behind the pool.
+
+    Attributes:
+        executor_type: Pool type, either 'thread' or 'process'
+        max_workers: Number of pool workers
+        max_pending: Maximum number of in-flight hashing jobs
+        retry_after: Retry-After seconds sent when the pool is saturated
+    """
+
+    def __init__(
+        self,
+        executor_type: str = "thread",
+        max_workers: int = 4,
+        max_pending: int = 32,
+        retry_after: int = 1,
+    ):
+        """
+        Initialize the service configuration. The pool itself is created lazily.
+
+        Args:
+            executor_type: Pool type, either 'thread' or 'process'
+            max_workers: Number of pool workers
+            max_pending: Maximum number of in-flight hashing jobs
+            retry_after: Retry-After seconds sent when the pool is saturated
+        """
+        if executor_type not in ("thread", "process"):
+            raise ValueError(f"Unknown executor type: {executor_type}")
+
+        self.executor_type = executor_type
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.retry_after = retry_after
+        self._executor: Optional[Executor] = None
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of hashing jobs currently queued or running."""
+        return self._pending
+
+    def _get_executor(self) -> Executor:
+        """
+        Get the worker pool, creating it on first use.
+
+        Returns:
+            Executor: Thread or process pool
+        """
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="password-hasher",
+                )
+        return self._executor
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a hashing function in the pool, applying backpressure.
+
+        Args:
+            func: Module-level function to execute (must be picklable)
+            *args: Function arguments
+
+        Returns:
+            Function result
+
+        Raises:
+            ServiceUnavailableError: If the pool is saturated
+        """
+        if self._pending >= self.max_pending:
+            raise ServiceUnavailableError(
+                "Too many concurrent password operations, please retry",
+                retry_after=self.retry_after,
+            )
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self._pending -= 1
+
+    async def hash(self, password: str) -> str:
+        """
+        Generate a password hash without blocking the event loop.
+
+        Args:
+            password: Plain-text password
+
+        Returns:
+            str: Hashed password
+        """
+        return await self._run(get_password_hash, password)
+
+    async def hash_many(
+        self, passwords: Sequence[str], batch_size: int = 32
+    ) -> List[str]:
+        """
+        Hash many passwords, spreading batches over the pool workers.
+
+        Each batch is one pool job, which keeps the pickling overhead of a
+        process pool low. At most one batch per worker is in flight, leaving
+        room in the pending limit for interactive logins.
+
+        Args:
+            passwords: Plain-text passwords
+            batch_size: Number of passwords hashed per job
+
+        Returns:
+            List[str]: Hashed passwords, in the same order
+
+        Raises:
+            ServiceUnavailableError: If the pool is saturated
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def hash_batch(batch: List[str]) -> List[str]:
+            async with semaphore:
+                return await self._run(get_password_hashes, batch)
+
+        batches = await asyncio.gather(
+            *(
+                hash_batch(list(passwords[start : start + batch_size]))
+                for start in range(0, len(passwords), batch_size)
+            )
+        )
+        return [hashed for batch in batches for hashed in batch]
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Verify a password against a hash without blocking the event loop.
+
+        Args:
+            plain_password: Plain-text password
+            hashed_password: Hashed password
+
+        Returns:
+            bool: True if password matches hash
+        """
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def shutdown(self) -> None:
+        """Shut down the worker pool, waiting for running jobs to finish."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+# Create singleton instance
+password_hasher = PasswordHasher(
+    executor_type=settings.PASSWORD_HASH_EXECUTOR,
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    retry_after=settings.PASSWORD_HASH_RETRY_AFTER,
+)
@@ -0,0 +1,131 @@
+"""
+Principal Cache Service Module
+
+This module keeps authenticated principals in memory so that steady-state
+requests resolve their identity without touching the database.
+"""
+from typing import Any, Callable, Iterable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.metrics import register_cache
+from app.schemas.principal import Principal
+
+
+class PrincipalCache(TTLCache[str, Principal]):
+    """
+    Per-worker TTL + LRU cache of principals keyed by user ID.
+
+    Writes that change a user's identity or grants must call one of the
+    invalidation hooks; the TTL bounds staleness across workers.
+    """
+
+    def invalidate_user(self, user_id: str) -> None:
+        """
+        Drop the cached principal of a user.
+
+        Args:
+            user_id: User ID
+        """
+        self.pop(str(user_id))
+
+    def invalidate_users_on_commit(
+        self, db: AsyncSession, user_ids: Iterable[Any]
+    ) -> None:
+        """
+        Drop the cached principals of users now and again when the session commits.
+
+        Call after the write: a concurrent request may reload a principal
+        before the transaction commits and cache the old state, which the
+        second pass drops.
+
+        Args:
+            db: Database session holding the write
+            user_ids: User IDs
+        """
+        self._invalidate_on_commit(db, self.pop, [str(user_id) for user_id in user_ids])
+
+    def invalidate_roles_on_commit(
+        self, db: AsyncSession, role_codes: Iterable[str]
+    ) -> None:
+        """
+        Drop principals holding roles now and again when the session commits.
+
+        Call after the write, see invalidate_users_on_commit.
+
+        Args:
+            db: Database session holding the write
+            role_codes: Role codes
+        """
+        self._invalidate_on_commit(db, self.invalidate_role, role_codes)
+
+    def invalidate_permissions_on_commit(
+        self, db: AsyncSession, permission_codes: Iterable[str]
+    ) -> None:
+        """
+        Drop principals granted permissions now and again when the session commits.
+
+        Call after the write, see invalidate_users_on_commit.
+
+        Args:
+            db: Database session holding the write
+            permission_codes: Permission codes
+        """
+        self._invalidate_on_commit(db, self.invalidate_permission, permission_codes)
+
+    @staticmethod
+    def _invalidate_on_commit(
+        db: AsyncSession, invalidate: Callable[[Any], Any], keys: Iterable[Any]
+    ) -> None:
+        """
+        Invalidate keys now and once more after the session commits.
+
+        Args:
+            db: Database session holding the write
+            invalidate: Invalidation hook called with each key
+            keys: User IDs, role codes or permission codes
+        """
+        keys = list(keys)
+
+        def _invalidate_all(session: Optional[Session] = None) -> None:
+            for key in keys:
+                invalidate(key)
+
+        _invalidate_all()
+        event.listen(db.sync_session, "after_commit", _invalidate_all, once=True)
+
+    def invalidate_role(self, role_code: str) -> int:
+        """
+        Drop every cached principal holding a role.
+
+        Args:
+            role_code: Role code
+
+        Returns:
+            int: Number of invalidated principals
+        """
+        return self.invalidate_where(lambda _, p: role_code in p.roles)
+
+    def invalidate_permission(self, permission_code: str) -> int:
+        """
+        Drop every cached principal granted a permission.
+
+        Args:
+            permission_code: Permission code
+
+        Returns:
+            int: Number of invalidated principals
+        """
+        return self.invalidate_where(lambda _, p: permission_code in p.permissions)
+
+
+# Create singleton instance
+principal_cache = PrincipalCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+register_cache("principal", principal_cache)
@@ -0,0 +1,265 @@
+"""
+Rate Limiter Service Module
+
+This module counts requests per key with a sliding-window or token-bucket
+algorithm. Counters live in Redis, updated atomically by Lua scripts, and
+fall back to an in-process store when Redis is absent or unreachable.
+"""
+import logging
+import math
+import time
+from typing import Any, Callable, NamedTuple, Optional
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+ALGORITHMS = ("sliding_window", "token_bucket")
+
+# Sliding-window counter: the previous fixed window is weighted by how much
+# of it still overlaps the sliding window.
+SLIDING_WINDOW_LUA = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = t[1] * 1000 + math.floor(t[2] / 1000)
+local start = now - (now % window)
+local current_key = KEYS[1] .. ':' .. start
+local previous = tonumber(redis.call('GET', KEYS[1] .. ':' .. (start - window)) or '0')
+local current = tonumber(redis.call('GET', current_key) or '0')
+local elapsed = now - start
+local count = previous * (window - elapsed) / window + current
+if count + 1 > limit then
+    local retry = window - elapsed
+    if current + 1 <= limit and previous > 0 then
+        retry = math.ceil((1 - (limit - 1 - current) / previous) * window) - elapsed
+    end
+    return {0, 0, math.max(retry, 1)}
+end
+redis.call('INCR', current_key)
+redis.call('PEXPIRE', current_key, window * 2)
+return {1, math.floor(limit - count - 1), 0}
+"""
+
+# Token bucket holding up to limit tokens, refilled at limit per window.
+TOKEN_BUCKET_LUA = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = t[1] * 1000 + math.floor(t[2] / 1000)
+local rate = limit / window
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or limit
+local ts = tonumber(state[2]) or now
+tokens = math.min(limit, tokens + math.max(now - ts, 0) * rate)
+local allowed, retry = 0, 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    retry = math.ceil((1 - tokens) / rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], window)
+return {allowed, math.floor(tokens), retry}
+"""
+
+
+class RateLimitResult(NamedTuple):
+    """
+    Outcome of counting one request against a limit.
+
+    Attributes:
+        allowed: Whether the request is within the limit
+        limit: Maximum number of requests per window
+        remaining: Requests left in the current window
+        retry_after: Seconds to wait before retrying when not allowed
+    """
+
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: int
+
+
+class MemoryRateLimiter:
+    """
+    In-process rate limiter, exact for a single worker only.
+
+    Attributes:
+        algorithm: 'sliding_window' or 'token_bucket'
+    """
+
+    def __init__(
+        self,
+        algorithm: str = "sliding_window",
+        max_keys: int = 100000,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize an empty limiter.
+
+        Args:
+            algorithm: 'sliding_window' or 'token_bucket'
+            max_keys: Maximum number of tracked keys
+            timer: Monotonic clock in seconds
+        """
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown rate limit algorithm: {algorithm}")
+
+        self.algorithm = algorithm
+        self._timer = timer
+        self._state: TTLCache[str, Any] = TTLCache(maxsize=max_keys, ttl=60)
+
+    async def hit(self, key: str, limit: int, window: int) -> RateLimitResult:
+        """
+        Count a request for a key.
+
+        Args:
+            key: Rate limit key
+            limit: Maximum number of requests per window
+            window: Window length in seconds
+
+        Returns:
+            RateLimitResult: Whether the request is allowed
+        """
+        now = self._timer()
+        if self.algorithm == "token_bucket":
+            return self._token_bucket(key, limit, window, now)
+        return self._sliding_window(key, limit, window, now)
+
+    def _sliding_window(
+        self, key: str, limit: int, window: int, now: float
+    ) -> RateLimitResult:
+        """Sliding-window counter, mirroring SLIDING_WINDOW_LUA."""
+        start = now - (now % window)
+        entry = self._state.get(key)
+        if entry is None or entry[0] < start - window:
+            entry = [start, 0, 0]
+        elif entry[0] < start:
+            # The current window of the entry became the previous one
+            entry = [start, entry[2], 0]
+
+        _, previous, current = entry
+        elapsed = now - start
+        count = previous * (window - elapsed) / window + current
+
+        if count + 1 > limit:
+            retry = window - elapsed
+            if current + 1 <= limit and previous > 0:
+                retry = (1 - (limit - 1 - current) / previous) * window - elapsed
+            self._state.set(key, entry, ttl=window * 2)
+            return RateLimitResult(False, limit, 0, max(math.ceil(retry), 1))
+
+        entry[2] = current + 1
+        self._state.set(key, entry, ttl=window * 2)
+        return RateLimitResult(True, limit, math.floor(limit - count - 1), 0)
+
+    def _token_bucket(
+        self, key: str, limit: int, window: int, now: float
+    ) -> RateLimitResult:
+        """Token bucket, mirroring TOKEN_BUCKET_LUA."""
+        rate = limit / window
+        tokens, ts = self._state.get(key) or (limit, now)
+        tokens = min(limit, tokens + max(now - ts, 0) * rate)
+
+        if tokens >= 1:
+            tokens -= 1
+            self._state.set(key, (tokens, now), ttl=window)
+            return RateLimitResult(True, limit, math.floor(tokens), 0)
+
+        self._state.set(key, (tokens, now), ttl=window)
+        return RateLimitResult(False, limit, 0, max(math.ceil((1 - tokens) / rate), 1))
+
+
+class RedisRateLimiter:
+    """
+    Rate limiter shared by all workers through Redis.
+
+    Each check is a single atomic script call. If Redis fails, requests are
+    counted by an in-process fallback limiter instead.
+
+    Attributes:
+        algorithm: 'sliding_window' or 'token_bucket'
+        prefix: Prefix of the Redis keys
+    """
+
+    def __init__(
+        self,
+        redis: Any,
+        algorithm: str = "sliding_window",
+        prefix: str = "rl",
+        fallback: Optional[MemoryRateLimiter] = None,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            redis: Async Redis client
+            algorithm: 'sliding_window' or 'token_bucket'
+            prefix: Prefix of the Redis keys
+            fallback: Limiter used when Redis is unreachable
+        """
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown rate limit algorithm: {algorithm}")
+
+        self.algorithm = algorithm
+        self.prefix = prefix
+        self.fallback = fallback or MemoryRateLimiter(algorithm)
+        self._degraded = False
+        lua = TOKEN_BUCKET_LUA if algorithm == "token_bucket" else SLIDING_WINDOW_LUA
+        self._script = redis.register_script(lua)
+
+    async def hit(self, key: str, limit: int, window: int) -> RateLimitResult:
+        """
+        Count a request for a key.
+
+        Args:
+            key: Rate limit key
+            limit: Maximum number of requests per window
+            window: Window length in seconds
+
+        Returns:
+            RateLimitResult: Whether the request is allowed
+        """
+        # Hash tag keeps the keys of one script call in the same cluster slot
+        redis_key = f"{self.prefix}:{self.algorithm}:{{{key}}}"
+        try:
+            allowed, remaining, retry_ms = await self._script(
+                keys=[redis_key], args=[limit, window * 1000]
+            )
+        except Exception as e:
+            if not self._degraded:
+                logger.warning("Redis unavailable, rate limiting in memory: %s", e)
+                self._degraded = True
+            return await self.fallback.hit(key, limit, window)
+
+        if self._degraded:
+            logger.info("Redis available again, rate limiting in Redis")
+            self._degraded = False
+
+        return RateLimitResult(
+            bool(allowed), limit, int(remaining), math.ceil(int(retry_ms) / 1000)
+        )
+
+
+def create_rate_limiter(algorithm: str) -> Any:
+    """
+    Create the limiter matching the configuration.
+
+    Args:
+        algorithm: 'sliding_window' or 'token_bucket'
+
+    Returns:
+        RedisRateLimiter if Redis is configured, otherwise MemoryRateLimiter
+    """
+    redis = get_redis()
+    if redis is not None:
+        return RedisRateLimiter(redis, algorithm)
+    return MemoryRateLimiter(algorithm)
+
+
+# Create singleton instance
+rate_limiter = create_rate_limiter(settings.RATE_LIMIT_ALGORITHM)
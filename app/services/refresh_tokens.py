@@ -0,0 +1,241 @@
+"""
+Refresh Token Store Service Module
+
+This module tracks issued refresh tokens so they can be rotated and revoked.
+Every refresh token carries a jti (token ID) and a family ID shared by all
+tokens rotated from the same login. Presenting a token marks it used and
+issues its successor; presenting a used token again means it was stolen, so
+the whole family is revoked.
+
+Each check is a constant-time key lookup. Tokens live in Redis when it is
+configured, otherwise in an in-process store (single worker only).
+"""
+import logging
+from typing import Any
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.exceptions import ServiceUnavailableError
+from app.core.redis import get_redis, require_shared_redis
+
+logger = logging.getLogger(__name__)
+
+# Outcomes of a rotation
+ROTATED = "rotated"
+UNKNOWN = "unknown"
+REVOKED = "revoked"
+REUSED = "reused"
+
+# Token states
+ACTIVE = "a"
+USED = "u"
+
+# KEYS: presented token, new token, family revocation marker
+# ARGV: new token TTL (ms), family revocation TTL (ms)
+ROTATE_LUA = """
+if redis.call('EXISTS', KEYS[3]) == 1 then
+    return 'revoked'
+end
+local state = redis.call('GET', KEYS[1])
+if not state then
+    return 'unknown'
+end
+if state == 'u' then
+    redis.call('SET', KEYS[3], '1', 'PX', ARGV[2])
+    return 'reused'
+end
+redis.call('SET', KEYS[1], 'u', 'KEEPTTL')
+redis.call('SET', KEYS[2], 'a', 'PX', ARGV[1])
+return 'rotated'
+"""
+
+
+class MemoryRefreshTokenStore:
+    """
+    In-process refresh token store, for a single worker only.
+
+    Attributes:
+        ttl: Lifetime of a refresh token in seconds
+    """
+
+    def __init__(self, ttl: int, max_tokens: int = 100000):
+        """
+        Initialize an empty store.
+
+        Args:
+            ttl: Lifetime of a refresh token in seconds
+            max_tokens: Maximum number of tracked tokens and revoked families
+        """
+        self.ttl = ttl
+        self._tokens: TTLCache[str, str] = TTLCache(maxsize=max_tokens, ttl=ttl)
+        self._revoked: TTLCache[str, bool] = TTLCache(maxsize=max_tokens, ttl=ttl)
+
+    async def add(self, family: str, jti: str) -> None:
+        """
+        Register a newly issued token.
+
+        Args:
+            family: Token family ID
+            jti: Token ID
+        """
+        self._tokens.set(f"{family}:{jti}", ACTIVE)
+
+    async def rotate(self, family: str, jti: str, new_jti: str) -> str:
+        """
+        Mark a token used and register its successor.
+
+        Args:
+            family: Token family ID
+            jti: ID of the presented token
+            new_jti: ID of the token replacing it
+
+        Returns:
+            str: ROTATED, UNKNOWN, REVOKED or REUSED
+        """
+        if self._revoked.get(family):
+            return REVOKED
+
+        key = f"{family}:{jti}"
+        state = self._tokens.get(key)
+        if state is None:
+            return UNKNOWN
+        if state == USED:
+            self._revoked.set(family, True)
+            return REUSED
+
+        # Re-set with a full TTL: the used marker outlives the token itself
+        self._tokens.set(key, USED)
+        self._tokens.set(f"{family}:{new_jti}", ACTIVE)
+        return ROTATED
+
+    async def revoke_family(self, family: str) -> None:
+        """
+        Revoke every token of a family.
+
+        Args:
+            family: Token family ID
+        """
+        self._revoked.set(family, True)
+
+
+class RedisRefreshTokenStore:
+    """
+    Refresh token store shared by all workers through Redis.
+
+    Keys of a family share a hash tag, so a rotation is one atomic script
+    call on one cluster slot. Failures are raised as 503: accepting tokens
+    without the store would defeat revocation.
+
+    Attributes:
+        ttl: Lifetime of a refresh token in seconds
+        prefix: Prefix of the Redis keys
+    """
+
+    def __init__(self, redis: Any, ttl: int, prefix: str = "rt"):
+        """
+        Initialize the store.
+
+        Args:
+            redis: Async Redis client
+            ttl: Lifetime of a refresh token in seconds
+            prefix: Prefix of the Redis keys
+        """
+        self.redis = redis
+        self.ttl = ttl
+        self.prefix = prefix
+        self._rotate = redis.register_script(ROTATE_LUA)
+
+    def _token_key(self, family: str, jti: str) -> str:
+        """Redis key of a token."""
+        return f"{self.prefix}:{{{family}}}:{jti}"
+
+    def _revoked_key(self, family: str) -> str:
+        """Redis key marking a family revoked."""
+        return f"{self.prefix}:{{{family}}}:revoked"
+
+    async def add(self, family: str, jti: str) -> None:
+        """
+        Register a newly issued token.
+
+        Args:
+            family: Token family ID
+            jti: Token ID
+
+        Raises:
+            ServiceUnavailableError: If Redis is unreachable
+        """
+        try:
+            await self.redis.set(self._token_key(family, jti), ACTIVE, ex=self.ttl)
+        except Exception as e:
+            logger.error("Refresh token store unavailable: %s", e)
+            raise ServiceUnavailableError()
+
+    async def rotate(self, family: str, jti: str, new_jti: str) -> str:
+        """
+        Mark a token used and register its successor.
+
+        Args:
+            family: Token family ID
+            jti: ID of the presented token
+            new_jti: ID of the token replacing it
+
+        Returns:
+            str: ROTATED, UNKNOWN, REVOKED or REUSED
+
+        Raises:
+            ServiceUnavailableError: If Redis is unreachable
+        """
+        try:
+            result = await self._rotate(
+                keys=[
+                    self._token_key(family, jti),
+                    self._token_key(family, new_jti),
+                    self._revoked_key(family),
+                ],
+                args=[self.ttl * 1000, self.ttl * 1000],
+            )
+        except Exception as e:
+            logger.error("Refresh token store unavailable: %s", e)
+            raise ServiceUnavailableError()
+
+        return result.decode() if isinstance(result, bytes) else result
+
+    async def revoke_family(self, family: str) -> None:
+        """
+        Revoke every token of a family.
+
+        Args:
+            family: Token family ID
+
+        Raises:
+            ServiceUnavailableError: If Redis is unreachable
+        """
+        try:
+            await self.redis.set(self._revoked_key(family), "1", ex=self.ttl)
+        except Exception as e:
+            logger.error("Refresh token store unavailable: %s", e)
+            raise ServiceUnavailableError()
+
+
+def create_refresh_token_store() -> Any:
+    """
+    Create the store matching the configuration.
+
+    Returns:
+        RedisRefreshTokenStore if Redis is configured, otherwise MemoryRefreshTokenStore
+
+    Raises:
+        RuntimeError: If several workers run without Redis
+    """
+    ttl = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 3600
+    redis = get_redis()
+    if redis is not None:
+        return RedisRefreshTokenStore(redis, ttl)
+    require_shared_redis("The refresh token store")
+    return MemoryRefreshTokenStore(
+        ttl, max_tokens=settings.REFRESH_TOKEN_STORE_MAX_SIZE
+    )
+
+
+# Create singleton instance
+refresh_token_store = create_refresh_token_store()
@@ -0,0 +1,255 @@
+"""
+Token Denylist Service Module
+
+This module tracks revoked access tokens by jti until they expire. Every
+worker keeps a Bloom filter of the revoked jtis, so checking a token that
+was not revoked never leaves the process. Only filter hits are confirmed
+against the authoritative store: Redis when configured, otherwise an
+in-process map, which only works with a single worker.
+
+With Redis, revocations are published on a channel and every worker adds
+them to its filter. Filters are rebuilt from the store on (re)subscription
+and once per access token lifetime, which drops expired entries.
+"""
+import asyncio
+import heapq
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.bloom import BloomFilter
+from app.core.config import settings
+from app.core.exceptions import ServiceUnavailableError
+from app.core.redis import get_redis, require_shared_redis
+
+logger = logging.getLogger(__name__)
+
+
+class TokenDenylist:
+    """
+    Revoked access token IDs with a per-worker Bloom filter in front.
+
+    Attributes:
+        redis: Async Redis client, None for a single-worker in-process store
+        prefix: Prefix of the Redis keys and Pub/Sub channel
+        rebuild_interval: Seconds between filter rebuilds
+    """
+
+    def __init__(
+        self,
+        redis: Optional[Any],
+        capacity: int,
+        error_rate: float = 0.001,
+        rebuild_interval: float = 1800,
+        prefix: str = "dl",
+    ):
+        """
+        Initialize an empty denylist.
+
+        Args:
+            redis: Async Redis client or None
+            capacity: Number of revoked tokens the filter is sized for
+            error_rate: False positive rate of the filter at capacity
+            rebuild_interval: Seconds between filter rebuilds
+            prefix: Prefix of the Redis keys
+        """
+        self.redis = redis
+        self.prefix = prefix
+        self.rebuild_interval = rebuild_interval
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._filter = BloomFilter(capacity, error_rate)
+        # In-process store: expiration by jti, and a heap of them to purge.
+        # Revocations are never evicted before they expire.
+        self._local: Dict[str, float] = {}
+        self._expirations: List[Tuple[float, str]] = []
+        self._listener: Optional[asyncio.Task] = None
+        self._rebuilt_at = time.monotonic()
+
+    @property
+    def channel(self) -> str:
+        """Pub/Sub channel carrying revoked jtis."""
+        return f"{self.prefix}:revoked"
+
+    async def revoke(self, jti: str, expires_at: float) -> None:
+        """
+        Revoke a token until it expires.
+
+        Args:
+            jti: Token ID
+            expires_at: Token expiration as a Unix timestamp
+
+        Raises:
+            ServiceUnavailableError: If Redis is unreachable
+        """
+        ttl = expires_at - time.time()
+        if ttl <= 0:
+            return
+
+        if self.redis is None:
+            self._store_local(jti, expires_at)
+            if time.monotonic() - self._rebuilt_at >= self.rebuild_interval:
+                await self.rebuild()
+            self._filter.add(jti)
+            return
+
+        self._filter.add(jti)
+        try:
+            await self.redis.set(
+                f"{self.prefix}:{jti}", "1", px=max(int(ttl * 1000), 1)
+            )
+            await self.redis.publish(self.channel, jti)
+        except Exception as e:
+            logger.error("Token denylist unavailable: %s", e)
+            raise ServiceUnavailableError()
+
+    async def is_revoked(self, jti: Optional[str]) -> bool:
+        """
+        Check whether a token was revoked.
+
+        Tokens missing from the filter are answered in process. Filter hits
+        are confirmed in the store; if Redis is unreachable they are treated
+        as revoked.
+
+        Args:
+            jti: Token ID, None for tokens issued without one
+
+        Returns:
+            bool: True if the token is revoked
+        """
+        if jti is None or jti not in self._filter:
+            return False
+
+        if self.redis is None:
+            return self._local.get(jti, 0) > time.time()
+
+        try:
+            return bool(await self.redis.exists(f"{self.prefix}:{jti}"))
+        except Exception as e:
+            logger.warning("Token denylist unavailable, rejecting token: %s", e)
+            return True
+
+    async def rebuild(self) -> int:
+        """
+        Replace the filter with one holding the jtis currently revoked in the store.
+
+        Returns:
+            int: Number of revoked tokens loaded
+        """
+        fresh = BloomFilter(self._capacity, self._error_rate)
+        if self.redis is None:
+            self._purge_local()
+            for jti in self._local:
+                fresh.add(jti)
+        else:
+            start = len(self.prefix) + 1
+            async for key in self.redis.scan_iter(match=f"{self.prefix}:*", count=1000):
+                key = key.decode() if isinstance(key, bytes) else key
+                fresh.add(key[start:])
+
+        self._filter = fresh
+        self._rebuilt_at = time.monotonic()
+        return len(fresh)
+
+    def _store_local(self, jti: str, expires_at: float) -> None:
+        """
+        Keep a revocation in process until it expires.
+
+        Going over capacity raises the filter's false positive rate, so it
+        is logged; revocations are kept regardless.
+
+        Args:
+            jti: Token ID
+            expires_at: Token expiration as a Unix timestamp
+        """
+        self._purge_local()
+        if expires_at <= self._local.get(jti, 0):
+            return
+
+        self._local[jti] = expires_at
+        heapq.heappush(self._expirations, (expires_at, jti))
+        if len(self._local) == self._capacity + 1:
+            logger.error(
+                "Token denylist holds more than TOKEN_DENYLIST_CAPACITY=%d "
+                "revoked tokens; raise it or configure Redis",
+                self._capacity,
+            )
+
+    def _purge_local(self) -> None:
+        """Drop the in-process revocations that have expired."""
+        now = time.time()
+        while self._expirations and self._expirations[0][0] <= now:
+            expires_at, jti = heapq.heappop(self._expirations)
+            if self._local.get(jti) == expires_at:
+                del self._local[jti]
+
+    async def _listen(self) -> None:
+        """Follow revocations published by other workers, resubscribing on errors."""
+        retry = 1.0
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                # Rebuild after subscribing, so no revocation falls in between
+                await self.rebuild()
+                retry = 1.0
+
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=1.0
+                    )
+                    if message is not None:
+                        data = message["data"]
+                        self._filter.add(
+                            data.decode() if isinstance(data, bytes) else data
+                        )
+                    if time.monotonic() - self._rebuilt_at >= self.rebuild_interval:
+                        await self.rebuild()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Token denylist subscription lost, retrying: %s", e)
+                await asyncio.sleep(retry)
+                retry = min(retry * 2, 30.0)
+            finally:
+                await pubsub.aclose()
+
+    async def start(self) -> None:
+        """Start following revocations from Redis (no-op without Redis)."""
+        if self.redis is not None and self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Stop following revocations."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+
+def create_token_denylist() -> TokenDenylist:
+    """
+    Create the denylist matching the configuration.
+
+    Returns:
+        TokenDenylist: Denylist backed by Redis if configured, otherwise in-process
+
+    Raises:
+        RuntimeError: If several workers run without Redis
+    """
+    redis = get_redis()
+    if redis is None:
+        require_shared_redis("The access token denylist")
+    return TokenDenylist(
+        redis,
+        capacity=settings.TOKEN_DENYLIST_CAPACITY,
+        error_rate=settings.TOKEN_DENYLIST_ERROR_RATE,
+        rebuild_interval=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+    )
+
+
+# Create singleton instance
+token_denylist = create_token_denylist()
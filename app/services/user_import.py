@@ -0,0 +1,411 @@
+"""
+User Import Service Module
+
+This module creates users in bulk from CSV or NDJSON uploads. The upload is
+parsed as it streams in and each row is validated on its own, so bad rows
+are reported instead of failing the whole import. Passwords are hashed in
+batches on the password hashing pool. Valid rows are loaded into temporary
+staging tables (with COPY on asyncpg) and merged into the user and
+user_role tables by two set-based statements, in the request's transaction.
+"""
+import codecs
+import csv
+import json
+import logging
+import time
+import uuid
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, List, Set, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    exists,
+    false,
+    insert,
+    literal,
+    select,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.exceptions import BadRequestError
+from app.crud.association import insert_ignoring_conflicts
+from app.models.role import Role
+from app.models.user import User, user_role
+from app.schemas.user import UserImportError, UserImportResult, UserImportRow
+from app.services.password import password_hasher
+
+logger = logging.getLogger(__name__)
+
+# Supported upload formats
+CSV = "text/csv"
+NDJSON = "application/x-ndjson"
+IMPORT_CONTENT_TYPES = (CSV, NDJSON)
+
+# Lines a quoted CSV value may span before its row is reported unterminated
+MAX_CSV_RECORD_LINES = 100
+
+# Staging tables, created per import and dropped before it returns
+_staging = MetaData()
+user_staging = Table(
+    "user_import",
+    _staging,
+    Column("position", Integer, nullable=False),
+    Column("id", String(36), nullable=False),
+    Column("email", String(255), nullable=False),
+    Column("hashed_password", String(255), nullable=False),
+    Column("full_name", String(255)),
+    Column("is_active", Boolean, nullable=False),
+    prefixes=["TEMPORARY"],
+)
+user_role_staging = Table(
+    "user_role_import",
+    _staging,
+    Column("user_id", String(36), nullable=False),
+    Column("role_id", String(36), nullable=False),
+    prefixes=["TEMPORARY"],
+)
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """
+    Split a UTF-8 byte stream into lines without reading it whole.
+
+    Args:
+        chunks: Byte chunks, e.g. a request body stream
+
+    Yields:
+        str: Lines without their line terminator
+
+    Raises:
+        BadRequestError: If the stream is not valid UTF-8
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    try:
+        async for chunk in chunks:
+            pending += decoder.decode(chunk)
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                yield line.rstrip("\r")
+        pending += decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        raise BadRequestError("Upload must be UTF-8")
+    if pending:
+        yield pending.rstrip("\r")
+
+
+async def iter_records(
+    chunks: AsyncIterator[bytes], content_type: str
+) -> AsyncIterator[Tuple[int, Any]]:
+    """
+    Parse an upload into records as it streams in.
+
+    CSV uploads start with a header line naming the fields; quoted values
+    may span up to MAX_CSV_RECORD_LINES lines. A row whose quote does not
+    close by then, or by the end of the upload, is reported and the lines
+    after it are parsed again. NDJSON uploads hold one JSON object per line.
+    Blank lines are skipped.
+
+    Args:
+        chunks: Byte chunks of the upload
+        content_type: CSV or NDJSON
+
+    Yields:
+        Tuple[int, Any]: Row number (1-based, header excluded) and the
+        record as a dict, or a message if the row could not be parsed
+
+    Raises:
+        BadRequestError: If the upload is not UTF-8 or its CSV header is unterminated
+    """
+    row = 0
+    if content_type == NDJSON:
+        async for line in iter_lines(chunks):
+            if not line.strip():
+                continue
+            row += 1
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield row, f"Invalid JSON: {e}"
+                continue
+            yield row, record if isinstance(record, dict) else "Expected a JSON object"
+        return
+
+    lines = iter_lines(chunks)
+    replay: Deque[str] = deque()
+    header = None
+    record: List[str] = []
+    quotes = 0
+    while True:
+        line = replay.popleft() if replay else await anext(lines, None)
+        if line is not None:
+            record.append(line)
+            quotes += line.count('"')
+            # An odd number of quotes means a quoted value continues on the next line
+            if quotes % 2 and len(record) < MAX_CSV_RECORD_LINES:
+                continue
+        elif not record:
+            break
+
+        if quotes % 2:
+            # The quote never closes: report the first line, parse the others again
+            if header is None:
+                raise BadRequestError("Unterminated quoted value in the CSV header")
+            row += 1
+            yield row, "Unterminated quoted value"
+            replay.extendleft(reversed(record[1:]))
+            record, quotes = [], 0
+            continue
+
+        text = "\n".join(record)
+        record, quotes = [], 0
+        if text.strip():
+            values = next(csv.reader([text]))
+            if header is None:
+                header = [name.strip() for name in values]
+            else:
+                row += 1
+                if len(values) != len(header):
+                    yield row, f"Expected {len(header)} fields, got {len(values)}"
+                else:
+                    # Empty cells leave the field to its default
+                    yield row, {k: v for k, v in zip(header, values) if v != ""}
+
+
+def _error_detail(error: ValidationError) -> str:
+    """Summarize a validation error in one line."""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc']) or 'row'}: {item['msg']}"
+        for item in error.errors()
+    )
+
+
+class UserImportService:
+    """
+    Bulk creation of users with their roles.
+
+    Attributes:
+        max_rows: Maximum number of rows per upload
+    """
+
+    def __init__(self, max_rows: int = 50000):
+        """
+        Initialize the service.
+
+        Args:
+            max_rows: Maximum number of rows per upload
+        """
+        self.max_rows = max_rows
+
+    async def import_users(
+        self, db: AsyncSession, chunks: AsyncIterator[bytes], content_type: str
+    ) -> UserImportResult:
+        """
+        Create the users described by an upload.
+
+        Rows are rejected individually when they fail validation, repeat an
+        email of an earlier row, name an unknown role or use an email that
+        is already registered. The other rows are created.
+
+        Args:
+            db: Database session
+            chunks: Byte chunks of the upload
+            content_type: CSV or NDJSON
+
+        Returns:
+            UserImportResult: Number of users created and rejected rows
+
+        Raises:
+            BadRequestError: If the upload has more than max_rows rows
+            ServiceUnavailableError: If the password hashing pool is saturated
+        """
+        started = time.perf_counter()
+        result = await db.execute(select(Role.code, Role.id))
+        role_ids = dict(result.all())
+
+        errors: List[UserImportError] = []
+        accepted: List[Tuple[int, UserImportRow]] = []
+        seen_emails = set()
+        total = 0
+
+        async for row, record in iter_records(chunks, content_type):
+            total = row
+            if row > self.max_rows:
+                raise BadRequestError(f"Imports are limited to {self.max_rows} rows")
+            if isinstance(record, str):
+                errors.append(UserImportError(row=row, detail=record))
+                continue
+
+            try:
+                user_in = UserImportRow.model_validate(record)
+            except ValidationError as e:
+                email = record.get("email")
+                errors.append(
+                    UserImportError(
+                        row=row,
+                        email=email if isinstance(email, str) else None,
+                        detail=_error_detail(e),
+                    )
+                )
+                continue
+
+            unknown = [code for code in user_in.roles if code not in role_ids]
+            if unknown:
+                detail = f"Unknown roles: {', '.join(unknown)}"
+            elif user_in.email in seen_emails:
+                detail = "Email repeated in the upload"
+            else:
+                seen_emails.add(user_in.email)
+                accepted.append((row, user_in))
+                continue
+            errors.append(UserImportError(row=row, email=user_in.email, detail=detail))
+
+        created = 0
+        if accepted:
+            rejected = await self._load(db, accepted, role_ids)
+            errors.extend(
+                UserImportError(
+                    row=row, email=user_in.email, detail="Email already registered"
+                )
+                for row, user_in in accepted
+                if row in rejected
+            )
+            created = len(accepted) - len(rejected)
+
+        elapsed = time.perf_counter() - started
+        logger.info(
+            "Imported %d of %d users in %.2fs (%.0f rows/s)",
+            created,
+            total,
+            elapsed,
+            total / elapsed if elapsed else 0.0,
+        )
+        errors.sort(key=lambda error: error.row)
+        return UserImportResult(total=total, created=created, errors=errors)
+
+    async def _load(
+        self,
+        db: AsyncSession,
+        accepted: List[Tuple[int, UserImportRow]],
+        role_ids: Dict[str, str],
+    ) -> Set[int]:
+        """
+        Stage the accepted rows and merge them into user and user_role.
+
+        Args:
+            db: Database session
+            accepted: Validated rows with their row numbers
+            role_ids: Role IDs by role code
+
+        Returns:
+            Set[int]: Row numbers not created because the email is already registered
+        """
+        plain = [user_in.password for _, user_in in accepted if user_in.password]
+        hashes = iter(await password_hasher.hash_many(plain))
+
+        users = []
+        grants = []
+        for row, user_in in accepted:
+            user_id = str(uuid.uuid4())
+            users.append(
+                (
+                    row,
+                    user_id,
+                    user_in.email,
+                    next(hashes) if user_in.password else user_in.hashed_password,
+                    user_in.full_name,
+                    user_in.is_active,
+                )
+            )
+            grants.extend(
+                (user_id, role_ids[code]) for code in dict.fromkeys(user_in.roles)
+            )
+
+        connection = await db.connection()
+        # Drop leftovers first: SQLite does not roll back DDL outside a transaction
+        await connection.run_sync(_staging.drop_all, checkfirst=True)
+        await connection.run_sync(_staging.create_all, checkfirst=False)
+        await self._stage(db, user_staging, users)
+        await self._stage(db, user_role_staging, grants)
+
+        dialect_name = db.get_bind().dialect.name
+        staged = user_staging.c
+        query = select(
+            staged.id,
+            staged.email,
+            staged.hashed_password,
+            staged.full_name,
+            staged.is_active,
+            false(),
+            literal(0),
+        ).where(
+            # Skips registered emails everywhere, ON CONFLICT covers concurrent ones
+            ~exists().where(User.email == staged.email)
+        )
+        statement = insert_ignoring_conflicts(
+            dialect_name,
+            User.__table__,
+            [
+                "id",
+                "email",
+                "hashed_password",
+                "full_name",
+                "is_active",
+                "is_superuser",
+                "permissions_version",
+            ],
+            query,
+        ).returning(User.__table__.c.id)
+        result = await db.execute(statement)
+        created_ids = set(result.scalars())
+
+        # Staged IDs are new: only users created above join
+        if grants:
+            await db.execute(
+                insert(user_role).from_select(
+                    ["user_id", "role_id"],
+                    select(
+                        user_role_staging.c.user_id, user_role_staging.c.role_id
+                    ).join(User, User.id == user_role_staging.c.user_id),
+                )
+            )
+        await connection.run_sync(_staging.drop_all, checkfirst=False)
+
+        return {user[0] for user in users if user[1] not in created_ids}
+
+    async def _stage(
+        self, db: AsyncSession, table: Table, records: List[Tuple[Any, ...]]
+    ) -> None:
+        """
+        Load records into a staging table, with COPY when the driver supports it.
+
+        Args:
+            db: Database session
+            table: Staging table
+            records: Row tuples in the table's column order
+        """
+        if not records:
+            return
+
+        columns = [column.name for column in table.columns]
+        connection = await db.connection()
+        if connection.dialect.driver == "asyncpg":
+            raw = await connection.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(
+                table.name, records=records, columns=columns
+            )
+        else:
+            await db.execute(
+                insert(table), [dict(zip(columns, record)) for record in records]
+            )
+
+
+# Create singleton instance
+user_import_service = UserImportService(max_rows=settings.USER_IMPORT_MAX_ROWS)
@@ -0,0 +1,100 @@
+"""
+Test Fixtures Module
+
+This module runs the application against an in-memory SQLite database.
+Sessions behave like the ones from app.db.session.get_db: nothing is
+committed unless the code under test commits.
+"""
+import os
+
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+
+from typing import AsyncGenerator, Dict, List
+
+import httpx
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401
+from app.core.config import settings
+from app.db import init_db
+from app.db.base import Base
+from app.db.session import get_db
+from app.main import app
+
+SUPERUSER_EMAIL = "admin@example.com"
+SUPERUSER_PASSWORD = "admin-password"
+
+
+@pytest.fixture
+async def engine() -> AsyncGenerator[AsyncEngine, None]:
+    """In-memory database with the schema and the initial data."""
+    db_engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with db_engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    settings.FIRST_SUPERUSER_EMAIL = SUPERUSER_EMAIL
+    settings.FIRST_SUPERUSER_PASSWORD = SUPERUSER_PASSWORD
+    async with AsyncSession(db_engine, expire_on_commit=False) as db:
+        permissions = await init_db.init_permissions(db)
+        roles = await init_db.init_roles(db, permissions)
+        await init_db.init_superuser(db, roles)
+
+    yield db_engine
+    await db_engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine: AsyncEngine) -> sessionmaker:
+    """Session factory configured like AsyncSessionLocal."""
+    return sessionmaker(
+        bind=engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
+    )
+
+
+@pytest.fixture
+async def client(
+    session_factory: sessionmaker,
+) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """HTTP client of the application, bound to the test database."""
+
+    async def _get_db() -> AsyncGenerator[AsyncSession, None]:
+        async with session_factory() as session:
+            try:
+                yield session
+            except Exception:
+                await session.rollback()
+                raise
+
+    app.dependency_overrides[get_db] = _get_db
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+    app.dependency_overrides.pop(get_db, None)
+
+
+@pytest.fixture
+async def superuser_headers(client: httpx.AsyncClient) -> Dict[str, str]:
+    """Authorization header of the initial superuser."""
+    response = await client.post(
+        f"{settings.API_PREFIX}/v1/auth/login",
+        data={"username": SUPERUSER_EMAIL, "password": SUPERUSER_PASSWORD},
+    )
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.fixture
+def statements(engine: AsyncEngine) -> List[str]:
+    """SQL statements executed on the test database, in order."""
+    executed: List[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    return executed
@@ -0,0 +1,87 @@
+"""
+Bulk update and delete endpoints.
+"""
+import pytest
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.crud.user import user_crud
+from app.models.user import User
+from app.schemas.user import UserCreate
+
+API_URL = f"{settings.API_PREFIX}/v1"
+
+
+async def create_users(session_factory, *emails):
+    """Create users, returning their IDs."""
+    async with session_factory() as db:
+        users = [
+            await user_crud.create(
+                db, obj_in=UserCreate(email=email, password="user-password")
+            )
+            for email in emails
+        ]
+        await db.commit()
+    return [user.id for user in users]
+
+
+async def test_bulk_update_and_delete_are_committed(
+    client, session_factory, superuser_headers
+):
+    user_ids = await create_users(
+        session_factory, "bulk1@example.com", "bulk2@example.com"
+    )
+    body = {"ids": user_ids, "values": {"is_active": False}}
+
+    response = await client.request(
+        "PATCH",
+        f"{API_URL}/users/",
+        json={**body, "dry_run": True},
+        headers=superuser_headers,
+    )
+    assert response.json() == {"affected": 2, "dry_run": True}
+    response = await client.request(
+        "PATCH", f"{API_URL}/users/", json=body, headers=superuser_headers
+    )
+    assert response.json() == {"affected": 2, "dry_run": False}
+
+    async with session_factory() as db:
+        active = set(
+            await db.scalars(select(User.is_active).where(User.id.in_(user_ids)))
+        )
+    assert active == {False}
+
+    response = await client.request(
+        "DELETE",
+        f"{API_URL}/users/",
+        json={"filter": {"is_active": False}},
+        headers=superuser_headers,
+    )
+    assert response.json() == {"affected": 2, "dry_run": False}
+
+    async with session_factory() as db:
+        remaining = list(await db.scalars(select(User.id).where(User.id.in_(user_ids))))
+    assert remaining == []
+
+
+@pytest.mark.parametrize(
+    "path, values",
+    [
+        ("users", {}),
+        ("users", {"is_active": None}),
+        ("roles", {}),
+        ("roles", {"name": None}),
+        ("permissions", {}),
+        ("permissions", {"name": None}),
+    ],
+)
+async def test_bulk_update_rejects_missing_or_null_values(
+    client, superuser_headers, path, values
+):
+    response = await client.request(
+        "PATCH",
+        f"{API_URL}/{path}/",
+        json={"filter": {"search": "a"}, "values": values},
+        headers=superuser_headers,
+    )
+    assert response.status_code == 422, response.text
@@ -0,0 +1,30 @@
+"""
+Health check.
+"""
+import pytest
+
+from app.core.config import settings
+from app.db.session import get_db
+from app.main import app
+
+HEALTH_URL = f"{settings.API_PREFIX}/v1/health"
+
+
+async def test_health_check(client):
+    response = await client.get(HEALTH_URL)
+    assert response.status_code == 200, response.text
+    assert response.json() == {"status": "ok", "database": "ok"}
+
+
+@pytest.mark.parametrize("error", [OSError("Connection refused"), RuntimeError()])
+async def test_health_check_reports_driver_errors(client, error):
+    class UnreachableSession:
+        async def execute(self, statement):
+            raise error
+
+    async def _get_db():
+        yield UnreachableSession()
+
+    app.dependency_overrides[get_db] = _get_db
+    response = await client.get(HEALTH_URL)
+    assert response.status_code == 503, response.text
@@ -0,0 +1,34 @@
+"""
+Per-request statement statistics.
+"""
+import time
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.core.context import RequestContext, set_request_context
+from app.db.instrumentation import instrument_engine
+
+
+async def test_failing_statements_leave_no_timing_state(engine):
+    instrument_engine(engine.sync_engine)
+    request = RequestContext(request_id="test")
+    set_request_context(request)
+    try:
+        async with engine.connect() as connection:
+            info = dict(connection.sync_connection.info)
+            for _ in range(3):
+                with pytest.raises(OperationalError):
+                    await connection.execute(text("SELECT * FROM missing_table"))
+            assert connection.sync_connection.info == info
+
+            request.db_time_ns = 0
+            start = time.perf_counter_ns()
+            await connection.execute(text("SELECT 1"))
+            elapsed = time.perf_counter_ns() - start
+    finally:
+        set_request_context(None)
+
+    assert request.db_queries == 4
+    assert 0 < request.db_time_ns <= elapsed
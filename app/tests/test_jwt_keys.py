@@ -0,0 +1,102 @@
+"""
+JWT key rotation.
+"""
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import JWTError
+
+from app.core.config import settings
+from app.core.jwt_backend import load_key_set
+from app.core.middleware.rate_limiting_middleware import get_rate_limit_identity
+
+
+def write_private_key(path):
+    """Write a new RSA private key as PEM, returning its path."""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    return str(path)
+
+
+def key_set(**config):
+    """Key set of the settings with overrides."""
+    return load_key_set(settings.model_copy(update=config))
+
+
+def test_previous_key_keeps_configured_kid_and_algorithm(tmp_path):
+    old_file = write_private_key(tmp_path / "old.pem")
+    new_file = write_private_key(tmp_path / "new.pem")
+    old_keys = key_set(
+        ALGORITHM="RS384", JWT_PRIVATE_KEY_FILE=old_file, JWT_KEY_ID="2024-01"
+    )
+    token = old_keys.encode({"sub": "user"})
+
+    rotated = key_set(
+        ALGORITHM="RS256",
+        JWT_PRIVATE_KEY_FILE=new_file,
+        JWT_KEY_ID="2024-02",
+        JWT_PREVIOUS_PUBLIC_KEY_FILES=[
+            {"file": old_file, "kid": "2024-01", "alg": "RS384"}
+        ],
+    )
+    assert rotated.decode(token)["sub"] == "user"
+    assert {key["kid"]: key["alg"] for key in rotated.jwks()["keys"]} == {
+        "2024-01": "RS384",
+        "2024-02": "RS256",
+    }
+
+    # A bare path falls back to the thumbprint kid, which the token does not use
+    thumbprinted = key_set(
+        ALGORITHM="RS256",
+        JWT_PRIVATE_KEY_FILE=new_file,
+        JWT_PREVIOUS_PUBLIC_KEY_FILES=[old_file],
+    )
+    with pytest.raises(JWTError):
+        thumbprinted.decode(token)
+
+
+def test_previous_key_rejects_unsupported_algorithm(tmp_path):
+    old_file = write_private_key(tmp_path / "old.pem")
+    with pytest.raises(ValueError):
+        key_set(JWT_PREVIOUS_PUBLIC_KEY_FILES=[{"file": old_file, "alg": "HS256"}])
+
+
+@pytest.mark.parametrize("kid", [[], ["2024-01"], {"kid": "2024-01"}])
+def test_non_string_kid_is_rejected(kid):
+    keys = key_set()
+    token = keys.backend.encode(
+        {"sub": "user"}, keys.active.signing_key, keys.active.algorithm, {"kid": kid}
+    )
+    with pytest.raises(JWTError):
+        keys.decode(token)
+
+
+async def test_non_string_kid_is_unauthorized(client):
+    keys = key_set()
+    token = keys.backend.encode(
+        {"sub": "user"}, keys.active.signing_key, keys.active.algorithm, {"kid": []}
+    )
+    response = await client.get(
+        f"{settings.API_PREFIX}/v1/users/me",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 401
+
+
+def test_non_string_kid_counts_against_client_ip():
+    keys = key_set()
+    token = keys.backend.encode(
+        {"sub": "user"}, keys.active.signing_key, keys.active.algorithm, {"kid": [1]}
+    )
+    scope = {
+        "type": "http",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+        "client": ("10.0.0.1", 1234),
+    }
+    assert get_rate_limit_identity(scope) == "ip:10.0.0.1"
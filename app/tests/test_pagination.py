@@ -0,0 +1,48 @@
+"""
+Keyset pagination cursors.
+"""
+from datetime import datetime
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.core.config import settings
+from app.core.exceptions import BadRequestError
+from app.utils.pagination import decode_cursor, encode_cursor
+
+USERS_URL = f"{settings.API_PREFIX}/v1/users/"
+TYPES = [datetime, UUID]
+
+
+def test_cursor_round_trip():
+    values = [datetime(2024, 1, 2, 3, 4, 5), str(uuid4())]
+    assert decode_cursor(encode_cursor(values), TYPES) == values
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        ["2024-01-02T03:04:05", 1],
+        ["2024-01-02T03:04:05", "not-a-uuid"],
+        ["2024-01-02T03:04:05", ["a"]],
+        [20240102, str(uuid4())],
+    ],
+)
+def test_cursor_with_wrong_value_types_is_rejected(values):
+    with pytest.raises(BadRequestError):
+        decode_cursor(encode_cursor(values), TYPES)
+
+
+def test_cursor_checks_scalar_types():
+    assert decode_cursor(encode_cursor([1, 2]), [int, float]) == [1, 2.0]
+    for values in ([True, 1.0], ["1", 1.0], [1, "1"]):
+        with pytest.raises(BadRequestError):
+            decode_cursor(encode_cursor(values), [int, float])
+
+
+async def test_forged_cursor_is_a_bad_request(client, superuser_headers):
+    cursor = encode_cursor(["2024-01-02T03:04:05", {"id": 1}])
+    response = await client.get(
+        USERS_URL, params={"cursor": cursor}, headers=superuser_headers
+    )
+    assert response.status_code == 400, response.text
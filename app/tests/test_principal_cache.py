@@ -0,0 +1,106 @@
+"""
+Principal cache invalidation on role and permission writes.
+"""
+from sqlalchemy import select
+
+from app.crud.association import REMOVE
+from app.crud.permission import permission_crud
+from app.crud.role import role_crud
+from app.crud.user import user_crud
+from app.models.permission import Permission
+from app.models.role import Role
+from app.models.user import User
+from app.schemas.principal import Principal
+from app.schemas.user import UserCreate
+from app.services.principal import principal_cache
+
+
+async def create_role_holder(db) -> User:
+    """Create a user holding the 'user' role."""
+    user = await user_crud.create(
+        db, obj_in=UserCreate(email="holder@example.com", password="user-password")
+    )
+    role_id = await db.scalar(select(Role.id).where(Role.code == "user"))
+    await user_crud.sync_roles(db, user_ids=[user.id], role_ids=[role_id])
+    await db.commit()
+    return user
+
+
+def cache_stale_principal(user: User) -> None:
+    """Cache a principal as a concurrent request would before the commit."""
+    principal_cache.set(
+        str(user.id),
+        Principal(
+            id=str(user.id),
+            is_active=True,
+            is_superuser=False,
+            roles=frozenset({"user"}),
+            permissions=frozenset({"user:read"}),
+        ),
+    )
+
+
+async def test_revoked_role_permission_is_dropped_after_commit(session_factory):
+    async with session_factory() as db:
+        user = await create_role_holder(db)
+        role_id = await db.scalar(select(Role.id).where(Role.code == "user"))
+        permission_id = await db.scalar(
+            select(Permission.id).where(Permission.code == "user:read")
+        )
+
+        await role_crud.sync_permissions(
+            db, role_ids=[role_id], permission_ids=[permission_id], mode=REMOVE
+        )
+        cache_stale_principal(user)
+        await db.commit()
+
+    assert principal_cache.get(str(user.id)) is None
+
+
+async def test_removed_permission_is_dropped_after_commit(session_factory):
+    async with session_factory() as db:
+        user = await create_role_holder(db)
+        permission_id = await db.scalar(
+            select(Permission.id).where(Permission.code == "user:read")
+        )
+
+        await permission_crud.remove(db, id=permission_id)
+        cache_stale_principal(user)
+        await db.commit()
+
+    assert principal_cache.get(str(user.id)) is None
+
+
+async def test_renamed_permission_code_drops_principals(session_factory):
+    async with session_factory() as db:
+        user = await create_role_holder(db)
+        version = await db.scalar(
+            select(User.permissions_version).where(User.id == user.id)
+        )
+        permission = await permission_crud.get_by_code(db, code="user:read")
+        cache_stale_principal(user)
+
+        await permission_crud.update(
+            db, db_obj=permission, obj_in={"code": "user:view"}
+        )
+        await db.commit()
+
+    assert principal_cache.get(str(user.id)) is None
+    async with session_factory() as db:
+        bumped = await db.scalar(
+            select(User.permissions_version).where(User.id == user.id)
+        )
+    assert bumped == version + 1
+
+
+async def test_renamed_role_code_drops_principals(session_factory):
+    async with session_factory() as db:
+        user = await create_role_holder(db)
+        role_ids = await role_crud.update_many(
+            db, filters=[Role.code == "user"], obj_in={"code": "member"}
+        )
+        cache_stale_principal(user)
+        await db.commit()
+
+    assert len(role_ids) == 1
+    assert principal_cache.get(str(user.id)) is None
@@ -0,0 +1,86 @@
+"""
+Statement counts of the user endpoints.
+
+Loading profiles must load each relationship with a fixed number of
+statements, however many users and roles there are.
+"""
+import uuid
+from typing import Dict, List
+
+import httpx
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.crud.user import user_crud
+from app.models.role import Role
+from app.schemas.user import UserCreate
+
+USERS_URL = f"{settings.API_PREFIX}/v1/users"
+
+
+async def create_users(session_factory: sessionmaker, count: int) -> List[str]:
+    """Create users holding every role, returning their IDs."""
+    async with session_factory() as db:
+        role_ids = list((await db.execute(select(Role.id))).scalars())
+        user_ids = []
+        for i in range(count):
+            user = await user_crud.create(
+                db,
+                obj_in=UserCreate(
+                    email=f"user-{uuid.uuid4().hex}@example.com",
+                    password="user-password",
+                ),
+            )
+            await user_crud.sync_roles(db, user_ids=[user.id], role_ids=role_ids)
+            user_ids.append(user.id)
+        await db.commit()
+    return user_ids
+
+
+async def count_statements(
+    client: httpx.AsyncClient,
+    statements: List[str],
+    url: str,
+    headers: Dict[str, str],
+) -> int:
+    """Number of statements executed by a GET request."""
+    statements.clear()
+    response = await client.get(url, headers=headers)
+    assert response.status_code == 200, response.text
+    return len(statements)
+
+
+async def test_list_users_statements_do_not_grow_with_users(
+    client, session_factory, superuser_headers, statements
+):
+    await create_users(session_factory, 2)
+    # Warm the principal cache so only the endpoint's statements are counted
+    await count_statements(client, statements, USERS_URL + "/", superuser_headers)
+    few = await count_statements(client, statements, USERS_URL + "/", superuser_headers)
+
+    await create_users(session_factory, 10)
+    many = await count_statements(
+        client, statements, USERS_URL + "/", superuser_headers
+    )
+
+    assert few == many == 1
+
+
+async def test_get_user_loads_roles_in_fixed_statements(
+    client, session_factory, superuser_headers, statements
+):
+    user_id = (await create_users(session_factory, 1))[0]
+    url = f"{USERS_URL}/{user_id}"
+    await count_statements(client, statements, url, superuser_headers)
+
+    # The user, then its roles in one SELECT ... IN
+    assert await count_statements(client, statements, url, superuser_headers) == 2
+
+
+async def test_get_me_statements(client, superuser_headers, statements):
+    url = f"{USERS_URL}/me"
+    await count_statements(client, statements, url, superuser_headers)
+
+    # The current user, then its roles in one SELECT ... IN
+    assert await count_statements(client, statements, url, superuser_headers) == 2
@@ -0,0 +1,33 @@
+"""
+User search through the users list endpoint.
+"""
+from app.core.config import settings
+from app.crud.user import user_crud
+from app.schemas.user import UserCreate
+
+USERS_URL = f"{settings.API_PREFIX}/v1/users/"
+
+
+async def search_emails(client, headers, term):
+    """Emails of the users listed for a search term."""
+    response = await client.get(USERS_URL, params={"search": term}, headers=headers)
+    assert response.status_code == 200, response.text
+    return sorted(user["email"] for user in response.json()["items"])
+
+
+async def test_search_by_email_prefix_and_domain(
+    client, session_factory, superuser_headers
+):
+    async with session_factory() as db:
+        for email in ("ana@acme.io", "bruno@acme.io", "carla@other.io"):
+            await user_crud.create(
+                db, obj_in=UserCreate(email=email, password="user-password")
+            )
+        await db.commit()
+
+    assert await search_emails(client, superuser_headers, "ana@") == ["ana@acme.io"]
+    assert await search_emails(client, superuser_headers, "@acme.io") == [
+        "ana@acme.io",
+        "bruno@acme.io",
+    ]
+    assert await search_emails(client, superuser_headers, "other") == ["carla@other.io"]
@@ -0,0 +1,53 @@
+"""
+Per-worker fallbacks of shared state.
+"""
+import time
+
+import pytest
+
+from app.core.config import settings
+from app.services.refresh_tokens import (
+    MemoryRefreshTokenStore,
+    create_refresh_token_store,
+)
+from app.services.token_denylist import TokenDenylist, create_token_denylist
+
+
+def test_refresh_token_store_falls_back_to_memory_with_one_worker(monkeypatch):
+    monkeypatch.setattr(settings, "WEB_CONCURRENCY", 1)
+    assert isinstance(create_refresh_token_store(), MemoryRefreshTokenStore)
+
+
+def test_refresh_token_store_requires_redis_with_several_workers(monkeypatch):
+    monkeypatch.setattr(settings, "WEB_CONCURRENCY", 4)
+    with pytest.raises(RuntimeError, match="REDIS_HOST"):
+        create_refresh_token_store()
+
+
+def test_token_denylist_requires_redis_with_several_workers(monkeypatch):
+    monkeypatch.setattr(settings, "WEB_CONCURRENCY", 4)
+    with pytest.raises(RuntimeError, match="REDIS_HOST"):
+        create_token_denylist()
+
+
+async def test_in_memory_token_denylist_keeps_revocations_over_capacity(caplog):
+    denylist = TokenDenylist(None, capacity=3)
+    expires_at = time.time() + 60
+    jtis = [f"jti-{i}" for i in range(4)]
+    for jti in jtis:
+        await denylist.revoke(jti, expires_at)
+
+    assert [await denylist.is_revoked(jti) for jti in jtis] == [True] * 4
+    assert "TOKEN_DENYLIST_CAPACITY" in caplog.text
+
+
+async def test_in_memory_token_denylist_forgets_expired_revocations(monkeypatch):
+    denylist = TokenDenylist(None, capacity=3)
+    now = time.time()
+    await denylist.revoke("short", now + 10)
+    await denylist.revoke("long", now + 100)
+
+    monkeypatch.setattr(time, "time", lambda: now + 50)
+    assert await denylist.rebuild() == 1
+    assert not await denylist.is_revoked("short")
+    assert await denylist.is_revoked("long")
@@ -0,0 +1,71 @@
+"""
+Bulk user import.
+"""
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.crud.user import user_crud
+from app.models.user import User
+from app.services import user_import
+
+IMPORT_URL = f"{settings.API_PREFIX}/v1/users/import"
+
+
+async def test_imported_users_are_committed(client, session_factory, superuser_headers):
+    upload = (
+        "email,full_name,password,roles\n"
+        "ana@example.com,Ana,ana-password,user\n"
+        "bruno@example.com,Bruno,bruno-password,user;admin\n"
+        "not-an-email,Carla,carla-password,user\n"
+    )
+    response = await client.post(
+        IMPORT_URL,
+        content=upload,
+        headers={**superuser_headers, "Content-Type": "text/csv"},
+    )
+    assert response.status_code == 200, response.text
+    result = response.json()
+    assert (result["total"], result["created"]) == (3, 2)
+    assert [error["row"] for error in result["errors"]] == [3]
+
+    async with session_factory() as db:
+        emails = set(
+            await db.scalars(select(User.email).where(User.email.like("%@example.com")))
+        )
+        bruno = await user_crud.get_by_email(
+            db, email="bruno@example.com", profile="detail"
+        )
+    assert {"ana@example.com", "bruno@example.com"} <= emails
+    assert sorted(role.code for role in bruno.roles) == ["admin", "user"]
+
+
+async def test_upload_that_is_not_utf8_is_rejected(client, superuser_headers):
+    response = await client.post(
+        IMPORT_URL,
+        content=b"email,password\n\xff\xfe,x\n",
+        headers={**superuser_headers, "Content-Type": "text/csv"},
+    )
+    assert response.status_code == 400, response.text
+    assert "UTF-8" in response.text
+
+
+async def test_stray_quote_is_reported_on_its_row(
+    client, session_factory, superuser_headers, monkeypatch
+):
+    monkeypatch.setattr(user_import, "MAX_CSV_RECORD_LINES", 3)
+    upload = (
+        "email,password\n"
+        + 'stray"@example.com,x\n'
+        + "".join(f"user-{i}@example.com,user-password\n" for i in range(5))
+    )
+    response = await client.post(
+        IMPORT_URL,
+        content=upload,
+        headers={**superuser_headers, "Content-Type": "text/csv"},
+    )
+    assert response.status_code == 200, response.text
+    result = response.json()
+    assert (result["total"], result["created"]) == (6, 5)
+    assert [(error["row"], error["detail"]) for error in result["errors"]] == [
+        (1, "Unterminated quoted value")
+    ]
@@ -0,0 +1,35 @@
+"""
+Bulk role assignment.
+"""
+from sqlalchemy import func, select
+
+from app.core.config import settings
+from app.crud.user import user_crud
+from app.models.role import Role
+from app.models.user import user_role
+from app.schemas.user import UserCreate
+
+
+async def test_bulk_role_update_is_committed(
+    client, session_factory, superuser_headers
+):
+    async with session_factory() as db:
+        user = await user_crud.create(
+            db, obj_in=UserCreate(email="roles@example.com", password="user-password")
+        )
+        role_id = await db.scalar(select(Role.id).where(Role.code == "user"))
+        await db.commit()
+
+    response = await client.post(
+        f"{settings.API_PREFIX}/v1/users/roles",
+        json={"user_ids": [user.id], "role_ids": [role_id]},
+        headers=superuser_headers,
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() == {"added": 1, "removed": 0}
+
+    async with session_factory() as db:
+        count = await db.scalar(
+            select(func.count()).where(user_role.c.user_id == user.id)
+        )
+    assert count == 1
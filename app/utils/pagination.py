@@ -0,0 +1,106 @@
+"""
+Pagination Utilities Module
+
+This module encodes and decodes the opaque cursors used by keyset pagination
+and defines the result of a paginated query.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, List, NamedTuple, Optional, Sequence
+from uuid import UUID
+
+from app.core.exceptions import BadRequestError
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode the sort key of the last row of a page into an opaque cursor.
+
+    Args:
+        values: Sort key values (datetimes are stored as ISO 8601 strings)
+
+    Returns:
+        str: URL-safe cursor
+    """
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_value(value: Any, type_: type) -> Any:
+    """
+    Check a decoded sort key value against its Python type.
+
+    Args:
+        value: Value decoded from JSON
+        type_: Python type of the sort key column, UUID for UUID strings
+
+    Returns:
+        Any: Value, with datetimes restored
+
+    Raises:
+        ValueError: If the value does not have the expected type
+    """
+    if type_ in (datetime, UUID):
+        if not isinstance(value, str):
+            raise ValueError("Expected a string")
+        if type_ is datetime:
+            return datetime.fromisoformat(value)
+        UUID(value)
+        return value
+    # bool is an int subclass and int is accepted for floats, both in JSON terms
+    if isinstance(value, bool) != (type_ is bool):
+        raise ValueError(f"Expected {type_.__name__}")
+    if type_ is float and isinstance(value, int):
+        return float(value)
+    if not isinstance(value, type_):
+        raise ValueError(f"Expected {type_.__name__}")
+    return value
+
+
+def decode_cursor(cursor: str, types: Sequence[type]) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Every value is checked against its type, so a forged cursor cannot put
+    a value of another type in the keyset comparison.
+
+    Args:
+        cursor: Opaque cursor
+        types: Python type of each sort key value (UUID for UUID strings)
+
+    Returns:
+        List[Any]: Sort key values
+
+    Raises:
+        BadRequestError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("Cursor does not match the sort key")
+        return [_decode_value(v, t) for v, t in zip(values, types)]
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise BadRequestError("Invalid pagination cursor")
+
+
+class Page(NamedTuple):
+    """
+    One page of records fetched by CRUDBase.get_page.
+
+    Attributes:
+        items: Records of the page
+        total: Total number of matching records, or None if not requested
+        has_next: Whether more records follow this page
+        next_cursor: Cursor for the next page, or None on the last page
+        total_estimated: Whether total is a planner estimate
+    """
+
+    items: List[Any]
+    total: Optional[int]
+    has_next: bool
+    next_cursor: Optional[str]
+    total_estimated: bool = False
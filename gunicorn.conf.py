@@ -0,0 +1,30 @@
+# gunicorn.conf.py
+
+# Configuração do gunicorn com workers uvicorn
+# poetry run gunicorn app.main:app -c gunicorn.conf.py
+
+import os
+import shutil
+
+bind = "0.0.0.0:8000"
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.getenv("WEB_CONCURRENCY", "4"))
+# Os workers herdam o número de processos (estado em memória exige um só)
+os.environ["WEB_CONCURRENCY"] = str(workers)
+accesslog = None  # substituído pelo AccessLogMiddleware
+
+
+def on_starting(server):
+    # Métricas de execuções anteriores não podem ser somadas às atuais
+    directory = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if directory:
+        shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory, exist_ok=True)
+
+
+def child_exit(server, worker):
+    # Remove os gauges "live" do worker encerrado
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
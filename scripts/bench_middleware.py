@@ -0,0 +1,110 @@
+# scripts/bench_middleware.py
+
+# Mede o overhead por requisição dos middlewares (BaseHTTPMiddleware x ASGI puro)
+# poetry run python scripts/bench_middleware.py [requisicoes]
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from app.core.middleware.exception_middleware import ExceptionMiddleware
+from app.core.middleware.process_time_middleware import ProcessTimeMiddleware
+from app.core.middleware.security_headers_middleware import SecurityHeadersMiddleware
+
+
+async def endpoint(request):
+    return JSONResponse({"status": "ok"})
+
+
+async def add_process_time_header(request, call_next):
+    # Middleware antigo de app/main.py (@app.middleware("http"))
+    start_time = time.time()
+    response = await call_next(request)
+    response.headers["X-Process-Time"] = str(time.time() - start_time)
+    return response
+
+
+def build_app(stack):
+    app = Starlette(routes=[Route("/", endpoint)])
+    for middleware, options in stack:
+        app.add_middleware(middleware, **options)
+    return app
+
+
+async def run(app, requests):
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/",
+        "raw_path": b"/",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+
+    async def send(message):
+        pass
+
+    def request_channel():
+        messages = [{"type": "http.request", "body": b"", "more_body": False}]
+
+        async def receive():
+            if messages:
+                return messages.pop()
+            # Como um servidor real: nada chega até o cliente desconectar
+            await asyncio.Event().wait()
+
+        return receive
+
+    # Cada requisição roda em sua própria task, como no uvicorn
+    for _ in range(200):
+        await asyncio.create_task(app(dict(scope), request_channel(), send))
+
+    samples = []
+    for _ in range(requests):
+        receive = request_channel()
+        start = time.perf_counter_ns()
+        await asyncio.create_task(app(dict(scope), receive, send))
+        samples.append(time.perf_counter_ns() - start)
+    return statistics.median(samples) / 1000, statistics.mean(samples) / 1000
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    stacks = {
+        "sem middleware": [],
+        "antes: @app.middleware('http')": [
+            (BaseHTTPMiddleware, {"dispatch": add_process_time_header})
+        ],
+        "depois: ProcessTimeMiddleware": [(ProcessTimeMiddleware, {})],
+        "depois: tempo + exceções + headers": [
+            (ExceptionMiddleware, {}),
+            (ProcessTimeMiddleware, {}),
+            (SecurityHeadersMiddleware, {}),
+        ],
+    }
+
+    baseline = None
+    print(f"{'stack':<38}{'mediana (us)':>14}{'média (us)':>12}{'overhead (us)':>15}")
+    for name, stack in stacks.items():
+        median, mean = asyncio.run(run(build_app(stack), requests))
+        baseline = median if baseline is None else baseline
+        print(f"{name:<38}{median:>14.1f}{mean:>12.1f}{median - baseline:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
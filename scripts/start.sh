@@ -7,8 +7,10 @@ alembic upgrade head
 # Start the application server
 if [ "$ENVIRONMENT" = "production" ]; then
     echo "Starting in production mode"
+    # Without Redis, more than one worker refuses to start
+    export WEB_CONCURRENCY="${WEB_CONCURRENCY:-4}"
     exec gunicorn app.main:app \
-        --workers 4 \
+        --workers "$WEB_CONCURRENCY" \
         --worker-class uvicorn.workers.UvicornWorker \
         --bind 0.0.0.0:8000
 else
@@ -16,5 +18,6 @@ else
     exec uvicorn app.main:app \
         --host 0.0.0.0 \
         --port 8000 \
+        --no-access-log \
         --reload
 fi